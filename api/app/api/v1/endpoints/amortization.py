@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.dependencies.auth import AuthContext, get_amortization_service, get_auth_context
+from app.schemas.amortization import AmortizationSchedulePage, AmortizationScheduleRequest
+from app.services.amortization_service import AmortizationService
+
+router = APIRouter()
+
+
+@router.post("/schedule", response_model=AmortizationSchedulePage)
+async def get_schedule(
+    request: AmortizationScheduleRequest,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=120, ge=1, le=500),
+    _context: AuthContext = Depends(get_auth_context),
+    amortization_service: AmortizationService = Depends(get_amortization_service),
+) -> AmortizationSchedulePage:
+    # Pure computation: only the requested page of installments is built.
+    return amortization_service.schedule_page(request=request, offset=offset, limit=limit)
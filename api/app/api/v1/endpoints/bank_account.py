@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from app.core.serialization import json_list_response
 
 from app.dependencies.auth import AuthContext, get_auth_context, get_bank_account_service
 from app.schemas.bank_account import (
@@ -16,11 +17,12 @@ router = APIRouter()
 async def list_bank_accounts(
     context: AuthContext = Depends(get_auth_context),
     bank_account_service: BankAccountService = Depends(get_bank_account_service),
-) -> list[BankAccountResponse]:
-    return await bank_account_service.list_accounts(
+) -> Response:
+    items = await bank_account_service.list_accounts(
         access_token=context.access_token,
         user_id=context.user_id,
     )
+    return json_list_response(BankAccountResponse, items)
 
 
 @router.post("", response_model=BankAccountResponse)
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies.auth import AuthContext, get_auth_context, get_bootstrap_service
+from app.schemas.bootstrap import BootstrapResponse
+from app.services.bootstrap_service import BootstrapService
+
+router = APIRouter()
+
+
+@router.get("", response_model=BootstrapResponse)
+async def get_bootstrap(
+    context: AuthContext = Depends(get_auth_context),
+    bootstrap_service: BootstrapService = Depends(get_bootstrap_service),
+) -> BootstrapResponse:
+    return await bootstrap_service.load(
+        access_token=context.access_token,
+        user_id=context.user_id,
+    )
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.months import parse_month
+from app.dependencies.auth import AuthContext, get_auth_context, get_budget_service
+from app.schemas.budget import (
+    BudgetAlertResponse,
+    BudgetCreateRequest,
+    BudgetResponse,
+    BudgetStatusResponse,
+    BudgetUpdateRequest,
+)
+from app.schemas.common import SuccessResponse
+from app.services.budget_service import BudgetService
+
+router = APIRouter()
+
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+@router.get("", response_model=list[BudgetStatusResponse])
+async def list_budgets(
+    month: str | None = Query(default=None, pattern=MONTH_PATTERN),
+    context: AuthContext = Depends(get_auth_context),
+    budget_service: BudgetService = Depends(get_budget_service),
+) -> list[BudgetStatusResponse]:
+    return await budget_service.list_budget_status(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        month=parse_month(month),
+    )
+
+
+@router.post("", response_model=BudgetResponse)
+async def create_budget(
+    request: BudgetCreateRequest,
+    context: AuthContext = Depends(get_auth_context),
+    budget_service: BudgetService = Depends(get_budget_service),
+) -> BudgetResponse:
+    return await budget_service.create_budget(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        request=request,
+    )
+
+
+@router.get("/alerts", response_model=list[BudgetAlertResponse])
+async def list_budget_alerts(
+    month: str | None = Query(default=None, pattern=MONTH_PATTERN),
+    context: AuthContext = Depends(get_auth_context),
+    budget_service: BudgetService = Depends(get_budget_service),
+) -> list[BudgetAlertResponse]:
+    return await budget_service.list_alerts(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        month=parse_month(month),
+    )
+
+
+@router.patch("/{budget_id}", response_model=BudgetResponse)
+async def update_budget(
+    budget_id: str,
+    request: BudgetUpdateRequest,
+    context: AuthContext = Depends(get_auth_context),
+    budget_service: BudgetService = Depends(get_budget_service),
+) -> BudgetResponse:
+    return await budget_service.update_budget(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        budget_id=budget_id,
+        request=request,
+    )
+
+
+@router.delete("/{budget_id}", response_model=SuccessResponse)
+async def delete_budget(
+    budget_id: str,
+    context: AuthContext = Depends(get_auth_context),
+    budget_service: BudgetService = Depends(get_budget_service),
+) -> SuccessResponse:
+    await budget_service.delete_budget(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        budget_id=budget_id,
+    )
+    return SuccessResponse(success=True)
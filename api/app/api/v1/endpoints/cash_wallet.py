@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
+from app.core.serialization import json_list_response
 from app.dependencies.auth import (
     AuthContext,
     get_auth_context,
@@ -20,11 +21,12 @@ router = APIRouter()
 async def list_cash_wallets(
     context: AuthContext = Depends(get_auth_context),
     cash_wallet_service: CashWalletService = Depends(get_cash_wallet_service),
-) -> list[CashWalletResponse]:
-    return await cash_wallet_service.list_wallets(
+) -> Response:
+    items = await cash_wallet_service.list_wallets(
         access_token=context.access_token,
         user_id=context.user_id,
     )
+    return json_list_response(CashWalletResponse, items)
 
 
 @router.post("", response_model=CashWalletResponse)
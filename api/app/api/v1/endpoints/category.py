@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from app.core.serialization import json_list_response
 from app.dependencies.auth import AuthContext, get_auth_context, get_category_service
 from app.schemas.category import (
     CategoryCreateRequest,
@@ -14,11 +15,12 @@ router = APIRouter()
 async def list_categories(
     context: AuthContext = Depends(get_auth_context),
     category_service: CategoryService = Depends(get_category_service),
-) -> list[CategoryResponse]:
-    return await category_service.list_categories(
+) -> Response:
+    items = await category_service.list_categories(
         access_token=context.access_token,
         user_id=context.user_id,
     )
+    return json_list_response(CategoryResponse, items)
 
 @router.post("", response_model=CategoryResponse)
 async def create_category(
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from app.core.serialization import json_list_response
 from app.dependencies.auth import AuthContext, get_auth_context, get_credit_card_service
 from app.schemas.credit_card import (
     CreditCardCreateRequest,
@@ -14,11 +15,12 @@ router = APIRouter()
 async def list_credit_cards(
     context: AuthContext = Depends(get_auth_context),
     card_service: CreditCardService = Depends(get_credit_card_service),
-) -> list[CreditCardResponse]:
-    return await card_service.list_cards(
+) -> Response:
+    items = await card_service.list_cards(
         access_token=context.access_token,
         user_id=context.user_id,
     )
+    return json_list_response(CreditCardResponse, items)
 
 @router.post("", response_model=CreditCardResponse)
 async def create_credit_card(
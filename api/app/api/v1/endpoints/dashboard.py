@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.months import parse_month
+from app.dependencies.auth import AuthContext, get_auth_context, get_dashboard_service
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter()
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    month: str | None = Query(default=None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    context: AuthContext = Depends(get_auth_context),
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+) -> DashboardResponse:
+    return await dashboard_service.get_dashboard(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        month=parse_month(month),
+    )
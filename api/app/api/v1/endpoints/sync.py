@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.pagination import decode_watermark
+from app.dependencies.auth import AuthContext, get_auth_context, get_sync_service
+from app.schemas.sync import SyncResponse
+from app.services.sync_service import SyncService
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: str | None = Query(default=None, max_length=512),
+    limit: int = Query(500, ge=1, le=1000),
+    context: AuthContext = Depends(get_auth_context),
+    sync_service: SyncService = Depends(get_sync_service),
+) -> SyncResponse:
+    # Without `since` every row of the user is returned (a full resync);
+    # keep calling with the returned watermark while has_more is true.
+    return await sync_service.get_changes(
+        access_token=context.access_token,
+        since=decode_watermark(since) if since else None,
+        limit=limit,
+    )
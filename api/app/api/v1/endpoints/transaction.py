@@ -1,9 +1,17 @@
+import csv
+import io
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from app.core.config import Settings, get_settings
+from app.core.pagination import TransactionCursor, encode_cursor
+from app.core.serialization import json_list_response
 from app.dependencies.auth import AuthContext, get_auth_context, get_transaction_service
 from app.schemas.common import SuccessResponse
 from app.schemas.transaction import (
+    TransactionBatchCreateRequest,
+    TransactionBatchCreateResponse,
     TransactionCreateRequest,
     TransactionResponse,
     TransactionUpdateRequest,
@@ -12,6 +20,24 @@ from app.services.transaction_service import TransactionService
 
 router = APIRouter()
 
+EXPORT_COLUMNS = tuple(TransactionResponse.model_fields)
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _ndjson_chunk(page: list[TransactionResponse]) -> str:
+    return "".join(f"{transaction.model_dump_json()}\n" for transaction in page)
+
+
+def _csv_chunk(page: list[TransactionResponse], *, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    for transaction in page:
+        row = transaction.model_dump(mode="json")
+        writer.writerow(["" if row[column] is None else row[column] for column in EXPORT_COLUMNS])
+    return buffer.getvalue()
+
 @router.get("", response_model=list[TransactionResponse])
 async def list_transactions(
     limit: int = Query(50, ge=1, le=100),
@@ -26,10 +52,11 @@ async def list_transactions(
     credit_card_id: str | None = Query(default=None),
     occurred_from: datetime | None = Query(default=None),
     occurred_to: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None, max_length=512),
     context: AuthContext = Depends(get_auth_context),
     transaction_service: TransactionService = Depends(get_transaction_service),
-) -> list[TransactionResponse]:
-    return await transaction_service.list_transactions(
+) -> Response:
+    transactions = await transaction_service.list_transactions(
         access_token=context.access_token,
         user_id=context.user_id,
         limit=limit,
@@ -41,18 +68,112 @@ async def list_transactions(
         credit_card_id=credit_card_id,
         occurred_from=occurred_from,
         occurred_to=occurred_to,
+        cursor=cursor,
+    )
+    # A full page means there may be more rows; clients pass this back as
+    # `cursor` to fetch the next page with a constant-cost keyset query.
+    headers = {}
+    if len(transactions) == limit:
+        last = transactions[-1]
+        headers["X-Next-Cursor"] = encode_cursor(
+            TransactionCursor(occurred_at=last.occurred_at, id=last.id),
+        )
+    return json_list_response(TransactionResponse, transactions, headers=headers)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    kind: str | None = Query(
+        default=None,
+        pattern="^(income|expense|transfer|credit_charge|credit_payment)$",
+    ),
+    category_id: str | None = Query(default=None),
+    cash_wallet_id: str | None = Query(default=None),
+    bank_account_id: str | None = Query(default=None),
+    credit_card_id: str | None = Query(default=None),
+    occurred_from: datetime | None = Query(default=None),
+    occurred_to: datetime | None = Query(default=None),
+    context: AuthContext = Depends(get_auth_context),
+    transaction_service: TransactionService = Depends(get_transaction_service),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    pages = transaction_service.iter_transaction_pages(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        page_size=settings.export_page_size,
+        kind=kind,
+        category_id=category_id,
+        cash_wallet_id=cash_wallet_id,
+        bank_account_id=bank_account_id,
+        credit_card_id=credit_card_id,
+        occurred_from=occurred_from,
+        occurred_to=occurred_to,
     )
+    # Fetch the first page before streaming starts so upstream errors still
+    # map to a proper status code instead of a truncated 200 response.
+    first_page = await anext(pages, [])
+    encode = _csv_chunk if export_format == "csv" else _ndjson_chunk
+
+    async def body():
+        if export_format == "csv":
+            yield _csv_chunk(first_page, header=True)
+        else:
+            yield _ndjson_chunk(first_page)
+        async for page in pages:
+            yield encode(page)
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{export_format}"',
+        },
+    )
+
 
 @router.post("", response_model=TransactionResponse)
 async def create_transaction(
     request: TransactionCreateRequest,
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+    ),
     context: AuthContext = Depends(get_auth_context),
     transaction_service: TransactionService = Depends(get_transaction_service),
 ) -> TransactionResponse:
+    # Retries with the same Idempotency-Key get the first response back
+    # instead of a second insert (and a second balance adjustment).
     return await transaction_service.create_transaction(
         access_token=context.access_token,
         user_id=context.user_id,
         request=request,
+        idempotency_key=idempotency_key,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=TransactionBatchCreateResponse,
+    # Rendered in the OpenAPI docs for client authors.
+    description=(
+        "Creates up to 200 transactions with a single array insert. When a row is "
+        "rejected and all_or_nothing is false, the items are replayed one by one to "
+        "report which failed: one bad row costs 1 array insert plus up to 200 single "
+        "inserts. If Supabase fails during the replay, the items already created are "
+        "returned and the rest are marked failed with UPSTREAM_UNAVAILABLE."
+    ),
+)
+async def create_transactions_batch(
+    request: TransactionBatchCreateRequest,
+    context: AuthContext = Depends(get_auth_context),
+    transaction_service: TransactionService = Depends(get_transaction_service),
+) -> TransactionBatchCreateResponse:
+    return await transaction_service.create_transactions(
+        access_token=context.access_token,
+        user_id=context.user_id,
+        request=request,
     )
 
 
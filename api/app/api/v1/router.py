@@ -1,11 +1,16 @@
 from fastapi import APIRouter
 
+from app.api.v1.endpoints.amortization import router as amortization_router
 from app.api.v1.endpoints.auth import router as auth_router
 from app.api.v1.endpoints.bank_account import router as bank_account_router
+from app.api.v1.endpoints.bootstrap import router as bootstrap_router
+from app.api.v1.endpoints.budget import router as budget_router
 from app.api.v1.endpoints.cash_wallet import router as cash_wallet_router
 from app.api.v1.endpoints.profile import router as profile_router
 from app.api.v1.endpoints.credit_card import router as credit_card_router
+from app.api.v1.endpoints.dashboard import router as dashboard_router
 from app.api.v1.endpoints.category import router as category_router
+from app.api.v1.endpoints.sync import router as sync_router
 from app.api.v1.endpoints.transaction import router as transaction_router
 
 api_v1_router = APIRouter()
@@ -36,3 +41,28 @@ api_v1_router.include_router(
     prefix="/transactions",
     tags=["transactions"],
 )
+api_v1_router.include_router(
+    bootstrap_router,
+    prefix="/bootstrap",
+    tags=["bootstrap"],
+)
+api_v1_router.include_router(
+    dashboard_router,
+    prefix="/dashboard",
+    tags=["dashboard"],
+)
+api_v1_router.include_router(
+    budget_router,
+    prefix="/budgets",
+    tags=["budgets"],
+)
+api_v1_router.include_router(
+    amortization_router,
+    prefix="/amortization",
+    tags=["amortization"],
+)
+api_v1_router.include_router(
+    sync_router,
+    prefix="/sync",
+    tags=["sync"],
+)
@@ -0,0 +1,6 @@
+from app.clients.postgres import PostgresRepository
+from app.clients.supabase_rest import SupabaseRestClient
+
+# What services receive as `rest_client`: PostgREST over HTTP, or the direct
+# Postgres repository (same method set) when DATA_BACKEND=postgres.
+DataClient = SupabaseRestClient | PostgresRepository
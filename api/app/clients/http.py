@@ -0,0 +1,21 @@
+import httpx
+
+from app.core.config import Settings
+
+
+def build_http_client(
+    settings: Settings,
+    *,
+    max_connections: int,
+    max_keepalive_connections: int,
+) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.request_timeout_seconds),
+        limits=limits,
+        http2=settings.http2_enabled,
+    )
@@ -0,0 +1,863 @@
+import json
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import psycopg
+from jose import JWTError, jwt
+from psycopg import sql
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
+
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.core.pagination import SyncWatermark, TransactionCursor
+
+PROFILE_COLUMNS = "id, base_currency, ai_enabled, created_at, updated_at"
+CASH_WALLET_COLUMNS = "id, name, balance, currency, created_at, updated_at"
+BANK_ACCOUNT_COLUMNS = "id, name, bank_name, balance, currency, created_at, updated_at"
+CREDIT_CARD_COLUMNS = (
+    "id, name, issuer, last_four, card_provider, tier, credit_limit, current_debt,"
+    " statement_day, due_day, currency, created_at, updated_at"
+)
+CATEGORY_COLUMNS = "id, name, kind, color, icon, is_system, created_at, updated_at"
+TRANSACTION_COLUMNS = (
+    "id, kind, amount, currency, description, occurred_at, category_id,"
+    " cash_wallet_id, bank_account_id, credit_card_id, target_cash_wallet_id,"
+    " target_bank_account_id, created_at, updated_at"
+)
+BUDGET_COLUMNS = "id, category_id, amount, currency, created_at, updated_at"
+BUDGET_ALERT_COLUMNS = "id, budget_id, month, threshold, spent, amount, created_at"
+
+# Same statuses PostgREST answers with, so services and clients see the same
+# errors whichever backend is configured.
+_SQLSTATE_STATUS = {
+    "23505": 409,
+    "23503": 409,
+    "42501": 403,
+    "42P01": 404,
+    "42883": 404,
+    "P0001": 400,
+}
+_ALLOWED_ROLES = {"authenticated", "anon"}
+
+
+def build_postgres_pool(settings: Settings) -> AsyncConnectionPool:
+    if not settings.supabase_db_url:
+        raise RuntimeError("SUPABASE_DB_URL is required when DATA_BACKEND=postgres.")
+    # Transaction-mode poolers (Supavisor on :6543, pgbouncer) cannot keep
+    # server-side prepared statements; disable them there.
+    prepare_threshold = settings.db_prepare_threshold if settings.db_prepare_statements else None
+    return AsyncConnectionPool(
+        conninfo=settings.supabase_db_url,
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+        timeout=settings.request_timeout_seconds,
+        kwargs={"autocommit": True, "prepare_threshold": prepare_threshold},
+        open=False,
+    )
+
+
+class PostgresRepository:
+    # Drop-in replacement for SupabaseRestClient that skips the PostgREST hop.
+    # Every call runs in its own transaction as the token's role with
+    # request.jwt.claims set, exactly like PostgREST, so RLS policies and
+    # auth.uid() behave the same.
+    def __init__(self, settings: Settings, *, pool: AsyncConnectionPool) -> None:
+        self._settings = settings
+        self._pool = pool
+
+    async def fetch_profile(self, *, access_token: str, user_id: str) -> dict[str, Any]:
+        data = await self._fetch(
+            access_token,
+            f"select {PROFILE_COLUMNS} from public.profiles where id = %s and deleted_at is null",
+            (user_id,),
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="PROFILE_NOT_FOUND",
+                message="Profile not found.",
+            )
+        return data[0]
+
+    async def update_profile(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "profiles",
+            payload,
+            {"id": user_id},
+            PROFILE_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="PROFILE_NOT_FOUND",
+                message="Profile not found.",
+            )
+        return data[0]
+
+    async def list_cash_wallets(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {CASH_WALLET_COLUMNS} from public.cash_wallets"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def list_cash_wallets_json(self, *, access_token: str, user_id: str) -> bytes:
+        return await self._fetch_json(
+            access_token,
+            f"select {CASH_WALLET_COLUMNS} from public.cash_wallets"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def create_cash_wallet(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "cash_wallets", [payload], CASH_WALLET_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="CASH_WALLET_CREATE_FAILED",
+                message="Cash wallet could not be created.",
+            )
+        return data[0]
+
+    async def update_cash_wallet(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        wallet_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "cash_wallets",
+            payload,
+            {"id": wallet_id, "user_id": user_id},
+            CASH_WALLET_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="CASH_WALLET_NOT_FOUND",
+                message="Cash wallet not found.",
+            )
+        return data[0]
+
+    async def list_bank_accounts(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {BANK_ACCOUNT_COLUMNS} from public.bank_accounts"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def list_bank_accounts_json(self, *, access_token: str, user_id: str) -> bytes:
+        return await self._fetch_json(
+            access_token,
+            f"select {BANK_ACCOUNT_COLUMNS} from public.bank_accounts"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def create_bank_account(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "bank_accounts", [payload], BANK_ACCOUNT_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="BANK_ACCOUNT_CREATE_FAILED",
+                message="Bank account could not be created.",
+            )
+        return data[0]
+
+    async def update_bank_account(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        account_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "bank_accounts",
+            payload,
+            {"id": account_id, "user_id": user_id},
+            BANK_ACCOUNT_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="BANK_ACCOUNT_NOT_FOUND",
+                message="Bank account not found.",
+            )
+        return data[0]
+
+    async def list_credit_cards(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {CREDIT_CARD_COLUMNS} from public.credit_cards"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def list_credit_cards_json(self, *, access_token: str, user_id: str) -> bytes:
+        return await self._fetch_json(
+            access_token,
+            f"select {CREDIT_CARD_COLUMNS} from public.credit_cards"
+            " where user_id = %s and deleted_at is null order by created_at desc",
+            (user_id,),
+        )
+
+    async def create_credit_card(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "credit_cards", [payload], CREDIT_CARD_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="CREDIT_CARD_CREATE_FAILED",
+                message="Credit card could not be created.",
+            )
+        return data[0]
+
+    async def update_credit_card(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        card_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "credit_cards",
+            payload,
+            {"id": card_id, "user_id": user_id},
+            CREDIT_CARD_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="CREDIT_CARD_NOT_FOUND",
+                message="Credit card not found.",
+            )
+        return data[0]
+
+    async def list_categories(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {CATEGORY_COLUMNS} from public.categories"
+            " where user_id = %s and deleted_at is null order by name asc",
+            (user_id,),
+        )
+
+    async def list_categories_json(self, *, access_token: str, user_id: str) -> bytes:
+        return await self._fetch_json(
+            access_token,
+            f"select {CATEGORY_COLUMNS} from public.categories"
+            " where user_id = %s and deleted_at is null order by name asc",
+            (user_id,),
+        )
+
+    async def create_category(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "categories", [payload], CATEGORY_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="CATEGORY_CREATE_FAILED",
+                message="Category could not be created.",
+            )
+        return data[0]
+
+    async def update_category(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        category_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "categories",
+            payload,
+            {"id": category_id, "user_id": user_id},
+            CATEGORY_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="CATEGORY_NOT_FOUND",
+                message="Category not found.",
+            )
+        return data[0]
+
+    @staticmethod
+    def _transactions_query(
+        *,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
+    ) -> tuple[str, list[Any]]:
+        conditions = ["user_id = %s", "deleted_at is null"]
+        params: list[Any] = [user_id]
+        for column, value in (
+            ("kind", kind),
+            ("category_id", category_id),
+            ("cash_wallet_id", cash_wallet_id),
+            ("bank_account_id", bank_account_id),
+            ("credit_card_id", credit_card_id),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = %s")
+                params.append(value)
+        if occurred_from is not None:
+            conditions.append("occurred_at >= %s")
+            params.append(occurred_from)
+        if occurred_to is not None:
+            conditions.append("occurred_at <= %s")
+            params.append(occurred_to)
+        if after is not None:
+            # Row comparison matches idx_transactions_user_id_occurred_at_id.
+            conditions.append("(occurred_at, id) < (%s, %s::uuid)")
+            params.extend([after.occurred_at, after.id])
+
+        query = (
+            f"select {TRANSACTION_COLUMNS} from public.transactions"
+            f" where {' and '.join(conditions)}"
+            " order by occurred_at desc, id desc limit %s"
+        )
+        params.append(limit)
+        if after is None:
+            query += " offset %s"
+            params.append(offset)
+        return query, params
+
+    async def list_transactions(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        query, params = self._transactions_query(
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            kind=kind,
+            category_id=category_id,
+            cash_wallet_id=cash_wallet_id,
+            bank_account_id=bank_account_id,
+            credit_card_id=credit_card_id,
+            occurred_from=occurred_from,
+            occurred_to=occurred_to,
+            after=after,
+        )
+        return await self._fetch(access_token, query, params)
+
+    async def list_transactions_json(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
+    ) -> bytes:
+        query, params = self._transactions_query(
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            kind=kind,
+            category_id=category_id,
+            cash_wallet_id=cash_wallet_id,
+            bank_account_id=bank_account_id,
+            credit_card_id=credit_card_id,
+            occurred_from=occurred_from,
+            occurred_to=occurred_to,
+            after=after,
+        )
+        return await self._fetch_json(access_token, query, params)
+
+    async def create_transaction(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "transactions", [payload], TRANSACTION_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="TRANSACTION_CREATE_FAILED",
+                message="Transaction could not be created.",
+            )
+        return data[0]
+
+    async def create_transactions(
+        self,
+        *,
+        access_token: str,
+        payloads: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        data = await self._insert(access_token, "transactions", payloads, TRANSACTION_COLUMNS)
+        if len(data) != len(payloads):
+            raise AppException(
+                status_code=500,
+                code="TRANSACTION_BATCH_CREATE_FAILED",
+                message="Transaction batch could not be created.",
+            )
+        return data
+
+    async def update_transaction(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        transaction_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "transactions",
+            payload,
+            {"id": transaction_id, "user_id": user_id},
+            TRANSACTION_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="TRANSACTION_NOT_FOUND",
+                message="Transaction not found.",
+            )
+        return data[0]
+
+    async def fetch_transaction_month_summary(
+        self,
+        *,
+        access_token: str,
+        occurred_from: datetime,
+        occurred_to: datetime,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            "select kind, category_id, currency, total, tx_count"
+            " from public.transaction_month_summary(%s, %s)",
+            (occurred_from, occurred_to),
+        )
+
+    async def fetch_sync_changes(
+        self,
+        *,
+        access_token: str,
+        since: SyncWatermark | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        if since is None:
+            return await self._fetch(
+                access_token,
+                "select server_time, changes from public.sync_changes(p_limit => %s)",
+                (limit,),
+            )
+        return await self._fetch(
+            access_token,
+            "select server_time, changes from public.sync_changes(%s, %s, %s, %s)",
+            (since.updated_at, since.entity, since.id, limit),
+        )
+
+    async def list_budgets(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {BUDGET_COLUMNS} from public.budgets"
+            " where user_id = %s and deleted_at is null order by created_at asc",
+            (user_id,),
+        )
+
+    async def create_budget(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._insert(access_token, "budgets", [payload], BUDGET_COLUMNS)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="BUDGET_CREATE_FAILED",
+                message="Budget could not be created.",
+            )
+        return data[0]
+
+    async def update_budget(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        budget_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        data = await self._update(
+            access_token,
+            "budgets",
+            payload,
+            {"id": budget_id, "user_id": user_id},
+            BUDGET_COLUMNS,
+        )
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="BUDGET_NOT_FOUND",
+                message="Budget not found.",
+            )
+        return data[0]
+
+    async def list_monthly_spend(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            "select category_id, currency, total from public.transaction_monthly_rollups"
+            " where user_id = %s and month = %s and kind in ('expense', 'credit_charge')",
+            (user_id, month),
+        )
+
+    async def list_budget_alerts(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date,
+    ) -> list[dict[str, Any]]:
+        return await self._fetch(
+            access_token,
+            f"select {BUDGET_ALERT_COLUMNS} from public.budget_alerts"
+            " where user_id = %s and month = %s order by created_at asc",
+            (user_id, month),
+        )
+
+    async def create_budget_alerts(
+        self,
+        *,
+        access_token: str,
+        payloads: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return await self._insert(
+            access_token,
+            "budget_alerts",
+            payloads,
+            BUDGET_ALERT_COLUMNS,
+            on_conflict=sql.SQL("on conflict (budget_id, month, threshold) do nothing"),
+        )
+
+    async def fetch_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+    ) -> dict[str, Any] | None:
+        data = await self._fetch(
+            access_token,
+            "select request_hash, response, created_at from public.idempotency_keys"
+            " where user_id = %s and scope = %s and key = %s",
+            (user_id, scope, key),
+        )
+        return data[0] if data else None
+
+    async def reserve_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> bool:
+        data = await self._insert(
+            access_token,
+            "idempotency_keys",
+            [payload],
+            "key",
+            on_conflict=sql.SQL("on conflict (user_id, scope, key) do nothing"),
+        )
+        return bool(data)
+
+    async def complete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        response: dict[str, Any],
+    ) -> None:
+        await self._fetch(
+            access_token,
+            "update public.idempotency_keys set response = %s"
+            " where user_id = %s and scope = %s and key = %s",
+            (Jsonb(response), user_id, scope, key),
+        )
+
+    async def delete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        pending_only: bool = False,
+        created_before: datetime | None = None,
+    ) -> None:
+        query = "delete from public.idempotency_keys where user_id = %s and scope = %s and key = %s"
+        params: list[Any] = [user_id, scope, key]
+        if pending_only:
+            query += " and response is null"
+        if created_before is not None:
+            query += " and created_at < %s"
+            params.append(created_before)
+        await self._fetch(access_token, query, params)
+
+    def stats(self) -> dict[str, int]:
+        stats = self._pool.get_stats()
+        return {
+            "pool_size": stats.get("pool_size", 0),
+            "pool_available": stats.get("pool_available", 0),
+            "requests_waiting": stats.get("requests_waiting", 0),
+        }
+
+    async def _insert(
+        self,
+        access_token: str,
+        table: str,
+        rows: list[dict[str, Any]],
+        returning: str,
+        *,
+        on_conflict: sql.Composable | None = None,
+    ) -> list[dict[str, Any]]:
+        # One multi-row INSERT; columns a row omits get DEFAULT, the same as
+        # PostgREST's `missing=default`.
+        columns = sorted({key for row in rows for key in row})
+        values = sql.SQL(", ").join(
+            sql.SQL("({})").format(
+                sql.SQL(", ").join(
+                    sql.Placeholder() if column in row else sql.DEFAULT for column in columns
+                )
+            )
+            for row in rows
+        )
+        params = [row[column] for row in rows for column in columns if column in row]
+        query = sql.SQL("insert into {} ({}) values {} {} returning {}").format(
+            sql.Identifier("public", table),
+            sql.SQL(", ").join(map(sql.Identifier, columns)),
+            values,
+            on_conflict or sql.SQL(""),
+            sql.SQL(returning),
+        )
+        return await self._fetch(access_token, query, params)
+
+    async def _update(
+        self,
+        access_token: str,
+        table: str,
+        payload: dict[str, Any],
+        match: dict[str, Any],
+        returning: str,
+    ) -> list[dict[str, Any]]:
+        assignments = sql.SQL(", ").join(
+            sql.SQL("{} = {}").format(sql.Identifier(column), sql.Placeholder())
+            for column in payload
+        )
+        conditions = sql.SQL(" and ").join(
+            [
+                sql.SQL("{} = {}").format(sql.Identifier(column), sql.Placeholder())
+                for column in match
+            ]
+            + [sql.SQL("deleted_at is null")]
+        )
+        query = sql.SQL("update {} set {} where {} returning {}").format(
+            sql.Identifier("public", table),
+            assignments,
+            conditions,
+            sql.SQL(returning),
+        )
+        return await self._fetch(access_token, query, [*payload.values(), *match.values()])
+
+    async def _fetch_json(
+        self,
+        access_token: str,
+        query: str,
+        params: Sequence[Any],
+    ) -> bytes:
+        # Postgres builds the JSON array itself (as PostgREST does), so the
+        # list fast path never materialises Python rows.
+        wrapped = f"select coalesce(json_agg(page), '[]'::json)::text as body from ({query}) page"
+        rows = await self._fetch(access_token, wrapped, params)
+        return rows[0]["body"].encode() if rows else b"[]"
+
+    async def _fetch(
+        self,
+        access_token: str,
+        query: str | sql.Composable,
+        params: Sequence[Any],
+    ) -> list[dict[str, Any]]:
+        try:
+            async with self._session(access_token) as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchall() if cursor.description else []
+        except psycopg.OperationalError as exc:
+            raise AppException(
+                status_code=503,
+                code="DATABASE_UNAVAILABLE",
+                message="Database is not reachable.",
+            ) from exc
+        except psycopg.Error as exc:
+            raise _app_exception(exc) from exc
+
+    @asynccontextmanager
+    async def _session(self, access_token: str) -> AsyncIterator[psycopg.AsyncCursor]:
+        claims = _token_claims(access_token)
+        role = claims.get("role") if claims.get("role") in _ALLOWED_ROLES else "authenticated"
+        async with self._pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor(row_factory=_json_row) as cursor:
+                    # Transaction-local, like PostgREST: nothing leaks to the
+                    # next request that borrows this pooled connection.
+                    await cursor.execute(
+                        "select set_config('role', %s, true),"
+                        " set_config('request.jwt.claims', %s, true)",
+                        (role, json.dumps(claims)),
+                    )
+                    yield cursor
+
+
+def _token_claims(access_token: str) -> dict[str, Any]:
+    # The token was already verified by get_auth_context before any service
+    # call; the claims are only forwarded so RLS sees the same auth.uid().
+    try:
+        return jwt.get_unverified_claims(access_token)
+    except JWTError as exc:
+        raise AppException(
+            status_code=401,
+            code="INVALID_TOKEN",
+            message="Malformed token.",
+            details=str(exc),
+        ) from exc
+
+
+def _json_value(value: Any) -> Any:
+    # Match the JSON types PostgREST returns (uuid -> str, numeric -> number).
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _json_row(cursor: psycopg.AsyncCursor) -> Callable[[Sequence[Any]], dict[str, Any]]:
+    names = [column.name for column in cursor.description or ()]
+
+    def make_row(values: Sequence[Any]) -> dict[str, Any]:
+        return {name: _json_value(value) for name, value in zip(names, values)}
+
+    return make_row
+
+
+def _app_exception(exc: psycopg.Error) -> AppException:
+    sqlstate = exc.sqlstate or ""
+    status_code = _SQLSTATE_STATUS.get(sqlstate)
+    if status_code is None:
+        status_code = 400 if sqlstate[:2] in {"22", "23"} else 500
+    diag = exc.diag
+    message = diag.message_primary or str(exc)
+    return AppException(
+        status_code=status_code,
+        code="DATABASE_ERROR",
+        message=message,
+        details={
+            "code": sqlstate,
+            "message": message,
+            "details": diag.message_detail,
+            "hint": diag.message_hint,
+        },
+    )
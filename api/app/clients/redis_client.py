@@ -0,0 +1,18 @@
+from typing import Any
+
+from app.core.config import Settings
+
+
+def build_redis_client(settings: Settings) -> Any:
+    if not settings.redis_url:
+        raise RuntimeError("REDIS_URL is required when CACHE_BACKEND=redis.")
+    # Imported here so the default in-process cache does not need redis.
+    try:
+        from redis.asyncio import Redis
+    except ImportError as exc:
+        raise RuntimeError("CACHE_BACKEND=redis requires the `redis` package.") from exc
+    return Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.request_timeout_seconds,
+        socket_connect_timeout=settings.request_timeout_seconds,
+    )
@@ -4,13 +4,26 @@ import httpx
 
 from app.core.config import Settings
 from app.core.exceptions import AppException
+from app.core.resilience import Upstream
 
 
 class SupabaseAuthClient:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        http_client: httpx.AsyncClient,
+        upstream: Upstream | None = None,
+    ) -> None:
         self._settings = settings
         self._base_url = str(settings.supabase_url).rstrip("/")
-        self._timeout = settings.request_timeout_seconds
+        # Dedicated pool so auth bursts cannot starve REST data queries.
+        self._http = http_client
+        self._upstream = upstream or Upstream.from_settings(
+            "auth",
+            settings,
+            bulkhead_limits={"auth": settings.bulkhead_auth_limit},
+        )
 
     def _headers(self, *, access_token: str | None = None) -> dict[str, str]:
         headers = {
@@ -35,6 +48,9 @@ class SupabaseAuthClient:
             "Content-Type": "application/json",
         }
 
+    def stats(self) -> dict[str, Any]:
+        return {"upstream": self._upstream.stats()}
+
     @property
     def has_service_role(self) -> bool:
         return bool((self._settings.supabase_service_role_key or "").strip())
@@ -88,8 +104,15 @@ class SupabaseAuthClient:
         access_token: str | None = None,
     ) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
+        response = await self._upstream.send(
+            lambda timeout: self._http.get(
+                url,
+                headers=self._headers(access_token=access_token),
+                timeout=timeout,
+            ),
+            idempotent=True,
+            operation="auth",
+        )
         return self._unwrap_response(response)
 
     async def _post(
@@ -100,22 +123,28 @@ class SupabaseAuthClient:
         access_token: str | None = None,
     ) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
+        # Never retried: sign-up, sign-in and refresh (which rotates the
+        # refresh token) are not safe to send twice.
+        response = await self._upstream.send(
+            lambda timeout: self._http.post(
                 url,
                 json=payload,
                 headers=self._headers(access_token=access_token),
-            )
+                timeout=timeout,
+            ),
+            idempotent=False,
+            operation="auth",
+        )
         return self._unwrap_response(response)
 
     async def _post_admin(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers=self._admin_headers(),
-            )
+        headers = self._admin_headers()
+        response = await self._upstream.send(
+            lambda timeout: self._http.post(url, json=payload, headers=headers, timeout=timeout),
+            idempotent=False,
+            operation="auth",
+        )
         return self._unwrap_response(response)
 
     @staticmethod
@@ -1,18 +1,125 @@
-from datetime import datetime
+import asyncio
+from datetime import date, datetime
 from typing import Any
 from urllib.parse import quote
 
 import httpx
 
+from app.core.cache import hash_key
 from app.core.config import Settings
 from app.core.exceptions import AppException
+from app.core.pagination import SyncWatermark, TransactionCursor
+from app.core.resilience import Upstream
 
 
 class SupabaseRestClient:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        http_client: httpx.AsyncClient,
+        upstream: Upstream | None = None,
+    ) -> None:
         self._settings = settings
         self._base_url = str(settings.supabase_url).rstrip("/")
-        self._timeout = settings.request_timeout_seconds
+        # Shared, pooled client owned by the app lifespan (see app.main).
+        self._http = http_client
+        self._upstream = upstream or Upstream.from_settings(
+            "rest",
+            settings,
+            bulkhead_limits={
+                "reads": settings.bulkhead_rest_read_limit,
+                "writes": settings.bulkhead_rest_write_limit,
+            },
+        )
+        self._coalesce = settings.rest_coalesce_gets
+        self._in_flight: dict[tuple[str, int, str], asyncio.Task[httpx.Response]] = {}
+        # Per token with GETs in flight: how many of those GETs, and how many
+        # writes completed since. Dropped once its last GET finishes.
+        self._token_gets: dict[str, int] = {}
+        self._token_writes: dict[str, int] = {}
+        self._get_stats: dict[str, dict[str, int]] = {}
+
+    async def _get(self, url: str, *, access_token: str, name: str) -> httpx.Response:
+        # Single flight: identical GETs (same URL, same token) issued while
+        # one is already in flight wait for that response instead of sending
+        # their own. Each caller parses the body itself, so nothing mutable
+        # is shared between them. The token's write count is part of the
+        # key, so a GET never joins one that started before the caller's
+        # last write and always sees its own writes.
+        stats = self._get_stats.setdefault(name, {"requests": 0, "coalesced": 0})
+        if not self._coalesce:
+            stats["requests"] += 1
+            return await self._send("GET", url, headers=self._headers(access_token=access_token))
+
+        token = hash_key(access_token)
+        key = (token, self._token_writes.get(token, 0), url)
+        task = self._in_flight.get(key)
+        if task is None:
+            stats["requests"] += 1
+            task = asyncio.ensure_future(
+                self._send("GET", url, headers=self._headers(access_token=access_token)),
+            )
+            self._in_flight[key] = task
+            self._token_gets[token] = self._token_gets.get(token, 0) + 1
+            task.add_done_callback(lambda done: self._finish_get(key, done))
+        else:
+            stats["coalesced"] += 1
+        # Shielded: a caller that is cancelled (client went away) must not
+        # cancel the request the other callers are waiting for.
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        json: Any = None,
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        # GETs are retried on gateway errors; writes only go through the
+        # circuit breaker unless the caller marks them as safe to repeat.
+        try:
+            return await self._upstream.send(
+                lambda timeout: self._http.request(
+                    method,
+                    url,
+                    json=json,
+                    headers=headers,
+                    timeout=timeout,
+                ),
+                idempotent=method == "GET" if idempotent is None else idempotent,
+            )
+        finally:
+            if method != "GET":
+                # Counted even when it failed: a timed-out write may still
+                # have committed.
+                self._wrote(headers)
+
+    def _wrote(self, headers: dict[str, str]) -> None:
+        token = hash_key(headers["Authorization"].removeprefix("Bearer "))
+        if token in self._token_gets:
+            self._token_writes[token] = self._token_writes.get(token, 0) + 1
+
+    def _finish_get(self, key: tuple[str, int, str], task: asyncio.Task[httpx.Response]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        token = key[0]
+        self._token_gets[token] -= 1
+        if not self._token_gets[token]:
+            del self._token_gets[token]
+            self._token_writes.pop(token, None)
+        if not task.cancelled():
+            # Marks the exception as retrieved when every caller was cancelled.
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._in_flight),
+            "gets": self._get_stats,
+            "upstream": self._upstream.stats(),
+        }
 
     def _headers(self, *, access_token: str) -> dict[str, str]:
         return {
@@ -27,8 +134,7 @@ class SupabaseRestClient:
             f"?select=id,base_currency,ai_enabled,created_at,updated_at"
             f"&id=eq.{user_id}&deleted_at=is.null"
         )
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
+        response = await self._get(url, access_token=access_token, name="fetch_profile")
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -49,8 +155,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -60,22 +165,35 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    def _cash_wallets_url(self, user_id: str) -> str:
+        return (
+            f"{self._base_url}/rest/v1/cash_wallets"
+            f"?select=id,name,balance,currency,created_at,updated_at"
+            f"&user_id=eq.{user_id}&deleted_at=is.null"
+            "&order=created_at.desc"
+        )
+
     async def list_cash_wallets(
         self,
         *,
         access_token: str,
         user_id: str,
     ) -> list[dict[str, Any]]:
-        url = (
-            f"{self._base_url}/rest/v1/cash_wallets"
-            f"?select=id,name,balance,currency,created_at,updated_at"
-            f"&user_id=eq.{user_id}&deleted_at=is.null"
-            "&order=created_at.desc"
+        response = await self._get(
+            self._cash_wallets_url(user_id),
+            access_token=access_token,
+            name="list_cash_wallets",
         )
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
         return self._unwrap_response(response)
 
+    async def list_cash_wallets_json(self, *, access_token: str, user_id: str) -> bytes:
+        response = await self._get(
+            self._cash_wallets_url(user_id),
+            access_token=access_token,
+            name="list_cash_wallets_json",
+        )
+        return self._raw_response(response)
+
     async def create_cash_wallet(
         self,
         *,
@@ -86,8 +204,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        response = await self._send("POST", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -112,8 +229,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -123,22 +239,35 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    def _bank_accounts_url(self, user_id: str) -> str:
+        return (
+            f"{self._base_url}/rest/v1/bank_accounts"
+            f"?select=id,name,bank_name,balance,currency,created_at,updated_at"
+            f"&user_id=eq.{user_id}&deleted_at=is.null"
+            "&order=created_at.desc"
+        )
+
     async def list_bank_accounts(
         self,
         *,
         access_token: str,
         user_id: str,
     ) -> list[dict[str, Any]]:
-        url = (
-            f"{self._base_url}/rest/v1/bank_accounts"
-            f"?select=id,name,bank_name,balance,currency,created_at,updated_at"
-            f"&user_id=eq.{user_id}&deleted_at=is.null"
-            "&order=created_at.desc"
+        response = await self._get(
+            self._bank_accounts_url(user_id),
+            access_token=access_token,
+            name="list_bank_accounts",
         )
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
         return self._unwrap_response(response)
 
+    async def list_bank_accounts_json(self, *, access_token: str, user_id: str) -> bytes:
+        response = await self._get(
+            self._bank_accounts_url(user_id),
+            access_token=access_token,
+            name="list_bank_accounts_json",
+        )
+        return self._raw_response(response)
+
     async def create_bank_account(
         self,
         *,
@@ -149,8 +278,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        response = await self._send("POST", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -175,8 +303,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -186,22 +313,35 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    def _credit_cards_url(self, user_id: str) -> str:
+        return (
+            f"{self._base_url}/rest/v1/credit_cards"
+            f"?select=id,name,issuer,last_four,card_provider,tier,credit_limit,current_debt,statement_day,due_day,currency,created_at,updated_at"
+            f"&user_id=eq.{user_id}&deleted_at=is.null"
+            "&order=created_at.desc"
+        )
+
     async def list_credit_cards(
         self,
         *,
         access_token: str,
         user_id: str,
     ) -> list[dict[str, Any]]:
-        url = (
-            f"{self._base_url}/rest/v1/credit_cards"
-            f"?select=id,name,issuer,last_four,card_provider,tier,credit_limit,current_debt,statement_day,due_day,currency,created_at,updated_at"
-            f"&user_id=eq.{user_id}&deleted_at=is.null"
-            "&order=created_at.desc"
+        response = await self._get(
+            self._credit_cards_url(user_id),
+            access_token=access_token,
+            name="list_credit_cards",
         )
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
         return self._unwrap_response(response)
 
+    async def list_credit_cards_json(self, *, access_token: str, user_id: str) -> bytes:
+        response = await self._get(
+            self._credit_cards_url(user_id),
+            access_token=access_token,
+            name="list_credit_cards_json",
+        )
+        return self._raw_response(response)
+
     async def create_credit_card(
         self,
         *,
@@ -212,8 +352,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        response = await self._send("POST", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -238,8 +377,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -249,23 +387,36 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    def _categories_url(self, user_id: str) -> str:
+        # Categories are user-scoped. System defaults are seeded per user.
+        return (
+            f"{self._base_url}/rest/v1/categories"
+            f"?select=id,name,kind,color,icon,is_system,created_at,updated_at"
+            f"&user_id=eq.{quote(user_id, safe='')}&deleted_at=is.null"
+            "&order=name.asc"
+        )
+
     async def list_categories(
         self,
         *,
         access_token: str,
         user_id: str,
     ) -> list[dict[str, Any]]:
-        # Categories are user-scoped. System defaults are seeded per user.
-        url = (
-            f"{self._base_url}/rest/v1/categories"
-            f"?select=id,name,kind,color,icon,is_system,created_at,updated_at"
-            f"&user_id=eq.{quote(user_id, safe='')}&deleted_at=is.null"
-            "&order=name.asc"
+        response = await self._get(
+            self._categories_url(user_id),
+            access_token=access_token,
+            name="list_categories",
         )
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
         return self._unwrap_response(response)
 
+    async def list_categories_json(self, *, access_token: str, user_id: str) -> bytes:
+        response = await self._get(
+            self._categories_url(user_id),
+            access_token=access_token,
+            name="list_categories_json",
+        )
+        return self._raw_response(response)
+
     async def create_category(
         self,
         *,
@@ -276,8 +427,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        response = await self._send("POST", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -302,8 +452,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -313,10 +462,9 @@ class SupabaseRestClient:
             )
         return data[0]
 
-    async def list_transactions(
+    def _transactions_url(
         self,
         *,
-        access_token: str,
         user_id: str,
         limit: int = 50,
         offset: int = 0,
@@ -327,7 +475,8 @@ class SupabaseRestClient:
         credit_card_id: str | None = None,
         occurred_from: datetime | None = None,
         occurred_to: datetime | None = None,
-    ) -> list[dict[str, Any]]:
+        after: TransactionCursor | None = None,
+    ) -> str:
         select = (
             "id,kind,amount,currency,description,occurred_at,category_id,"
             "cash_wallet_id,bank_account_id,credit_card_id,target_cash_wallet_id,"
@@ -337,10 +486,20 @@ class SupabaseRestClient:
             f"select={select}",
             f"user_id=eq.{quote(user_id, safe='')}",
             "deleted_at=is.null",
-            "order=occurred_at.desc",
+            # `id` breaks ties between rows sharing occurred_at so keyset pages
+            # never skip or repeat rows (idx_transactions_user_id_occurred_at_id).
+            "order=occurred_at.desc,id.desc",
             f"limit={limit}",
-            f"offset={offset}",
         ]
+        if after is not None:
+            occurred_at = quote(f'"{after.occurred_at.isoformat()}"', safe="")
+            tx_id = quote(f'"{after.id}"', safe="")
+            query_parts.append(
+                f"or=(occurred_at.lt.{occurred_at},"
+                f"and(occurred_at.eq.{occurred_at},id.lt.{tx_id}))",
+            )
+        else:
+            query_parts.append(f"offset={offset}")
 
         if kind is not None:
             query_parts.append(f"kind=eq.{quote(kind, safe='')}")
@@ -361,11 +520,72 @@ class SupabaseRestClient:
                 f"occurred_at=lte.{quote(occurred_to.isoformat(), safe='')}",
             )
 
-        url = f"{self._base_url}/rest/v1/transactions?{'&'.join(query_parts)}"
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers(access_token=access_token))
+        return f"{self._base_url}/rest/v1/transactions?{'&'.join(query_parts)}"
+
+    async def list_transactions(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        url = self._transactions_url(
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            kind=kind,
+            category_id=category_id,
+            cash_wallet_id=cash_wallet_id,
+            bank_account_id=bank_account_id,
+            credit_card_id=credit_card_id,
+            occurred_from=occurred_from,
+            occurred_to=occurred_to,
+            after=after,
+        )
+        response = await self._get(url, access_token=access_token, name="list_transactions")
         return self._unwrap_response(response)
 
+    async def list_transactions_json(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
+    ) -> bytes:
+        url = self._transactions_url(
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            kind=kind,
+            category_id=category_id,
+            cash_wallet_id=cash_wallet_id,
+            bank_account_id=bank_account_id,
+            credit_card_id=credit_card_id,
+            occurred_from=occurred_from,
+            occurred_to=occurred_to,
+            after=after,
+        )
+        response = await self._get(url, access_token=access_token, name="list_transactions_json")
+        return self._raw_response(response)
+
     async def create_transaction(
         self,
         *,
@@ -376,8 +596,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        response = await self._send("POST", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -387,6 +606,29 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    async def create_transactions(
+        self,
+        *,
+        access_token: str,
+        payloads: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        # PostgREST array insert: one request, one statement. `columns` plus
+        # `missing=default` lets rows omit optional fields.
+        columns = sorted({key for payload in payloads for key in payload})
+        url = f"{self._base_url}/rest/v1/transactions?columns={','.join(columns)}"
+        headers = self._headers(access_token=access_token)
+        headers["Prefer"] = "return=representation,missing=default"
+
+        response = await self._send("POST", url, json=payloads, headers=headers)
+        data = self._unwrap_response(response)
+        if len(data) != len(payloads):
+            raise AppException(
+                status_code=500,
+                code="TRANSACTION_BATCH_CREATE_FAILED",
+                message="Transaction batch could not be created.",
+            )
+        return data
+
     async def update_transaction(
         self,
         *,
@@ -402,8 +644,7 @@ class SupabaseRestClient:
         headers = self._headers(access_token=access_token)
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.patch(url, json=payload, headers=headers)
+        response = await self._send("PATCH", url, json=payload, headers=headers)
         data = self._unwrap_response(response)
         if not data:
             raise AppException(
@@ -413,6 +654,254 @@ class SupabaseRestClient:
             )
         return data[0]
 
+    async def fetch_transaction_month_summary(
+        self,
+        *,
+        access_token: str,
+        occurred_from: datetime,
+        occurred_to: datetime,
+    ) -> list[dict[str, Any]]:
+        # Aggregated by Postgres (GROUP BY kind, category_id, currency); the
+        # caller's user is resolved from the JWT through auth.uid().
+        url = f"{self._base_url}/rest/v1/rpc/transaction_month_summary"
+        payload = {
+            "p_from": occurred_from.isoformat(),
+            "p_to": occurred_to.isoformat(),
+        }
+        # Read-only RPC, so it is retried like a GET.
+        response = await self._send(
+            "POST",
+            url,
+            json=payload,
+            headers=self._headers(access_token=access_token),
+            idempotent=True,
+        )
+        return self._unwrap_response(response)
+
+    async def fetch_sync_changes(
+        self,
+        *,
+        access_token: str,
+        since: SyncWatermark | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        # One row: the database clock and the changes after `since` (or every
+        # row of the user when it is None), tombstones included.
+        url = f"{self._base_url}/rest/v1/rpc/sync_changes"
+        payload: dict[str, Any] = {"p_limit": limit}
+        if since is not None:
+            payload.update(
+                {
+                    "p_since": since.updated_at.isoformat(),
+                    "p_since_entity": since.entity,
+                    "p_since_id": since.id,
+                }
+            )
+        # Read-only RPC, so it is retried like a GET.
+        response = await self._send(
+            "POST",
+            url,
+            json=payload,
+            headers=self._headers(access_token=access_token),
+            idempotent=True,
+        )
+        return self._unwrap_response(response)
+
+    async def list_budgets(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        url = (
+            f"{self._base_url}/rest/v1/budgets"
+            f"?select=id,category_id,amount,currency,created_at,updated_at"
+            f"&user_id=eq.{quote(user_id, safe='')}&deleted_at=is.null"
+            "&order=created_at.asc"
+        )
+        response = await self._get(url, access_token=access_token, name="list_budgets")
+        return self._unwrap_response(response)
+
+    async def create_budget(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        url = f"{self._base_url}/rest/v1/budgets"
+        headers = self._headers(access_token=access_token)
+        headers["Prefer"] = "return=representation"
+
+        response = await self._send("POST", url, json=payload, headers=headers)
+        data = self._unwrap_response(response)
+        if not data:
+            raise AppException(
+                status_code=500,
+                code="BUDGET_CREATE_FAILED",
+                message="Budget could not be created.",
+            )
+        return data[0]
+
+    async def update_budget(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        budget_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        url = (
+            f"{self._base_url}/rest/v1/budgets"
+            f"?id=eq.{quote(budget_id, safe='')}&user_id=eq.{quote(user_id, safe='')}"
+            "&deleted_at=is.null"
+        )
+        headers = self._headers(access_token=access_token)
+        headers["Prefer"] = "return=representation"
+
+        response = await self._send("PATCH", url, json=payload, headers=headers)
+        data = self._unwrap_response(response)
+        if not data:
+            raise AppException(
+                status_code=404,
+                code="BUDGET_NOT_FOUND",
+                message="Budget not found.",
+            )
+        return data[0]
+
+    async def list_monthly_spend(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date,
+    ) -> list[dict[str, Any]]:
+        # Reads the trigger-maintained rollups: one row per spending
+        # (kind, category, currency) in the month, independent of history size.
+        url = (
+            f"{self._base_url}/rest/v1/transaction_monthly_rollups"
+            f"?select=category_id,currency,total"
+            f"&user_id=eq.{quote(user_id, safe='')}&month=eq.{month.isoformat()}"
+            "&kind=in.(expense,credit_charge)"
+        )
+        response = await self._get(url, access_token=access_token, name="list_monthly_spend")
+        return self._unwrap_response(response)
+
+    async def list_budget_alerts(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date,
+    ) -> list[dict[str, Any]]:
+        url = (
+            f"{self._base_url}/rest/v1/budget_alerts"
+            f"?select=id,budget_id,month,threshold,spent,amount,created_at"
+            f"&user_id=eq.{quote(user_id, safe='')}&month=eq.{month.isoformat()}"
+            "&order=created_at.asc"
+        )
+        response = await self._get(url, access_token=access_token, name="list_budget_alerts")
+        return self._unwrap_response(response)
+
+    async def create_budget_alerts(
+        self,
+        *,
+        access_token: str,
+        payloads: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        # ON CONFLICT DO NOTHING on (budget_id, month, threshold): only alerts
+        # that did not exist yet come back, which makes evaluation idempotent.
+        url = (
+            f"{self._base_url}/rest/v1/budget_alerts"
+            "?on_conflict=budget_id,month,threshold"
+        )
+        headers = self._headers(access_token=access_token)
+        headers["Prefer"] = "return=representation,resolution=ignore-duplicates"
+
+        response = await self._send("POST", url, json=payloads, headers=headers)
+        return self._unwrap_response(response)
+
+    def _idempotency_key_url(self, user_id: str, scope: str, key: str) -> str:
+        return (
+            f"{self._base_url}/rest/v1/idempotency_keys"
+            f"?user_id=eq.{quote(user_id, safe='')}"
+            f"&scope=eq.{quote(scope, safe='')}"
+            f"&key=eq.{quote(key, safe='')}"
+        )
+
+    async def fetch_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+    ) -> dict[str, Any] | None:
+        url = (
+            f"{self._idempotency_key_url(user_id, scope, key)}"
+            "&select=request_hash,response,created_at"
+        )
+        response = await self._get(url, access_token=access_token, name="fetch_idempotency_key")
+        data = self._unwrap_response(response)
+        return data[0] if data else None
+
+    async def reserve_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        payload: dict[str, Any],
+    ) -> bool:
+        # ON CONFLICT DO NOTHING: an empty representation means another
+        # request already holds the key.
+        url = f"{self._base_url}/rest/v1/idempotency_keys?on_conflict=user_id,scope,key"
+        headers = self._headers(access_token=access_token)
+        headers["Prefer"] = "return=representation,resolution=ignore-duplicates"
+
+        response = await self._send("POST", url, json=payload, headers=headers)
+        return bool(self._unwrap_response(response))
+
+    async def complete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        response: dict[str, Any],
+    ) -> None:
+        result = await self._send(
+            "PATCH",
+            self._idempotency_key_url(user_id, scope, key),
+            json={"response": response},
+            headers=self._headers(access_token=access_token),
+        )
+        self._unwrap_response(result)
+
+    async def delete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        pending_only: bool = False,
+        created_before: datetime | None = None,
+    ) -> None:
+        url = self._idempotency_key_url(user_id, scope, key)
+        if pending_only:
+            url += "&response=is.null"
+        if created_before is not None:
+            url += f"&created_at=lt.{quote(created_before.isoformat(), safe='')}"
+        response = await self._send("DELETE", url, headers=self._headers(access_token=access_token))
+        self._unwrap_response(response)
+
+    @classmethod
+    def _raw_response(cls, response: httpx.Response) -> bytes:
+        # Fast path for list endpoints: the body is handed to a cached
+        # TypeAdapter.validate_json as-is, without building dicts first.
+        if response.status_code >= 400:
+            cls._unwrap_response(response)
+        return response.content or b"[]"
+
     @staticmethod
     def _unwrap_response(response: httpx.Response) -> list[dict[str, Any]]:
         try:
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from app.core.exceptions import AppException
+
+
+class Bulkhead:
+    # At most `limit` calls at once and `queue_limit` waiting for a slot;
+    # past that callers are turned away immediately with 503 + Retry-After
+    # instead of piling up behind a slow upstream. Slots are handed over in
+    # FIFO order.
+    def __init__(
+        self,
+        name: str,
+        *,
+        limit: int,
+        queue_limit: int,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.name = name
+        self._limit = max(1, limit)
+        self._queue_limit = max(0, queue_limit)
+        self._retry_after = retry_after_seconds
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self._limit,
+            "queue_limit": self._queue_limit,
+            "active": self._active,
+            "queued": len(self._waiters),
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_ms_avg": (
+                round(self._wait_total / self._waited * 1000, 3) if self._waited else 0.0
+            ),
+            "wait_ms_max": round(self._wait_max * 1000, 3),
+        }
+
+    async def _acquire(self) -> None:
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self._queue_limit:
+            self.rejected += 1
+            raise AppException(
+                status_code=503,
+                code="UPSTREAM_BUSY",
+                message="The server is busy, retry shortly.",
+                details={"bulkhead": self.name},
+                headers={"Retry-After": str(self._retry_after)},
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.peak_queued = max(self.peak_queued, len(self._waiters))
+        started = time.perf_counter()
+        try:
+            await waiter
+        except BaseException:
+            if not waiter.done():
+                waiter.cancel()
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # The slot was handed over as this caller was cancelled.
+                self._release()
+            raise
+
+        # _release handed its slot over, so _active is already counted.
+        self.admitted += 1
+        waited = time.perf_counter() - started
+        self._waited += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+V = TypeVar("V")
+
+logger = logging.getLogger("billetera.cache")
+
+
+def hash_key(value: str) -> str:
+    # Secrets such as access tokens are never kept as cache keys verbatim.
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class TTLCache(Generic[V]):
+    # Bounded in-process LRU; every entry also carries an absolute expiry.
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: V, *, expires_at: float | None = None) -> None:
+        ttl_expires_at = self._clock() + self._ttl_seconds
+        if expires_at is None or expires_at > ttl_expires_at:
+            expires_at = ttl_expires_at
+
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class CacheBackend(Protocol):
+    # Byte values keyed by string, so the same services can run against an
+    # in-process cache or one shared by every worker.
+    async def get(self, key: str) -> bytes | None: ...
+
+    # strict=True raises instead of logging a failed write, for callers
+    # whose correctness depends on it (see AssetSnapshotCache.bump).
+    async def set(self, key: str, value: bytes, *, strict: bool = False) -> None: ...
+
+    async def delete(self, key: str, *, strict: bool = False) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class MemoryCacheBackend:
+    # Per-process: each worker keeps and invalidates its own copy.
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cache: TTLCache[bytes] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, *, strict: bool = False) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, key: str, *, strict: bool = False) -> None:
+        self._cache.pop(key)
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+class RedisCacheBackend:
+    # Shared by every worker. Redis applies the TTL; size is bounded by the
+    # server's maxmemory with an LRU eviction policy (allkeys-lru). A Redis
+    # outage degrades to cache misses instead of failing the request.
+    def __init__(self, client: Any, *, namespace: str, ttl_seconds: float) -> None:
+        self._client = client
+        self._namespace = namespace
+        self._ttl_seconds = max(1, int(ttl_seconds))
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self._client.get(self._key(key))
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache read failed for %s", self._namespace, exc_info=True)
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, *, strict: bool = False) -> None:
+        try:
+            await self._client.set(self._key(key), value, ex=self._ttl_seconds)
+        except Exception:
+            self.errors += 1
+            if strict:
+                raise
+            logger.warning("Cache write failed for %s", self._namespace, exc_info=True)
+
+    async def delete(self, key: str, *, strict: bool = False) -> None:
+        try:
+            await self._client.delete(self._key(key))
+        except Exception:
+            self.errors += 1
+            if strict:
+                raise
+            # The entry stays until its TTL; nothing better to do here.
+            logger.warning("Cache invalidation failed for %s", self._namespace, exc_info=True)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+    def _key(self, key: str) -> str:
+        return f"billetera:{self._namespace}:{key}"
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import AnyHttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -25,7 +26,89 @@ class Settings(BaseSettings):
     supabase_jwt_audience: str | None = "authenticated"
 
     request_timeout_seconds: float = 20.0
+    # Whole-request budget: upstream calls get only what is left of it and
+    # the handler is cancelled with 504 once it runs out. Clients may ask for
+    # less with X-Request-Timeout (seconds). 0 disables it.
+    request_deadline_seconds: float = 20.0
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False
+    rest_max_connections: int = 100
+    rest_max_keepalive_connections: int = 20
+    auth_max_connections: int = 50
+    auth_max_keepalive_connections: int = 10
     jwks_cache_ttl_seconds: int = 300
+    jwks_refresh_ahead_seconds: int = 60
+    jwks_forced_refresh_min_interval_seconds: float = 30.0
+    jwt_cache_max_entries: int = 10_000
+    jwt_cache_max_ttl_seconds: int = 3600
+    # GET /metrics exposes cache sizes, pool and breaker internals: off by
+    # default, and when metrics_token is set it also needs X-Metrics-Token.
+    metrics_enabled: bool = False
+    metrics_token: str | None = None
+    export_page_size: int = 500
+
+    # "remote" confirms every token against /auth/v1/user; "local" trusts the
+    # verified JWT claims and skips that round trip.
+    auth_verification_mode: Literal["remote", "local"] = "remote"
+    auth_user_cache_ttl_seconds: float = 0.0
+    auth_user_cache_max_entries: int = 10_000
+
+    # Concurrent identical GETs to PostgREST (same URL and token) share one
+    # upstream request.
+    rest_coalesce_gets: bool = True
+
+    # Idempotent requests to Supabase (GETs, read-only RPCs) are retried on
+    # 502/503/504 and connect errors, with full-jitter exponential backoff.
+    # Attempts include the first one; 1 disables retries.
+    upstream_retry_attempts: int = 3
+    upstream_retry_base_delay_seconds: float = 0.1
+    upstream_retry_max_delay_seconds: float = 1.0
+    # Per upstream (rest, auth): after this many consecutive failures calls
+    # fail fast with 503 until a probe succeeds, at most every reset seconds.
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_reset_seconds: float = 30.0
+    # Concurrent Supabase calls per operation class, kept below the pool
+    # sizes so reads cannot starve writes or auth; up to bulkhead_queue_limit
+    # more wait for a slot, the rest get 503 + Retry-After. 0 disables one.
+    bulkhead_rest_read_limit: int = 60
+    bulkhead_rest_write_limit: int = 30
+    bulkhead_auth_limit: int = 40
+    bulkhead_queue_limit: int = 100
+
+    # "rest" goes through PostgREST over HTTP; "postgres" queries the database
+    # directly through SUPABASE_DB_URL with the same RLS policies.
+    data_backend: Literal["rest", "postgres"] = "rest"
+    supabase_db_url: str | None = None
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    # Disable behind transaction-mode poolers (port 6543), which cannot keep
+    # server-side prepared statements.
+    db_prepare_statements: bool = True
+    db_prepare_threshold: int = 5
+
+    # Replay window for Idempotency-Key on create endpoints; 0 disables it.
+    # Durable mode also records keys in public.idempotency_keys (migration
+    # 0013) so retries reaching another worker are recognised.
+    idempotency_ttl_seconds: float = 86_400.0
+    idempotency_max_entries: int = 10_000
+    idempotency_durable: bool = False
+    idempotency_lock_seconds: float = 30.0
+
+    # Backend for per-user read caches: "memory" is per worker, "redis" is
+    # shared by every worker through REDIS_URL.
+    cache_backend: Literal["memory", "redis"] = "memory"
+    redis_url: str | None = None
+    category_cache_ttl_seconds: float = 300.0
+    category_cache_max_entries: int = 10_000
+    # Wallets, bank accounts and cards; every write for the user moves it to
+    # a new version. That version lives in the cache backend, so the cache is
+    # only enabled with CACHE_BACKEND=redis, or with the memory backend when
+    # asset_cache_single_worker says a single process serves every request;
+    # with several workers a per-process version would leave the others
+    # serving old balances until the TTL.
+    asset_cache_ttl_seconds: float = 300.0
+    asset_cache_max_entries: int = 40_000
+    asset_cache_single_worker: bool = False
 
 
 @lru_cache(maxsize=1)
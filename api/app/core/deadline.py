@@ -0,0 +1,77 @@
+import asyncio
+import time
+from contextvars import ContextVar, Token
+
+from app.core.exceptions import AppException
+
+
+class Deadline:
+    # Mutable on purpose: the context variable holds the same object in
+    # every task copied from the request, so clearing it is seen by all.
+    def __init__(self, seconds: float) -> None:
+        self.expires_at: float | None = time.monotonic() + seconds
+        # The middleware's cancellation timer, disarmed together with it.
+        self.timer: asyncio.Timeout | None = None
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def clear(self) -> None:
+        self.expires_at = None
+        # Too late once it fired: the cancellation is already on its way.
+        if self.timer is not None and not self.timer.expired():
+            self.timer.reschedule(None)
+
+
+_current: ContextVar[Deadline | None] = ContextVar("request_deadline", default=None)
+
+
+def start(seconds: float) -> tuple[Deadline, Token[Deadline | None]]:
+    deadline = Deadline(seconds)
+    return deadline, _current.set(deadline)
+
+
+def reset(token: Token[Deadline | None]) -> None:
+    _current.reset(token)
+
+
+def lift() -> None:
+    # Called once a write has returned: the rest of the request (snapshot
+    # bump, budget checks) must run to the end, or the client would get a
+    # 504 for a write that committed.
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.clear()
+
+
+def remaining() -> float | None:
+    # Seconds left for the current request; None outside a request or once
+    # its response has started.
+    deadline = _current.get()
+    return None if deadline is None else deadline.remaining()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def budget(default: float | None) -> float | None:
+    # Timeout for one upstream call: the configured one, cut down to what is
+    # left of the request budget.
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise deadline_exceeded()
+    return left if default is None else min(default, left)
+
+
+def deadline_exceeded() -> AppException:
+    return AppException(
+        status_code=504,
+        code="DEADLINE_EXCEEDED",
+        message="The request did not complete within its deadline.",
+    )
@@ -17,11 +17,13 @@ class AppException(Exception):
         code: str,
         message: str,
         details: Any | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self.code = code
         self.message = message
         self.details = details
+        self.headers = headers
         super().__init__(message)
 
 
@@ -29,6 +31,14 @@ def _error_payload(code: str, message: str, details: Any | None = None) -> dict[
     return {"code": code, "message": message, "details": details}
 
 
+def error_response(exc: AppException) -> JSONResponse:
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=_error_payload(exc.code, exc.message, exc.details),
+        headers=exc.headers,
+    )
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(AppException)
     async def app_exception_handler(_: Request, exc: AppException) -> JSONResponse:
@@ -39,10 +49,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             exc.message,
             jsonable_encoder(exc.details),
         )
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=_error_payload(exc.code, exc.message, exc.details),
-        )
+        return error_response(exc)
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
@@ -0,0 +1,260 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.core.cache import TTLCache, hash_key
+from app.core.exceptions import AppException
+
+logger = logging.getLogger("billetera.idempotency")
+
+StoredResponse = tuple[str, dict[str, Any]]
+
+
+def request_fingerprint(payload: dict[str, Any]) -> str:
+    # Reusing a key with a different body is a client bug, not a retry.
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class IdempotencyStore:
+    # First response per (user, scope, Idempotency-Key). Retries handled by
+    # this worker are answered from the bounded TTL cache and wait on a
+    # per-key lock while the first request is in flight. With durable=True a
+    # row in public.idempotency_keys (migration 0013) is reserved before the
+    # write, so retries reaching another worker are recognised too.
+    # When the outcome of the write is unknown (5xx, timeout, cancelled) it
+    # may have committed, so the key stays pending, answering 409, until
+    # lock_seconds pass rather than letting a retry insert it again.
+    def __init__(
+        self,
+        *,
+        cache: TTLCache[StoredResponse],
+        ttl_seconds: float,
+        rest_client: Any = None,
+        durable: bool = False,
+        lock_seconds: float = 30.0,
+    ) -> None:
+        self._cache = cache
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._rest_client = rest_client
+        self._durable = durable and rest_client is not None
+        self._lock_timeout = timedelta(seconds=lock_seconds)
+        self._pending: TTLCache[str] = TTLCache(max_entries=10_000, ttl_seconds=lock_seconds)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self.replays = 0
+        self.conflicts = 0
+
+    async def run(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        execute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        cache_key = hash_key(f"{user_id}:{scope}:{key}")
+        lock = self._locks.setdefault(cache_key, asyncio.Lock())
+        self._lock_users[cache_key] = self._lock_users.get(cache_key, 0) + 1
+        try:
+            async with lock:
+                return await self._run_locked(
+                    cache_key=cache_key,
+                    access_token=access_token,
+                    user_id=user_id,
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    execute=execute,
+                )
+        finally:
+            self._lock_users[cache_key] -= 1
+            if not self._lock_users[cache_key]:
+                del self._lock_users[cache_key]
+                del self._locks[cache_key]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._cache.stats(),
+            "in_flight": len(self._locks),
+            "replays": self.replays,
+            "conflicts": self.conflicts,
+        }
+
+    async def _run_locked(
+        self,
+        *,
+        cache_key: str,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        execute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        stored = self._cache.get(cache_key)
+        if stored is None:
+            pending = self._pending.get(cache_key)
+            if pending is not None:
+                self.conflicts += 1
+                raise _key_reused() if pending != fingerprint else _key_in_progress()
+        if stored is None and self._durable:
+            stored = await self._reserve(
+                access_token=access_token,
+                user_id=user_id,
+                scope=scope,
+                key=key,
+                fingerprint=fingerprint,
+            )
+            if stored is not None:
+                self._cache.set(cache_key, stored)
+        if stored is not None:
+            return self._replay(stored, fingerprint)
+
+        try:
+            response = await execute()
+        except AppException as exc:
+            if not 400 <= exc.status_code < 500:
+                self._pending.set(cache_key, fingerprint)
+                raise
+            # Rejected outright, so nothing was written and the key is free.
+            if self._durable:
+                await self._release(access_token=access_token, user_id=user_id, scope=scope, key=key)
+            raise
+        except BaseException:
+            self._pending.set(cache_key, fingerprint)
+            raise
+
+        self._cache.set(cache_key, (fingerprint, response))
+        if self._durable:
+            try:
+                await self._rest_client.complete_idempotency_key(
+                    access_token=access_token,
+                    user_id=user_id,
+                    scope=scope,
+                    key=key,
+                    response=response,
+                )
+            except AppException:
+                # The write succeeded; only other workers lose the replay.
+                logger.warning("Could not record idempotency key for scope %s", scope, exc_info=True)
+        return response
+
+    def _replay(self, stored: StoredResponse, fingerprint: str) -> dict[str, Any]:
+        request_hash, response = stored
+        if request_hash != fingerprint:
+            self.conflicts += 1
+            raise _key_reused()
+        self.replays += 1
+        return response
+
+    async def _reserve(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        fingerprint: str,
+    ) -> StoredResponse | None:
+        # None once this request holds the key; the first response when a
+        # previous attempt already completed.
+        payload = {"user_id": user_id, "scope": scope, "key": key, "request_hash": fingerprint}
+        try:
+            for _ in range(2):
+                if await self._rest_client.reserve_idempotency_key(
+                    access_token=access_token,
+                    payload=payload,
+                ):
+                    return None
+
+                record = await self._rest_client.fetch_idempotency_key(
+                    access_token=access_token,
+                    user_id=user_id,
+                    scope=scope,
+                    key=key,
+                )
+                if record is None:
+                    continue
+
+                now = datetime.now(UTC)
+                created_at = _as_datetime(record["created_at"])
+                if record.get("response") is not None and created_at > now - self._ttl:
+                    return str(record["request_hash"]), record["response"]
+                if record.get("response") is None and created_at > now - self._lock_timeout:
+                    self.conflicts += 1
+                    if record["request_hash"] != fingerprint:
+                        raise _key_reused()
+                    raise _key_in_progress()
+
+                # Expired, or abandoned by a worker that died mid-request.
+                await self._rest_client.delete_idempotency_key(
+                    access_token=access_token,
+                    user_id=user_id,
+                    scope=scope,
+                    key=key,
+                    pending_only=record.get("response") is None,
+                    created_before=now - (self._lock_timeout if record.get("response") is None else self._ttl),
+                )
+        except AppException as exc:
+            _raise_if_migration_missing(exc)
+            raise
+
+        self.conflicts += 1
+        raise _key_in_progress()
+
+    async def _release(self, *, access_token: str, user_id: str, scope: str, key: str) -> None:
+        try:
+            await self._rest_client.delete_idempotency_key(
+                access_token=access_token,
+                user_id=user_id,
+                scope=scope,
+                key=key,
+                pending_only=True,
+            )
+        except AppException:
+            # The reservation expires after lock_seconds anyway.
+            logger.warning("Could not release idempotency key for scope %s", scope, exc_info=True)
+
+
+def _as_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+def _key_reused() -> AppException:
+    return AppException(
+        status_code=422,
+        code="IDEMPOTENCY_KEY_REUSED",
+        message="Idempotency-Key was already used with a different request.",
+    )
+
+
+def _key_in_progress() -> AppException:
+    return AppException(
+        status_code=409,
+        code="IDEMPOTENCY_KEY_IN_PROGRESS",
+        message="A request with this Idempotency-Key is still being processed.",
+    )
+
+
+def _raise_if_migration_missing(exc: AppException) -> None:
+    details = exc.details if isinstance(exc.details, dict) else {}
+    code = str(details.get("code", "")).upper()
+    message = str(details.get("message", "")).lower()
+    # Only a missing idempotency_keys table; RLS, constraint or other
+    # missing-relation errors are not about this migration.
+    if code in {"42P01", "PGRST205"} and "idempotency_keys" in message:
+        raise AppException(
+            status_code=503,
+            code="MIGRATIONS_NOT_APPLIED",
+            message=(
+                "Database migrations are not applied yet. "
+                "Run `python scripts/apply_migrations.py` from the api folder."
+            ),
+        ) from exc
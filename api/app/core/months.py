@@ -0,0 +1,33 @@
+from datetime import UTC, date, datetime
+
+from app.core.exceptions import AppException
+
+
+def parse_month(value: str | None) -> date | None:
+    # `YYYY-MM` query values -> first day of that month.
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(f"{value}-01")
+    except ValueError as exc:
+        raise AppException(
+            status_code=400,
+            code="INVALID_MONTH",
+            message="month must use the YYYY-MM format.",
+        ) from exc
+
+
+def month_start(value: date | datetime | None = None) -> date:
+    # Months are UTC months, matching transaction_monthly_rollups.
+    if value is None:
+        value = datetime.now(UTC)
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC).date() if value.tzinfo else value.date()
+    return value.replace(day=1)
+
+
+def month_bounds(month: date) -> tuple[datetime, datetime]:
+    start = datetime(month.year, month.month, 1, tzinfo=UTC)
+    if month.month == 12:
+        return start, start.replace(year=month.year + 1, month=1)
+    return start, start.replace(month=month.month + 1)
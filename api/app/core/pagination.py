@@ -0,0 +1,82 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.core.exceptions import AppException
+
+
+@dataclass(frozen=True)
+class TransactionCursor:
+    occurred_at: datetime
+    id: str
+
+
+def encode_cursor(cursor: TransactionCursor) -> str:
+    raw = json.dumps(
+        {"o": cursor.occurred_at.isoformat(), "i": cursor.id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value: str) -> TransactionCursor:
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        occurred_at = datetime.fromisoformat(payload["o"])
+        tx_id = str(payload["i"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise AppException(
+            status_code=400,
+            code="INVALID_CURSOR",
+            message="Pagination cursor is invalid.",
+        ) from exc
+
+    if occurred_at.tzinfo is None or not tx_id:
+        raise AppException(
+            status_code=400,
+            code="INVALID_CURSOR",
+            message="Pagination cursor is invalid.",
+        )
+    return TransactionCursor(occurred_at=occurred_at, id=tx_id)
+
+
+@dataclass(frozen=True)
+class SyncWatermark:
+    # Last (updated_at, entity, id) key a client has received from GET /sync.
+    updated_at: datetime
+    entity: str = ""
+    id: str = "00000000-0000-0000-0000-000000000000"
+
+
+def encode_watermark(watermark: SyncWatermark) -> str:
+    raw = json.dumps(
+        {"u": watermark.updated_at.isoformat(), "e": watermark.entity, "i": watermark.id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_watermark(value: str) -> SyncWatermark:
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        updated_at = datetime.fromisoformat(payload["u"])
+        entity = str(payload["e"])
+        row_id = str(payload["i"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise AppException(
+            status_code=400,
+            code="INVALID_WATERMARK",
+            message="Sync watermark is invalid.",
+        ) from exc
+
+    if updated_at.tzinfo is None or not row_id:
+        raise AppException(
+            status_code=400,
+            code="INVALID_WATERMARK",
+            message="Sync watermark is invalid.",
+        )
+    return SyncWatermark(updated_at=updated_at, entity=entity, id=row_id)
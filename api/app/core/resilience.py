@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from app.core import deadline
+from app.core.bulkhead import Bulkhead
+from app.core.config import Settings
+from app.core.exceptions import AppException
+
+logger = logging.getLogger("billetera.upstream")
+
+RETRYABLE_STATUS = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    # Total attempts, the first one included.
+    attempts: int = 3
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 1.0
+
+    def delay(self, retry: int) -> float:
+        # Full jitter: retries from many workers spread out instead of
+        # hitting a recovering upstream in lockstep.
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2**retry)
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    # closed -> open after `failure_threshold` consecutive failures; open ->
+    # half_open once `reset_seconds` have passed, letting a single probe
+    # through; the probe closes it again or re-opens it.
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == "open" and self._clock() - self._opened_at >= self._reset_seconds:
+            return "half_open"
+        return self._state
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._probing:
+            self._state = "half_open"
+            self._probing = True
+            return
+        self.rejected += 1
+        raise AppException(
+            status_code=503,
+            code="UPSTREAM_CIRCUIT_OPEN",
+            message=f"Supabase {self.name} is temporarily unavailable.",
+            details={"upstream": self.name, "retry_after_seconds": self.retry_after()},
+            headers={"Retry-After": str(self.retry_after())},
+        )
+
+    def record_success(self) -> None:
+        self._state = "closed"
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == "half_open" or self._failures >= self._failure_threshold:
+            if self._state != "open":
+                self.opened += 1
+                logger.warning("circuit_open upstream=%s failures=%s", self.name, self._failures)
+            self._state = "open"
+            self._opened_at = self._clock()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        # The probe ended without an answer (cancelled); the next call probes.
+        self._probing = False
+
+    def retry_after(self) -> int:
+        if self._state != "open":
+            return 1
+        remaining = self._reset_seconds - (self._clock() - self._opened_at)
+        return max(1, int(remaining + 0.999))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class Upstream:
+    # Every request to one Supabase service (rest, auth) goes through here:
+    # a bulkhead per operation class caps concurrency, the breaker fails fast
+    # while the service is down, and idempotent requests are retried on
+    # gateway errors and connect failures.
+    def __init__(
+        self,
+        name: str,
+        *,
+        retry: RetryPolicy,
+        breaker: CircuitBreaker,
+        timeout_seconds: float | None = None,
+        bulkheads: dict[str, Bulkhead] | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.name = name
+        self.breaker = breaker
+        self.bulkheads = bulkheads or {}
+        self._retry = retry
+        self._timeout = timeout_seconds
+        self._sleep = sleep
+        self.retries = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        name: str,
+        settings: Settings,
+        *,
+        bulkhead_limits: dict[str, int] | None = None,
+    ) -> "Upstream":
+        # Operation classes with a limit of 0 are not bounded.
+        bulkheads = {
+            operation: Bulkhead(
+                f"{name}.{operation}",
+                limit=limit,
+                queue_limit=settings.bulkhead_queue_limit,
+            )
+            for operation, limit in (bulkhead_limits or {}).items()
+            if limit > 0
+        }
+        return cls(
+            name,
+            retry=RetryPolicy(
+                attempts=max(1, settings.upstream_retry_attempts),
+                base_delay_seconds=settings.upstream_retry_base_delay_seconds,
+                max_delay_seconds=settings.upstream_retry_max_delay_seconds,
+            ),
+            breaker=CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                reset_seconds=settings.circuit_breaker_reset_seconds,
+            ),
+            timeout_seconds=settings.request_timeout_seconds,
+            bulkheads=bulkheads,
+        )
+
+    async def send(
+        self,
+        call: Callable[[Any], Awaitable[httpx.Response]],
+        *,
+        idempotent: bool,
+        operation: str | None = None,
+    ) -> httpx.Response:
+        # Without an explicit operation class, idempotent calls count as
+        # reads and the rest as writes. Retries keep the slot, so they never
+        # add load beyond the bulkhead limit.
+        bulkhead = self.bulkheads.get(operation or ("reads" if idempotent else "writes"))
+        if bulkhead is None:
+            return await self._attempts(call, idempotent=idempotent)
+        async with bulkhead.slot():
+            return await self._attempts(call, idempotent=idempotent)
+
+    async def _attempts(
+        self,
+        call: Callable[[Any], Awaitable[httpx.Response]],
+        *,
+        idempotent: bool,
+    ) -> httpx.Response:
+        # `call` receives the httpx timeout for this attempt: the configured
+        # one, or less when the request deadline is closer.
+        attempt = 0
+        while True:
+            timeout = deadline.budget(self._timeout)
+            self.breaker.before_call()
+            try:
+                response = await call(httpx.USE_CLIENT_DEFAULT if timeout is None else timeout)
+            except httpx.TransportError as exc:
+                if isinstance(exc, httpx.TimeoutException) and deadline.expired():
+                    # Cut short by our own budget; says nothing about the upstream.
+                    self.breaker.release_probe()
+                    raise deadline.deadline_exceeded() from exc
+                self.breaker.record_failure()
+                # Only connect failures are retried: the request never left,
+                # while a read timeout means the upstream is already slow.
+                connect_failed = isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+                if (
+                    idempotent
+                    and connect_failed
+                    and attempt + 1 < self._retry.attempts
+                    and await self._backoff(attempt)
+                ):
+                    attempt += 1
+                    continue
+                raise self._transport_error(exc) from exc
+            except BaseException:
+                self.breaker.release_probe()
+                raise
+
+            if response.status_code not in RETRYABLE_STATUS:
+                self.breaker.record_success()
+                return response
+
+            self.breaker.record_failure()
+            if (
+                not idempotent
+                or attempt + 1 >= self._retry.attempts
+                or not await self._backoff(attempt)
+            ):
+                return response
+            attempt += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.breaker.stats(),
+            "retries": self.retries,
+            "bulkheads": {
+                operation: bulkhead.stats() for operation, bulkhead in self.bulkheads.items()
+            },
+        }
+
+    async def _backoff(self, attempt: int) -> bool:
+        delay = self._retry.delay(attempt)
+        left = deadline.remaining()
+        if left is not None and delay >= left:
+            # No budget left for another attempt after the pause.
+            return False
+        self.retries += 1
+        await self._sleep(delay)
+        return True
+
+    def _transport_error(self, exc: httpx.TransportError) -> AppException:
+        if isinstance(exc, httpx.TimeoutException):
+            return AppException(
+                status_code=504,
+                code="UPSTREAM_TIMEOUT",
+                message=f"Supabase {self.name} did not answer in time.",
+                details={"upstream": self.name},
+            )
+        return AppException(
+            status_code=503,
+            code="UPSTREAM_UNAVAILABLE",
+            message=f"Supabase {self.name} is not reachable.",
+            details={"upstream": self.name},
+        )
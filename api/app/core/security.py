@@ -1,43 +1,135 @@
 import asyncio
+import contextlib
+import logging
 import time
 from typing import Any
 
 from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JWKError
 from jose.utils import base64url_decode
 
 from app.clients.supabase_auth import SupabaseAuthClient
+from app.core.cache import TTLCache, hash_key
 from app.core.config import Settings
 from app.core.exceptions import AppException
 
+logger = logging.getLogger("billetera.security")
+
 
 class SupabaseJwtVerifier:
     def __init__(self, settings: Settings, auth_client: SupabaseAuthClient) -> None:
         self._settings = settings
         self._auth_client = auth_client
         self._jwks_by_kid: dict[str, dict[str, Any]] = {}
+        # Key objects are constructed once per JWKS load, not once per request.
+        self._keys_by_kid: dict[str, Key] = {}
         self._jwks_expires_at = 0.0
         self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._last_forced_refresh = 0.0
+        self._forced_refreshes = 0
+        self._forced_refreshes_throttled = 0
+        # Verified claims keyed by token hash; entries expire at the token `exp`.
+        self._verified_tokens: TTLCache[dict[str, Any]] = TTLCache(
+            max_entries=settings.jwt_cache_max_entries,
+            ttl_seconds=settings.jwt_cache_max_ttl_seconds,
+        )
+
+    async def _load_jwks(self) -> None:
+        if not self._jwks_expires_at:
+            async with self._lock:
+                if not self._jwks_expires_at:
+                    await self._refresh_jwks()
+            return
 
-    async def _load_jwks(self, *, force: bool = False) -> None:
-        now = time.time()
-        if not force and self._jwks_by_kid and now < self._jwks_expires_at:
+        # Stale-while-revalidate: current keys keep serving requests while a
+        # background task fetches the next key set ahead of expiry.
+        refresh_at = self._jwks_expires_at - self._settings.jwks_refresh_ahead_seconds
+        if time.time() >= refresh_at:
+            self._schedule_refresh()
+
+    async def _refresh_jwks(self) -> None:
+        payload = await self._auth_client.get_jwks()
+        keys = payload.get("keys", [])
+        jwks_by_kid = {
+            key["kid"]: key for key in keys if isinstance(key, dict) and key.get("kid")
+        }
+        keys_by_kid: dict[str, Key] = {}
+        for kid, key_data in jwks_by_kid.items():
+            try:
+                keys_by_kid[kid] = jwk.construct(key_data)
+            except JWKError:
+                logger.warning("jwks_key_skipped kid=%s alg=%s", kid, key_data.get("alg"))
+
+        # A removed or replaced key invalidates every token verified with it.
+        if any(jwks_by_kid.get(kid) != key for kid, key in self._jwks_by_kid.items()):
+            self._verified_tokens.clear()
+        self._jwks_by_kid = jwks_by_kid
+        self._keys_by_kid = keys_by_kid
+        self._jwks_expires_at = time.time() + self._settings.jwks_cache_ttl_seconds
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
             return
+        self._refresh_task = asyncio.create_task(self._background_refresh())
 
-        async with self._lock:
-            now = time.time()
-            if not force and self._jwks_by_kid and now < self._jwks_expires_at:
+    async def _background_refresh(self) -> None:
+        try:
+            async with self._lock:
+                await self._refresh_jwks()
+        except Exception:
+            logger.warning("jwks_background_refresh_failed", exc_info=True)
+            # Keep serving the current keys and retry later instead of on
+            # every request while the auth server is unavailable.
+            self._jwks_expires_at = (
+                time.time()
+                + self._settings.jwks_refresh_ahead_seconds
+                + self._settings.jwks_forced_refresh_min_interval_seconds
+            )
+
+    async def _force_refresh(self) -> None:
+        if self._lock.locked():
+            # A refresh is already in flight; wait for it instead of starting another.
+            async with self._lock:
                 return
 
-            payload = await self._auth_client.get_jwks()
-            keys = payload.get("keys", [])
-            self._jwks_by_kid = {
-                key["kid"]: key for key in keys if isinstance(key, dict) and key.get("kid")
-            }
-            self._jwks_expires_at = now + self._settings.jwks_cache_ttl_seconds
+        now = time.monotonic()
+        min_interval = self._settings.jwks_forced_refresh_min_interval_seconds
+        if self._forced_refreshes and now - self._last_forced_refresh < min_interval:
+            self._forced_refreshes_throttled += 1
+            return
+
+        async with self._lock:
+            self._last_forced_refresh = now
+            self._forced_refreshes += 1
+            await self._refresh_jwks()
+
+    async def aclose(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
 
     async def verify_access_token(self, token: str) -> dict[str, Any]:
         await self._load_jwks()
-        return await self._verify(token)
+
+        cache_key = hash_key(token)
+        cached = self._verified_tokens.get(cache_key)
+        if cached is not None:
+            return cached
+
+        claims = await self._verify(token)
+        self._verified_tokens.set(cache_key, claims, expires_at=float(claims["exp"]))
+        return claims
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "verified_token_cache": self._verified_tokens.stats(),
+            "jwks_keys": len(self._keys_by_kid),
+            "jwks_forced_refreshes": self._forced_refreshes,
+            "jwks_forced_refreshes_throttled": self._forced_refreshes_throttled,
+        }
 
     async def _verify(self, token: str) -> dict[str, Any]:
         try:
@@ -60,24 +152,23 @@ class SupabaseJwtVerifier:
                 message="Token header is missing kid/alg.",
             )
 
-        jwk_data = self._jwks_by_kid.get(kid)
-        if not jwk_data:
-            await self._load_jwks(force=True)
-            jwk_data = self._jwks_by_kid.get(kid)
-            if not jwk_data:
+        key = self._keys_by_kid.get(kid)
+        if key is None:
+            await self._force_refresh()
+            key = self._keys_by_kid.get(kid)
+            if key is None:
                 raise AppException(
                     status_code=401,
                     code="UNKNOWN_KEY_ID",
                     message="Token key id is unknown.",
                 )
 
-        self._verify_signature(token, jwk_data)
+        self._verify_signature(token, key)
         self._verify_claims(claims)
         return claims
 
     @staticmethod
-    def _verify_signature(token: str, key_data: dict[str, Any]) -> None:
-        key = jwk.construct(key_data)
+    def _verify_signature(token: str, key: Key) -> None:
         message, encoded_signature = token.rsplit(".", 1)
         decoded_signature = base64url_decode(encoded_signature.encode("utf-8"))
         if not key.verify(message.encode("utf-8"), decoded_signature):
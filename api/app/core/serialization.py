@@ -0,0 +1,45 @@
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.core.exceptions import AppException
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[M]) -> TypeAdapter[list[M]]:
+    # Building an adapter compiles its validator and serializer; do it once
+    # per model instead of once per request.
+    return TypeAdapter(list[model])
+
+
+def validate_json_list(model: type[M], raw: bytes) -> list[M]:
+    # Raw upstream bytes straight into models, without an intermediate
+    # list of dicts from response.json().
+    try:
+        return list_adapter(model).validate_json(raw)
+    except ValidationError as exc:
+        raise AppException(
+            status_code=500,
+            code="INVALID_SUPABASE_RESPONSE",
+            message="Supabase rest returned invalid payload.",
+            details=exc.errors(include_url=False, include_input=False),
+        ) from exc
+
+
+def json_list_response(
+    model: type[M],
+    items: list[M],
+    *,
+    headers: dict[str, Any] | None = None,
+) -> Response:
+    # Returning a Response makes FastAPI skip response_model validation and
+    # jsonable_encoder; the route keeps response_model for the OpenAPI schema.
+    return Response(
+        content=list_adapter(model).dump_json(items),
+        media_type="application/json",
+        headers=headers,
+    )
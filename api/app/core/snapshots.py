@@ -0,0 +1,73 @@
+import logging
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from app.core.cache import CacheBackend, TTLCache
+
+logger = logging.getLogger("billetera.cache")
+
+class AssetSnapshotCache:
+    # Per-user list bodies of wallets, bank accounts and cards, stored under
+    # the user's current version token. A write replaces the token instead
+    # of deleting entries, so a read that raced with the write can only fill
+    # a version nobody looks up any more, and the next read after the write
+    # always reloads from the database. Only correct across workers when the
+    # backend is shared (redis); the container enforces that.
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 10_000,
+    ) -> None:
+        self._backend = backend
+        # Users whose version could not be moved: read straight from the
+        # database here until whatever they had cached has expired. Sized like
+        # the snapshot store so a bypassed user is not evicted while stale
+        # entries may still be there.
+        self._bypass: TTLCache[bool] = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get_or_load(
+        self,
+        *,
+        user_id: str,
+        kind: str,
+        load: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        if self._bypass.get(user_id):
+            return await load()
+        version = await self._version(user_id)
+        key = f"{user_id}:{version}:{kind}"
+        cached = await self._backend.get(key)
+        if cached is not None:
+            return cached
+
+        raw = await load()
+        await self._backend.set(key, raw)
+        return raw
+
+    async def bump(self, user_id: str) -> None:
+        key = f"{user_id}:version"
+        try:
+            await self._backend.set(key, uuid4().hex.encode("ascii"), strict=True)
+            return
+        except Exception:
+            logger.warning("Could not move the asset snapshot version of a user", exc_info=True)
+        try:
+            # Without a version key the next read starts a fresh one.
+            await self._backend.delete(key, strict=True)
+        except Exception:
+            logger.error("Could not drop the asset snapshot version of a user", exc_info=True)
+        self._bypass.set(user_id, True)
+
+    def stats(self) -> dict[str, int]:
+        return self._backend.stats()
+
+    async def _version(self, user_id: str) -> str:
+        # Read before the load: entries can only be filed under a version
+        # that existed when their data was read.
+        version = await self._backend.get(f"{user_id}:version")
+        if version is None:
+            version = uuid4().hex.encode("ascii")
+            await self._backend.set(f"{user_id}:version", version)
+        return version.decode("ascii")
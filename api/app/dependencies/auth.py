@@ -1,84 +1,108 @@
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.clients.data import DataClient
 from app.clients.supabase_auth import SupabaseAuthClient
-from app.clients.supabase_rest import SupabaseRestClient
 from app.core.config import Settings, get_settings
 from app.core.exceptions import AppException
 from app.core.security import SupabaseJwtVerifier
+from app.dependencies.container import AppContainer
+from app.services.amortization_service import AmortizationService
 from app.services.auth_service import AuthService
 from app.services.bank_account_service import BankAccountService
+from app.services.bootstrap_service import BootstrapService
+from app.services.budget_service import BudgetService
 from app.services.cash_wallet_service import CashWalletService
 from app.services.profile_service import ProfileService
 from app.services.credit_card_service import CreditCardService
+from app.services.dashboard_service import DashboardService
 from app.services.category_service import CategoryService
+from app.services.sync_service import SyncService
 from app.services.transaction_service import TransactionService
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
-_jwt_verifier: SupabaseJwtVerifier | None = None
 
+def get_container(request: Request) -> AppContainer:
+    return request.app.state.container
 
-def get_auth_client(settings: Settings = Depends(get_settings)) -> SupabaseAuthClient:
-    return SupabaseAuthClient(settings)
 
+def get_auth_client(container: AppContainer = Depends(get_container)) -> SupabaseAuthClient:
+    return container.auth_client
 
-def get_rest_client(settings: Settings = Depends(get_settings)) -> SupabaseRestClient:
-    return SupabaseRestClient(settings)
 
+def get_rest_client(container: AppContainer = Depends(get_container)) -> DataClient:
+    return container.rest_client
 
-def get_auth_service(
-    auth_client: SupabaseAuthClient = Depends(get_auth_client),
-) -> AuthService:
-    return AuthService(auth_client)
 
+def get_auth_service(container: AppContainer = Depends(get_container)) -> AuthService:
+    return container.auth_service
 
-def get_profile_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
-) -> ProfileService:
-    return ProfileService(rest_client)
+
+def get_profile_service(container: AppContainer = Depends(get_container)) -> ProfileService:
+    return container.profile_service
 
 
 def get_cash_wallet_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
+    container: AppContainer = Depends(get_container),
 ) -> CashWalletService:
-    return CashWalletService(rest_client)
+    return container.cash_wallet_service
 
 
 def get_bank_account_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
+    container: AppContainer = Depends(get_container),
 ) -> BankAccountService:
-    return BankAccountService(rest_client)
+    return container.bank_account_service
 
 
 def get_credit_card_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
+    container: AppContainer = Depends(get_container),
 ) -> CreditCardService:
-    return CreditCardService(rest_client)
+    return container.credit_card_service
 
 
-def get_category_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
-) -> CategoryService:
-    return CategoryService(rest_client)
+def get_category_service(container: AppContainer = Depends(get_container)) -> CategoryService:
+    return container.category_service
 
 
 def get_transaction_service(
-    rest_client: SupabaseRestClient = Depends(get_rest_client),
+    container: AppContainer = Depends(get_container),
 ) -> TransactionService:
-    return TransactionService(rest_client)
+    return container.transaction_service
 
 
-def get_jwt_verifier(
-    settings: Settings = Depends(get_settings),
-    auth_client: SupabaseAuthClient = Depends(get_auth_client),
-) -> SupabaseJwtVerifier:
-    global _jwt_verifier
-    if _jwt_verifier is None:
-        _jwt_verifier = SupabaseJwtVerifier(settings=settings, auth_client=auth_client)
-    return _jwt_verifier
+def get_bootstrap_service(
+    container: AppContainer = Depends(get_container),
+) -> BootstrapService:
+    return container.bootstrap_service
+
+
+def get_dashboard_service(
+    container: AppContainer = Depends(get_container),
+) -> DashboardService:
+    return container.dashboard_service
+
+
+def get_budget_service(container: AppContainer = Depends(get_container)) -> BudgetService:
+    return container.budget_service
+
+
+def get_amortization_service(
+    container: AppContainer = Depends(get_container),
+) -> AmortizationService:
+    return container.amortization_service
+
+
+def get_sync_service(container: AppContainer = Depends(get_container)) -> SyncService:
+    return container.sync_service
+
+
+def get_jwt_verifier(container: AppContainer = Depends(get_container)) -> SupabaseJwtVerifier:
+    return container.jwt_verifier
 
 
 @dataclass
@@ -89,8 +113,37 @@ class AuthContext:
     last_sign_in_at: str | None = None
 
 
+def build_auth_context_from_claims(token: str, claims: dict[str, Any]) -> AuthContext:
+    user_id = str(claims.get("sub") or "")
+    email = str(claims.get("email") or "")
+    if not user_id or not email:
+        raise AppException(
+            status_code=401,
+            code="INVALID_TOKEN_CLAIMS",
+            message="Token is missing sub/email claims.",
+        )
+
+    # Supabase records one `amr` entry per authentication method; the most
+    # recent timestamp is the last sign-in of this session.
+    timestamps = [
+        int(entry["timestamp"])
+        for entry in claims.get("amr") or []
+        if isinstance(entry, dict) and isinstance(entry.get("timestamp"), int)
+    ]
+    last_sign_in_at = (
+        datetime.fromtimestamp(max(timestamps), tz=UTC).isoformat() if timestamps else None
+    )
+    return AuthContext(
+        user_id=user_id,
+        access_token=token,
+        email=email,
+        last_sign_in_at=last_sign_in_at,
+    )
+
+
 async def get_auth_context(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    settings: Settings = Depends(get_settings),
     auth_service: AuthService = Depends(get_auth_service),
     verifier: SupabaseJwtVerifier = Depends(get_jwt_verifier),
 ) -> AuthContext:
@@ -103,6 +156,9 @@ async def get_auth_context(
 
     token = credentials.credentials
     claims = await verifier.verify_access_token(token)
+    if settings.auth_verification_mode == "local":
+        return build_auth_context_from_claims(token, claims)
+
     user = await auth_service.me(access_token=token)
 
     claim_sub = str(claims.get("sub", ""))
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from psycopg_pool import AsyncConnectionPool
+
+from app.clients.data import DataClient
+from app.clients.http import build_http_client
+from app.clients.postgres import PostgresRepository, build_postgres_pool
+from app.clients.redis_client import build_redis_client
+from app.clients.supabase_auth import SupabaseAuthClient
+from app.clients.supabase_rest import SupabaseRestClient
+from app.core.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend, TTLCache
+from app.core.config import Settings
+from app.core.idempotency import IdempotencyStore
+from app.core.security import SupabaseJwtVerifier
+from app.core.snapshots import AssetSnapshotCache
+from app.services.amortization_service import AmortizationService
+from app.services.auth_service import AuthService
+from app.services.bank_account_service import BankAccountService
+from app.services.bootstrap_service import BootstrapService
+from app.services.budget_service import BudgetService
+from app.services.cash_wallet_service import CashWalletService
+from app.services.category_service import CategoryService
+from app.services.credit_card_service import CreditCardService
+from app.services.dashboard_service import DashboardService
+from app.services.profile_service import ProfileService
+from app.services.sync_service import SyncService
+from app.services.transaction_service import TransactionService
+
+
+@dataclass
+class AppContainer:
+    settings: Settings
+    rest_http_client: httpx.AsyncClient
+    auth_http_client: httpx.AsyncClient
+    # SupabaseRestClient, or PostgresRepository when DATA_BACKEND=postgres.
+    rest_client: DataClient
+    auth_client: SupabaseAuthClient
+    jwt_verifier: SupabaseJwtVerifier
+    auth_service: AuthService
+    profile_service: ProfileService
+    cash_wallet_service: CashWalletService
+    bank_account_service: BankAccountService
+    credit_card_service: CreditCardService
+    category_service: CategoryService
+    transaction_service: TransactionService
+    bootstrap_service: BootstrapService
+    dashboard_service: DashboardService
+    budget_service: BudgetService
+    amortization_service: AmortizationService
+    sync_service: SyncService
+    db_pool: AsyncConnectionPool | None = None
+    idempotency_store: IdempotencyStore | None = None
+    category_cache: CacheBackend | None = None
+    asset_snapshots: AssetSnapshotCache | None = None
+    redis_client: Any = None
+
+    def metrics(self) -> dict[str, Any]:
+        metrics: dict[str, Any] = {
+            "jwt_verifier": self.jwt_verifier.stats(),
+            "auth_client": self.auth_client.stats(),
+        }
+        if isinstance(self.rest_client, PostgresRepository):
+            metrics["postgres_pool"] = self.rest_client.stats()
+        else:
+            metrics["rest_client"] = self.rest_client.stats()
+        if self.idempotency_store is not None:
+            metrics["idempotency"] = self.idempotency_store.stats()
+        if self.category_cache is not None:
+            metrics["category_cache"] = self.category_cache.stats()
+        if self.asset_snapshots is not None:
+            metrics["asset_snapshots"] = self.asset_snapshots.stats()
+        return metrics
+
+    async def open(self) -> None:
+        if self.db_pool is not None:
+            await self.db_pool.open()
+
+    async def aclose(self) -> None:
+        await self.jwt_verifier.aclose()
+        if self.db_pool is not None:
+            await self.db_pool.close()
+        if self.redis_client is not None:
+            await self.redis_client.aclose()
+        await self.rest_http_client.aclose()
+        await self.auth_http_client.aclose()
+
+
+def _cache_backend(
+    redis_client: Any,
+    namespace: str,
+    *,
+    max_entries: int,
+    ttl_seconds: float,
+) -> CacheBackend | None:
+    if ttl_seconds <= 0:
+        return None
+    if redis_client is not None:
+        return RedisCacheBackend(redis_client, namespace=namespace, ttl_seconds=ttl_seconds)
+    return MemoryCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+
+def build_container(settings: Settings) -> AppContainer:
+    rest_http_client = build_http_client(
+        settings,
+        max_connections=settings.rest_max_connections,
+        max_keepalive_connections=settings.rest_max_keepalive_connections,
+    )
+    auth_http_client = build_http_client(
+        settings,
+        max_connections=settings.auth_max_connections,
+        max_keepalive_connections=settings.auth_max_keepalive_connections,
+    )
+    db_pool: AsyncConnectionPool | None = None
+    rest_client: DataClient
+    if settings.data_backend == "postgres":
+        db_pool = build_postgres_pool(settings)
+        rest_client = PostgresRepository(settings, pool=db_pool)
+    else:
+        rest_client = SupabaseRestClient(settings, http_client=rest_http_client)
+    auth_client = SupabaseAuthClient(settings, http_client=auth_http_client)
+
+    user_cache: TTLCache | None = None
+    if settings.auth_user_cache_ttl_seconds > 0:
+        user_cache = TTLCache(
+            max_entries=settings.auth_user_cache_max_entries,
+            ttl_seconds=settings.auth_user_cache_ttl_seconds,
+        )
+
+    idempotency_store: IdempotencyStore | None = None
+    if settings.idempotency_ttl_seconds > 0:
+        idempotency_store = IdempotencyStore(
+            cache=TTLCache(
+                max_entries=settings.idempotency_max_entries,
+                ttl_seconds=settings.idempotency_ttl_seconds,
+            ),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+            rest_client=rest_client,
+            durable=settings.idempotency_durable,
+            lock_seconds=settings.idempotency_lock_seconds,
+        )
+
+    redis_client = build_redis_client(settings) if settings.cache_backend == "redis" else None
+    category_cache = _cache_backend(
+        redis_client,
+        "categories",
+        max_entries=settings.category_cache_max_entries,
+        ttl_seconds=settings.category_cache_ttl_seconds,
+    )
+    asset_snapshots: AssetSnapshotCache | None = None
+    asset_cache = _cache_backend(
+        redis_client,
+        "assets",
+        max_entries=settings.asset_cache_max_entries,
+        ttl_seconds=settings.asset_cache_ttl_seconds,
+    )
+    # Per-process versions are only correct when one process serves all.
+    shared = redis_client is not None or settings.asset_cache_single_worker
+    if asset_cache is not None and shared:
+        asset_snapshots = AssetSnapshotCache(
+            asset_cache,
+            ttl_seconds=settings.asset_cache_ttl_seconds,
+            max_entries=settings.asset_cache_max_entries,
+        )
+
+    profile_service = ProfileService(rest_client)
+    cash_wallet_service = CashWalletService(rest_client, snapshots=asset_snapshots)
+    bank_account_service = BankAccountService(rest_client, snapshots=asset_snapshots)
+    credit_card_service = CreditCardService(rest_client, snapshots=asset_snapshots)
+    category_service = CategoryService(rest_client, cache=category_cache)
+    budget_service = BudgetService(rest_client)
+
+    return AppContainer(
+        settings=settings,
+        rest_http_client=rest_http_client,
+        auth_http_client=auth_http_client,
+        rest_client=rest_client,
+        auth_client=auth_client,
+        jwt_verifier=SupabaseJwtVerifier(settings=settings, auth_client=auth_client),
+        auth_service=AuthService(auth_client, user_cache=user_cache),
+        profile_service=profile_service,
+        cash_wallet_service=cash_wallet_service,
+        bank_account_service=bank_account_service,
+        credit_card_service=credit_card_service,
+        category_service=category_service,
+        transaction_service=TransactionService(
+            rest_client,
+            budget_service=budget_service,
+            idempotency=idempotency_store,
+            snapshots=asset_snapshots,
+        ),
+        bootstrap_service=BootstrapService(
+            profile_service=profile_service,
+            cash_wallet_service=cash_wallet_service,
+            bank_account_service=bank_account_service,
+            credit_card_service=credit_card_service,
+            category_service=category_service,
+        ),
+        dashboard_service=DashboardService(rest_client),
+        budget_service=budget_service,
+        amortization_service=AmortizationService(),
+        sync_service=SyncService(rest_client),
+        db_pool=db_pool,
+        idempotency_store=idempotency_store,
+        category_cache=category_cache,
+        asset_snapshots=asset_snapshots,
+        redis_client=redis_client,
+    )
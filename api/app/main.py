@@ -1,12 +1,33 @@
-from fastapi import FastAPI
+import hmac
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import Depends, FastAPI, Header
 
 from app.api.v1.router import api_v1_router
 from app.core.config import get_settings
-from app.core.exceptions import register_exception_handlers
+from app.core.exceptions import AppException, register_exception_handlers
 from app.core.logging import configure_logging
+from app.dependencies.auth import get_container
+from app.dependencies.container import AppContainer, build_container
+from app.middleware.deadline import RequestDeadlineMiddleware
 from app.middleware.request_context import RequestContextMiddleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Clients, verifier and services are built once per process and shared
+    # by every request through the dependencies in app.dependencies.auth.
+    container = build_container(get_settings())
+    app.state.container = container
+    try:
+        await container.open()
+        yield
+    finally:
+        await container.aclose()
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(settings.log_level)
@@ -15,8 +36,11 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         version=settings.app_version,
         description="Backend API for billeteraMobile.",
+        lifespan=lifespan,
     )
 
+    # Added last, so it wraps the deadline and stamps 504s with a request id.
+    app.add_middleware(RequestDeadlineMiddleware, seconds=settings.request_deadline_seconds)
     app.add_middleware(RequestContextMiddleware)
     register_exception_handlers(app)
 
@@ -30,8 +54,23 @@ def create_app() -> FastAPI:
     def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", tags=["meta"])
+        def metrics(
+            container: AppContainer = Depends(get_container),
+            metrics_token: str | None = Header(default=None, alias="X-Metrics-Token"),
+        ) -> dict[str, Any]:
+            expected = settings.metrics_token
+            if expected and not hmac.compare_digest((metrics_token or "").encode(), expected.encode()):
+                raise AppException(
+                    status_code=401,
+                    code="METRICS_UNAUTHORIZED",
+                    message="A valid X-Metrics-Token header is required.",
+                )
+            return container.metrics()
+
     return app
 
 
 app = create_app()
-
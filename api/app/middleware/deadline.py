@@ -0,0 +1,60 @@
+import asyncio
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import deadline
+from app.core.exceptions import error_response
+
+DEADLINE_HEADER = "x-request-timeout"
+
+
+class RequestDeadlineMiddleware:
+    # Every request gets `seconds` to produce its response, or less when the
+    # client sends X-Request-Timeout (seconds) because it gives up earlier.
+    # Upstream calls only get what is left (app.core.deadline) and the
+    # handler is cancelled with 504 once it runs out, so requests nobody waits
+    # for stop holding connections. Once the response has started the budget
+    # is lifted: streamed exports legitimately outlive it. Services lift it
+    # too once a write has returned (app.core.deadline.lift).
+    def __init__(self, app: ASGIApp, *, seconds: float) -> None:
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        seconds = self._budget(Headers(scope=scope).get(DEADLINE_HEADER))
+        current, token = deadline.start(seconds)
+        response_started = False
+
+        try:
+            async with asyncio.timeout(seconds) as timer:
+                current.timer = timer
+
+                async def send_with_deadline(message: Message) -> None:
+                    nonlocal response_started
+                    if message["type"] == "http.response.start":
+                        response_started = True
+                        current.clear()
+                    await send(message)
+
+                await self.app(scope, receive, send_with_deadline)
+        except TimeoutError:
+            if response_started or not timer.expired():
+                raise
+            response = error_response(deadline.deadline_exceeded())
+            await response(scope, receive, send)
+        finally:
+            deadline.reset(token)
+
+    def _budget(self, requested: str | None) -> float:
+        try:
+            value = float(requested) if requested else 0.0
+        except ValueError:
+            value = 0.0
+        if 0 < value < self.seconds:
+            return value
+        return self.seconds
@@ -2,31 +2,47 @@ import logging
 import time
 import uuid
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("billetera.request")
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
+class RequestContextMiddleware:
+    # Raw ASGI middleware: unlike BaseHTTPMiddleware it does not spawn a task
+    # or wrap the response stream per request, so streaming bodies pass through.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id")
+        if request_id is None:
+            request_id = str(uuid.uuid4())
         started = time.perf_counter()
+        status_code = 0
+        elapsed_ms = 0.0
 
-        response = await call_next(request)
+        async def send_with_context(message: Message) -> None:
+            nonlocal status_code, elapsed_ms
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers["x-request-id"] = request_id
+                headers["x-response-time-ms"] = f"{elapsed_ms:.2f}"
+            await send(message)
 
-        elapsed_ms = (time.perf_counter() - started) * 1000
-        response.headers["x-request-id"] = request_id
-        response.headers["x-response-time-ms"] = f"{elapsed_ms:.2f}"
+        await self.app(scope, receive, send_with_context)
 
         logger.info(
             "request_id=%s method=%s path=%s status=%s elapsed_ms=%.2f",
             request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
+            scope["method"],
+            scope["path"],
+            status_code,
             elapsed_ms,
         )
-        return response
-
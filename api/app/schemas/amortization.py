@@ -0,0 +1,45 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class ExtraPayment(BaseModel):
+    installment: int = Field(ge=1, description="Applied right after this installment is paid")
+    amount: float = Field(gt=0)
+
+
+class AmortizationScheduleRequest(BaseModel):
+    principal: float = Field(gt=0)
+    annual_rate: float = Field(ge=0, le=1000, description="Nominal annual rate, in percent")
+    periods: int = Field(ge=1, le=50_000)
+    method: str = Field(default="french", pattern="^(french|german|american)$")
+    periodicity: str = Field(default="monthly", pattern="^(monthly|biweekly|weekly|daily)$")
+    start_date: date | None = None
+    extra_payments: list[ExtraPayment] = Field(default_factory=list, max_length=1000)
+    extra_payment_strategy: str = Field(
+        default="reduce_term",
+        pattern="^(reduce_term|reduce_payment)$",
+    )
+
+
+class AmortizationRow(BaseModel):
+    installment: int
+    due_date: date | None = None
+    payment: float
+    interest: float
+    principal: float
+    extra_payment: float
+    balance: float
+
+
+class AmortizationSchedulePage(BaseModel):
+    method: str
+    periods: int
+    payment: float
+    total_interest: float
+    total_extra_payments: float
+    total_paid: float
+    offset: int
+    limit: int
+    next_offset: int | None = None
+    rows: list[AmortizationRow]
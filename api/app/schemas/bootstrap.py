@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from app.schemas.bank_account import BankAccountResponse
+from app.schemas.cash_wallet import CashWalletResponse
+from app.schemas.category import CategoryResponse
+from app.schemas.credit_card import CreditCardResponse
+from app.schemas.profile import ProfileResponse
+
+
+class BootstrapResponse(BaseModel):
+    profile: ProfileResponse
+    cash_wallets: list[CashWalletResponse]
+    bank_accounts: list[BankAccountResponse]
+    credit_cards: list[CreditCardResponse]
+    categories: list[CategoryResponse]
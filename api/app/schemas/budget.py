@@ -0,0 +1,39 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel, Field
+
+
+class BudgetCreateRequest(BaseModel):
+    category_id: str = Field(min_length=1)
+    amount: float = Field(gt=0)
+    currency: str = Field(default="USD", min_length=3, max_length=3)
+
+
+class BudgetUpdateRequest(BaseModel):
+    amount: float | None = Field(default=None, gt=0)
+
+
+class BudgetResponse(BaseModel):
+    id: str
+    category_id: str
+    amount: float
+    currency: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class BudgetStatusResponse(BudgetResponse):
+    month: date
+    spent: float
+    remaining: float
+    percent_used: float
+
+
+class BudgetAlertResponse(BaseModel):
+    id: str
+    budget_id: str
+    month: date
+    threshold: int
+    spent: float
+    amount: float
+    created_at: datetime
@@ -0,0 +1,38 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class CurrencyBalance(BaseModel):
+    currency: str
+    cash: float
+    bank: float
+    assets: float
+    debts: float
+    net_worth: float
+
+
+class KindTotal(BaseModel):
+    kind: str
+    currency: str
+    total: float
+    count: int
+
+
+class CategoryTotal(BaseModel):
+    category_id: str | None = None
+    kind: str
+    currency: str
+    total: float
+    count: int
+
+
+class MonthSummary(BaseModel):
+    month: date
+    by_kind: list[KindTotal]
+    top_expense_categories: list[CategoryTotal]
+
+
+class DashboardResponse(BaseModel):
+    balances: list[CurrencyBalance]
+    month_summary: MonthSummary
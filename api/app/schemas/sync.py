@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.bank_account import BankAccountResponse
+from app.schemas.cash_wallet import CashWalletResponse
+from app.schemas.category import CategoryResponse
+from app.schemas.credit_card import CreditCardResponse
+from app.schemas.transaction import TransactionResponse
+
+
+class SyncTombstone(BaseModel):
+    entity: str
+    id: str
+    deleted_at: datetime
+
+
+class SyncResponse(BaseModel):
+    cash_wallets: list[CashWalletResponse]
+    bank_accounts: list[BankAccountResponse]
+    credit_cards: list[CreditCardResponse]
+    categories: list[CategoryResponse]
+    transactions: list[TransactionResponse]
+    deleted: list[SyncTombstone]
+    # Opaque; pass it back as `since` on the next call.
+    watermark: str
+    has_more: bool
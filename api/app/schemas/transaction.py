@@ -2,6 +2,8 @@ import re
 from datetime import UTC, datetime
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from app.schemas.common import ErrorResponse
+
 UUID_PATTERN = re.compile(
     r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[1-5][0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$",
 )
@@ -144,3 +146,18 @@ class TransactionResponse(BaseModel):
     target_bank_account_id: str | None = None
     created_at: datetime
     updated_at: datetime
+
+class TransactionBatchCreateRequest(BaseModel):
+    items: list[TransactionCreateRequest] = Field(min_length=1, max_length=200)
+    all_or_nothing: bool = False
+
+class TransactionBatchItemResult(BaseModel):
+    index: int
+    status: str
+    transaction: TransactionResponse | None = None
+    error: ErrorResponse | None = None
+
+class TransactionBatchCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[TransactionBatchItemResult]
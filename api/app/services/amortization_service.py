@@ -0,0 +1,294 @@
+import calendar
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.core.exceptions import AppException
+from app.schemas.amortization import (
+    AmortizationRow,
+    AmortizationSchedulePage,
+    AmortizationScheduleRequest,
+)
+
+PERIODS_PER_YEAR = {"monthly": 12, "biweekly": 26, "weekly": 52, "daily": 365}
+_PERIOD_DAYS = {"biweekly": 14, "weekly": 7, "daily": 1}
+_PAID_OFF = 0.005
+
+
+@dataclass(frozen=True)
+class _Segment:
+    # Installments [start, stop) share one closed form. A new segment begins
+    # after every extra payment; earlier segments are never recomputed.
+    start: int
+    stop: int
+    balance: float
+    term: int
+    level: float
+
+
+@dataclass(frozen=True)
+class AmortizationPlan:
+    method: str
+    rate: float
+    segments: tuple[_Segment, ...]
+    extra_installments: np.ndarray
+    extra_amounts: np.ndarray
+
+    @property
+    def periods(self) -> int:
+        return self.segments[-1].stop
+
+
+@dataclass(frozen=True)
+class ScheduleArrays:
+    installment: np.ndarray
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    extra_payment: np.ndarray
+    balance: np.ndarray
+
+
+def build_plan(request: AmortizationScheduleRequest) -> AmortizationPlan:
+    # O(number of extra payments): each one only needs the closed-form
+    # balance at its installment to open the next segment.
+    method = request.method
+    rate = request.annual_rate / 100 / PERIODS_PER_YEAR[request.periodicity]
+    total_periods = request.periods
+
+    extras: dict[int, float] = {}
+    for extra in request.extra_payments:
+        if extra.installment < total_periods:
+            extras[extra.installment] = extras.get(extra.installment, 0.0) + extra.amount
+
+    segments: list[_Segment] = []
+    applied_installments: list[int] = []
+    applied_amounts: list[float] = []
+
+    start = 0
+    balance = request.principal
+    term = total_periods
+    level = _level(method, balance, rate, term)
+    paid_off = False
+    for installment in sorted(extras):
+        if installment >= start + term:
+            break
+        segment = _Segment(start=start, stop=installment, balance=balance, term=term, level=level)
+        segments.append(segment)
+
+        closing = float(_balance(method, rate, segment, np.array([installment - start]))[0])
+        applied = min(extras[installment], closing)
+        applied_installments.append(installment)
+        applied_amounts.append(applied)
+
+        start = installment
+        balance = closing - applied
+        if balance <= _PAID_OFF:
+            paid_off = True
+            break
+        if method == "american" or request.extra_payment_strategy == "reduce_payment":
+            term = total_periods - start
+            level = _level(method, balance, rate, term)
+        else:
+            term = _periods_to_payoff(method, balance, rate, level)
+
+    if not paid_off:
+        segments.append(_Segment(start=start, stop=start + term, balance=balance, term=term, level=level))
+
+    return AmortizationPlan(
+        method=method,
+        rate=rate,
+        segments=tuple(segments),
+        extra_installments=np.array(applied_installments, dtype=np.int64),
+        extra_amounts=np.array(applied_amounts, dtype=np.float64),
+    )
+
+
+def schedule_arrays(plan: AmortizationPlan, start: int, stop: int) -> ScheduleArrays:
+    # Rows [start, stop) only: cost is proportional to the page, not to the
+    # length of the loan.
+    count = stop - start
+    opening = np.empty(count, dtype=np.float64)
+    closing = np.empty(count, dtype=np.float64)
+    for segment in plan.segments:
+        lo = max(start, segment.start)
+        hi = min(stop, segment.stop)
+        if lo >= hi:
+            continue
+        # Balances after installments lo..hi of the segment: consecutive
+        # entries are each row's opening and closing balance.
+        local = np.arange(lo - segment.start, hi - segment.start + 1, dtype=np.int64)
+        balances = _balance(plan.method, plan.rate, segment, local)
+        opening[lo - start : hi - start] = balances[:-1]
+        closing[lo - start : hi - start] = balances[1:]
+
+    installment = np.arange(start + 1, stop + 1, dtype=np.int64)
+    interest = opening * plan.rate
+    principal = opening - closing
+    extra = np.zeros(count, dtype=np.float64)
+    if plan.extra_installments.size:
+        slot = np.searchsorted(plan.extra_installments, installment)
+        slot = np.minimum(slot, plan.extra_installments.size - 1)
+        hit = plan.extra_installments[slot] == installment
+        extra[hit] = plan.extra_amounts[slot[hit]]
+
+    return ScheduleArrays(
+        installment=installment,
+        payment=principal + interest,
+        interest=interest,
+        principal=principal,
+        extra_payment=extra,
+        balance=np.maximum(closing - extra, 0.0),
+    )
+
+
+def total_interest(plan: AmortizationPlan) -> float:
+    return sum(_segment_interest(plan.method, plan.rate, segment) for segment in plan.segments)
+
+
+class AmortizationService:
+    def schedule_page(
+        self,
+        *,
+        request: AmortizationScheduleRequest,
+        offset: int = 0,
+        limit: int = 120,
+    ) -> AmortizationSchedulePage:
+        plan = build_plan(request)
+        periods = plan.periods
+        stop = min(offset + limit, periods)
+        arrays = schedule_arrays(plan, min(offset, periods), stop)
+
+        due_dates = _due_dates(request.start_date, request.periodicity, arrays.installment)
+        rows = [
+            AmortizationRow(
+                installment=int(installment),
+                due_date=due_date,
+                payment=payment,
+                interest=interest,
+                principal=principal,
+                extra_payment=extra_payment,
+                balance=balance,
+            )
+            for installment, due_date, payment, interest, principal, extra_payment, balance in zip(
+                arrays.installment.tolist(),
+                due_dates,
+                np.round(arrays.payment, 2).tolist(),
+                np.round(arrays.interest, 2).tolist(),
+                np.round(arrays.principal, 2).tolist(),
+                np.round(arrays.extra_payment, 2).tolist(),
+                np.round(arrays.balance, 2).tolist(),
+            )
+        ]
+
+        interest = total_interest(plan)
+        first = schedule_arrays(plan, 0, 1)
+        if not (
+            math.isfinite(interest)
+            and np.isfinite(first.payment).all()
+            and np.isfinite(arrays.payment).all()
+            and np.isfinite(arrays.balance).all()
+        ):
+            raise AppException(
+                status_code=422,
+                code="AMORTIZATION_OUT_OF_RANGE",
+                message="The schedule amounts are too large to compute; lower the principal or rate.",
+            )
+        return AmortizationSchedulePage(
+            method=plan.method,
+            periods=periods,
+            payment=round(float(first.payment[0]), 2),
+            total_interest=round(interest, 2),
+            total_extra_payments=round(float(plan.extra_amounts.sum()), 2),
+            total_paid=round(request.principal + interest, 2),
+            offset=offset,
+            limit=limit,
+            next_offset=stop if stop < periods else None,
+            rows=rows,
+        )
+
+
+def _level(method: str, balance: float, rate: float, term: int) -> float:
+    # french: installment amount; german: principal per installment;
+    # american: unused (interest-only until the bullet payment).
+    if method == "french":
+        if rate == 0:
+            return balance / term
+        return balance * rate / (1 - (1 + rate) ** -term)
+    if method == "german":
+        return balance / term
+    return 0.0
+
+
+def _periods_to_payoff(method: str, balance: float, rate: float, level: float) -> int:
+    if method == "french" and rate > 0:
+        periods = -math.log(1 - balance * rate / level) / math.log(1 + rate)
+    else:
+        periods = balance / level
+    return max(1, math.ceil(periods - 1e-9))
+
+
+def _balance(method: str, rate: float, segment: _Segment, local: np.ndarray) -> np.ndarray:
+    # Balance after `local` installments of the segment; the installment that
+    # reaches the term closes the loan exactly (a short last payment when the
+    # term was rounded up).
+    if method == "french":
+        if rate == 0:
+            values = segment.balance - segment.level * local
+        else:
+            # level/rate * (1 - (1+rate)^(k - horizon)): the exponent stays
+            # <= 0 inside the segment, so long loans cannot overflow.
+            horizon = _french_horizon(segment, rate)
+            exponent = (local.astype(np.float64) - horizon) * math.log1p(rate)
+            values = -(segment.level / rate) * np.expm1(exponent)
+    elif method == "german":
+        values = segment.balance - segment.level * local
+    else:
+        values = np.full(local.shape, segment.balance, dtype=np.float64)
+    values = np.where(local >= segment.term, 0.0, values)
+    return np.maximum(values, 0.0)
+
+
+def _segment_interest(method: str, rate: float, segment: _Segment) -> float:
+    # Closed-form sum of rate * opening balance over the segment's rows.
+    rows = segment.stop - segment.start
+    if rate == 0 or rows <= 0:
+        return 0.0
+    if method == "french":
+        # Same sum in log space: rows never exceed the horizon by a full
+        # period, so neither exponent overflows.
+        horizon = _french_horizon(segment, rate)
+        log_growth = math.log1p(rate)
+        grown = math.expm1((rows - horizon) * log_growth) - math.expm1(-horizon * log_growth)
+        return segment.level * rows - segment.level / rate * grown
+    if method == "german":
+        return rate * (rows * segment.balance - segment.level * rows * (rows - 1) / 2)
+    return rate * segment.balance * rows
+
+
+def _french_horizon(segment: _Segment, rate: float) -> float:
+    # Fractional number of installments that pays the segment balance off;
+    # infinite when the installment only covers the interest (in float terms).
+    ratio = segment.balance * rate / segment.level
+    if ratio >= 1:
+        return math.inf
+    return -math.log1p(-ratio) / math.log1p(rate)
+
+
+def _due_dates(start_date: date | None, periodicity: str, installments: np.ndarray) -> list[date | None]:
+    if start_date is None:
+        return [None] * installments.size
+    if periodicity != "monthly":
+        step = _PERIOD_DAYS[periodicity]
+        return [start_date + timedelta(days=step * int(n)) for n in installments.tolist()]
+
+    dates: list[date | None] = []
+    for n in installments.tolist():
+        month_index = start_date.month - 1 + n
+        year = start_date.year + month_index // 12
+        month = month_index % 12 + 1
+        day = min(start_date.day, calendar.monthrange(year, month)[1])
+        dates.append(date(year, month, day))
+    return dates
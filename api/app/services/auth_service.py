@@ -1,6 +1,7 @@
 from typing import Any
 
 from app.clients.supabase_auth import SupabaseAuthClient
+from app.core.cache import TTLCache, hash_key
 from app.core.exceptions import AppException
 from app.schemas.auth import AuthSessionResponse, AuthUser, MeResponse
 
@@ -52,8 +53,14 @@ def build_session_response(payload: dict[str, Any]) -> AuthSessionResponse:
 
 
 class AuthService:
-    def __init__(self, auth_client: SupabaseAuthClient) -> None:
+    def __init__(
+        self,
+        auth_client: SupabaseAuthClient,
+        *,
+        user_cache: TTLCache[MeResponse] | None = None,
+    ) -> None:
         self._auth_client = auth_client
+        self._user_cache = user_cache
 
     async def sign_up(self, *, email: str, password: str) -> AuthSessionResponse:
         if self._auth_client.has_service_role:
@@ -95,11 +102,19 @@ class AuthService:
 
     async def sign_out(self, *, access_token: str) -> None:
         await self._auth_client.sign_out(access_token=access_token)
+        if self._user_cache is not None:
+            self._user_cache.pop(hash_key(access_token))
 
     async def reset_password(self, *, email: str) -> None:
         await self._auth_client.recover(email=email)
 
     async def me(self, *, access_token: str) -> MeResponse:
+        cache_key = hash_key(access_token)
+        if self._user_cache is not None:
+            cached = self._user_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         user_payload = await self._auth_client.get_user(access_token=access_token)
         user_id = user_payload.get("id")
         email = user_payload.get("email")
@@ -110,8 +125,11 @@ class AuthService:
                 message="Supabase user payload is invalid.",
                 details=user_payload,
             )
-        return MeResponse(
+        user = MeResponse(
             id=str(user_id),
             email=str(email),
             last_sign_in_at=user_payload.get("last_sign_in_at"),
         )
+        if self._user_cache is not None:
+            self._user_cache.set(cache_key, user)
+        return user
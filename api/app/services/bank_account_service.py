@@ -1,7 +1,10 @@
 from datetime import UTC, datetime
 
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
+from app.core import deadline
 from app.core.exceptions import AppException
+from app.core.serialization import validate_json_list
+from app.core.snapshots import AssetSnapshotCache
 from app.schemas.bank_account import (
     BankAccountCreateRequest,
     BankAccountResponse,
@@ -10,8 +13,14 @@ from app.schemas.bank_account import (
 
 
 class BankAccountService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(
+        self,
+        rest_client: DataClient,
+        *,
+        snapshots: AssetSnapshotCache | None = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._snapshots = snapshots
 
     async def list_accounts(
         self,
@@ -19,12 +28,15 @@ class BankAccountService:
         access_token: str,
         user_id: str,
     ) -> list[BankAccountResponse]:
+        async def load() -> bytes:
+            return await self._rest_client.list_bank_accounts_json(access_token=access_token, user_id=user_id)
+
         try:
-            rows = await self._rest_client.list_bank_accounts(
-                access_token=access_token,
-                user_id=user_id,
-            )
-            return [BankAccountResponse.model_validate(row) for row in rows]
+            if self._snapshots is None:
+                raw = await load()
+            else:
+                raw = await self._snapshots.get_or_load(user_id=user_id, kind="bank_accounts", load=load)
+            return validate_json_list(BankAccountResponse, raw)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
@@ -49,6 +61,8 @@ class BankAccountService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def update_account(
         self,
@@ -79,6 +93,8 @@ class BankAccountService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def delete_account(
         self,
@@ -98,6 +114,14 @@ class BankAccountService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+    async def _assets_changed(self, user_id: str) -> None:
+        # Also on failure: a timed-out write may still have committed.
+        deadline.lift()
+        if self._snapshots is not None:
+            await self._snapshots.bump(user_id)
 
     @staticmethod
     def _raise_if_migration_missing(exc: AppException) -> None:
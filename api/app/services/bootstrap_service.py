@@ -0,0 +1,43 @@
+import asyncio
+
+from app.schemas.bootstrap import BootstrapResponse
+from app.services.bank_account_service import BankAccountService
+from app.services.cash_wallet_service import CashWalletService
+from app.services.category_service import CategoryService
+from app.services.credit_card_service import CreditCardService
+from app.services.profile_service import ProfileService
+
+
+class BootstrapService:
+    def __init__(
+        self,
+        *,
+        profile_service: ProfileService,
+        cash_wallet_service: CashWalletService,
+        bank_account_service: BankAccountService,
+        credit_card_service: CreditCardService,
+        category_service: CategoryService,
+    ) -> None:
+        self._profile_service = profile_service
+        self._cash_wallet_service = cash_wallet_service
+        self._bank_account_service = bank_account_service
+        self._credit_card_service = credit_card_service
+        self._category_service = category_service
+
+    async def load(self, *, access_token: str, user_id: str) -> BootstrapResponse:
+        # The five reads are independent, so launch latency is the slowest
+        # one rather than the sum of all of them.
+        profile, cash_wallets, bank_accounts, credit_cards, categories = await asyncio.gather(
+            self._profile_service.get_profile(access_token=access_token, user_id=user_id),
+            self._cash_wallet_service.list_wallets(access_token=access_token, user_id=user_id),
+            self._bank_account_service.list_accounts(access_token=access_token, user_id=user_id),
+            self._credit_card_service.list_cards(access_token=access_token, user_id=user_id),
+            self._category_service.list_categories(access_token=access_token, user_id=user_id),
+        )
+        return BootstrapResponse(
+            profile=profile,
+            cash_wallets=cash_wallets,
+            bank_accounts=bank_accounts,
+            credit_cards=credit_cards,
+            categories=categories,
+        )
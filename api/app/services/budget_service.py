@@ -0,0 +1,224 @@
+import asyncio
+from datetime import UTC, date, datetime
+from typing import Any
+
+from app.clients.data import DataClient
+from app.core.exceptions import AppException
+from app.core.months import month_start
+from app.schemas.budget import (
+    BudgetAlertResponse,
+    BudgetCreateRequest,
+    BudgetResponse,
+    BudgetStatusResponse,
+    BudgetUpdateRequest,
+)
+
+ALERT_THRESHOLDS = (80, 100)
+SPENDING_KINDS = frozenset({"expense", "credit_charge"})
+
+
+class BudgetService:
+    def __init__(self, rest_client: DataClient) -> None:
+        self._rest_client = rest_client
+
+    async def list_budget_status(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date | None = None,
+    ) -> list[BudgetStatusResponse]:
+        month = month_start(month)
+        budgets, spend = await self._load_budgets_and_spend(
+            access_token=access_token,
+            user_id=user_id,
+            month=month,
+        )
+        return [_budget_status(budget, month, spend) for budget in budgets]
+
+    async def create_budget(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        request: BudgetCreateRequest,
+    ) -> BudgetResponse:
+        payload = request.model_dump()
+        payload["currency"] = payload["currency"].upper()
+        payload["user_id"] = user_id
+
+        try:
+            row = await self._rest_client.create_budget(access_token=access_token, payload=payload)
+            return BudgetResponse.model_validate(row)
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+    async def update_budget(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        budget_id: str,
+        request: BudgetUpdateRequest,
+    ) -> BudgetResponse:
+        payload = request.model_dump(exclude_unset=True, exclude_none=True)
+        if not payload:
+            raise AppException(
+                status_code=400,
+                code="NO_BUDGET_FIELDS",
+                message="At least one budget field must be provided.",
+            )
+
+        try:
+            row = await self._rest_client.update_budget(
+                access_token=access_token,
+                user_id=user_id,
+                budget_id=budget_id,
+                payload=payload,
+            )
+            return BudgetResponse.model_validate(row)
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+    async def delete_budget(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        budget_id: str,
+    ) -> None:
+        payload = {"deleted_at": datetime.now(UTC).isoformat()}
+        try:
+            await self._rest_client.update_budget(
+                access_token=access_token,
+                user_id=user_id,
+                budget_id=budget_id,
+                payload=payload,
+            )
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+    async def list_alerts(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date | None = None,
+    ) -> list[BudgetAlertResponse]:
+        try:
+            rows = await self._rest_client.list_budget_alerts(
+                access_token=access_token,
+                user_id=user_id,
+                month=month_start(month),
+            )
+            return [BudgetAlertResponse.model_validate(row) for row in rows]
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+    async def evaluate_alerts(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date | None = None,
+    ) -> list[BudgetAlertResponse]:
+        # One pass over the user's budgets against the rollup counters: two
+        # reads plus at most one insert, whatever the size of the history.
+        month = month_start(month)
+        budgets, spend = await self._load_budgets_and_spend(
+            access_token=access_token,
+            user_id=user_id,
+            month=month,
+        )
+
+        payloads: list[dict[str, Any]] = []
+        for budget in budgets:
+            status = _budget_status(budget, month, spend)
+            for threshold in ALERT_THRESHOLDS:
+                if status.percent_used >= threshold:
+                    payloads.append(
+                        {
+                            "user_id": user_id,
+                            "budget_id": status.id,
+                            "month": month.isoformat(),
+                            "threshold": threshold,
+                            "spent": status.spent,
+                            "amount": status.amount,
+                        }
+                    )
+        if not payloads:
+            return []
+
+        try:
+            rows = await self._rest_client.create_budget_alerts(
+                access_token=access_token,
+                payloads=payloads,
+            )
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+        return [BudgetAlertResponse.model_validate(row) for row in rows]
+
+    async def _load_budgets_and_spend(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date,
+    ) -> tuple[list[BudgetResponse], dict[tuple[str, str], float]]:
+        try:
+            budget_rows, spend_rows = await asyncio.gather(
+                self._rest_client.list_budgets(access_token=access_token, user_id=user_id),
+                self._rest_client.list_monthly_spend(
+                    access_token=access_token,
+                    user_id=user_id,
+                    month=month,
+                ),
+            )
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+        spend: dict[tuple[str, str], float] = {}
+        for row in spend_rows:
+            if row.get("category_id") is None:
+                continue
+            key = (str(row["category_id"]), str(row["currency"]).upper())
+            spend[key] = spend.get(key, 0.0) + float(row.get("total") or 0)
+        return [BudgetResponse.model_validate(row) for row in budget_rows], spend
+
+    @staticmethod
+    def _raise_if_migration_missing(exc: AppException) -> None:
+        details = exc.details if isinstance(exc.details, dict) else {}
+        code = str(details.get("code", "")).upper()
+        message = str(details.get("message", "")).lower()
+        if code == "42P01" and (
+            "budget" in message or "transaction_monthly_rollups" in message
+        ):
+            raise AppException(
+                status_code=503,
+                code="MIGRATIONS_NOT_APPLIED",
+                message=(
+                    "Database migrations are not applied yet. "
+                    "Run `python scripts/apply_migrations.py` from the api folder."
+                ),
+            ) from exc
+
+
+def _budget_status(
+    budget: BudgetResponse,
+    month: date,
+    spend: dict[tuple[str, str], float],
+) -> BudgetStatusResponse:
+    spent = round(spend.get((budget.category_id, budget.currency.upper()), 0.0), 2)
+    return BudgetStatusResponse(
+        **budget.model_dump(),
+        month=month,
+        spent=spent,
+        remaining=round(budget.amount - spent, 2),
+        percent_used=round(spent / budget.amount * 100, 2),
+    )
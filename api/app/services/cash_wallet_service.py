@@ -1,7 +1,10 @@
 from datetime import UTC, datetime
 
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
+from app.core import deadline
 from app.core.exceptions import AppException
+from app.core.serialization import validate_json_list
+from app.core.snapshots import AssetSnapshotCache
 from app.schemas.cash_wallet import (
     CashWalletCreateRequest,
     CashWalletResponse,
@@ -10,8 +13,14 @@ from app.schemas.cash_wallet import (
 
 
 class CashWalletService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(
+        self,
+        rest_client: DataClient,
+        *,
+        snapshots: AssetSnapshotCache | None = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._snapshots = snapshots
 
     async def list_wallets(
         self,
@@ -19,12 +28,15 @@ class CashWalletService:
         access_token: str,
         user_id: str,
     ) -> list[CashWalletResponse]:
+        async def load() -> bytes:
+            return await self._rest_client.list_cash_wallets_json(access_token=access_token, user_id=user_id)
+
         try:
-            rows = await self._rest_client.list_cash_wallets(
-                access_token=access_token,
-                user_id=user_id,
-            )
-            return [CashWalletResponse.model_validate(row) for row in rows]
+            if self._snapshots is None:
+                raw = await load()
+            else:
+                raw = await self._snapshots.get_or_load(user_id=user_id, kind="cash_wallets", load=load)
+            return validate_json_list(CashWalletResponse, raw)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
@@ -49,6 +61,8 @@ class CashWalletService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def update_wallet(
         self,
@@ -79,6 +93,8 @@ class CashWalletService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def delete_wallet(
         self,
@@ -98,6 +114,14 @@ class CashWalletService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+    async def _assets_changed(self, user_id: str) -> None:
+        # Also on failure: a timed-out write may still have committed.
+        deadline.lift()
+        if self._snapshots is not None:
+            await self._snapshots.bump(user_id)
 
     @staticmethod
     def _raise_if_migration_missing(exc: AppException) -> None:
@@ -1,6 +1,8 @@
 from datetime import UTC, datetime
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
+from app.core.cache import CacheBackend
 from app.core.exceptions import AppException
+from app.core.serialization import validate_json_list
 from app.schemas.category import (
     CategoryCreateRequest,
     CategoryResponse,
@@ -8,27 +10,43 @@ from app.schemas.category import (
 )
 
 class CategoryService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(self, rest_client: DataClient, *, cache: CacheBackend | None = None) -> None:
         self._rest_client = rest_client
+        # Per-user list body, keyed by user_id. Categories are seeded once and
+        # rarely change, so reads are served from here until a write through
+        # this service invalidates them or the TTL runs out.
+        self._cache = cache
 
     async def list_categories(self, *, access_token: str, user_id: str) -> list[CategoryResponse]:
+        if self._cache is not None:
+            cached = await self._cache.get(user_id)
+            if cached is not None:
+                return validate_json_list(CategoryResponse, cached)
+
         try:
-            rows = await self._rest_client.list_categories(access_token=access_token, user_id=user_id)
-            return [CategoryResponse.model_validate(row) for row in rows]
+            raw = await self._rest_client.list_categories_json(access_token=access_token, user_id=user_id)
+            categories = validate_json_list(CategoryResponse, raw)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
 
+        if self._cache is not None:
+            await self._cache.set(user_id, raw)
+        return categories
+
     async def create_category(self, *, access_token: str, user_id: str, request: CategoryCreateRequest) -> CategoryResponse:
         payload = request.model_dump(exclude={"is_system"})
         payload["user_id"] = user_id
         payload["is_system"] = False
         try:
             row = await self._rest_client.create_category(access_token=access_token, payload=payload)
-            return CategoryResponse.model_validate(row)
+            category = CategoryResponse.model_validate(row)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._invalidate(user_id)
+        return category
 
     async def delete_category(self, *, access_token: str, user_id: str, category_id: str) -> None:
         payload = {"deleted_at": datetime.now(UTC).isoformat()}
@@ -37,6 +55,15 @@ class CategoryService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._invalidate(user_id)
+
+    async def _invalidate(self, user_id: str) -> None:
+        # After the write, also on failure: a timed-out write may still have
+        # committed. A list that raced with it may still repopulate the old
+        # body, which the TTL bounds.
+        if self._cache is not None:
+            await self._cache.delete(user_id)
 
     @staticmethod
     def _raise_if_migration_missing(exc: AppException) -> None:
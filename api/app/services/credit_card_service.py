@@ -1,6 +1,9 @@
 from datetime import UTC, datetime
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
+from app.core import deadline
 from app.core.exceptions import AppException
+from app.core.serialization import validate_json_list
+from app.core.snapshots import AssetSnapshotCache
 from app.schemas.credit_card import (
     CreditCardCreateRequest,
     CreditCardResponse,
@@ -8,13 +11,25 @@ from app.schemas.credit_card import (
 )
 
 class CreditCardService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(
+        self,
+        rest_client: DataClient,
+        *,
+        snapshots: AssetSnapshotCache | None = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._snapshots = snapshots
 
     async def list_cards(self, *, access_token: str, user_id: str) -> list[CreditCardResponse]:
+        async def load() -> bytes:
+            return await self._rest_client.list_credit_cards_json(access_token=access_token, user_id=user_id)
+
         try:
-            rows = await self._rest_client.list_credit_cards(access_token=access_token, user_id=user_id)
-            return [CreditCardResponse.model_validate(row) for row in rows]
+            if self._snapshots is None:
+                raw = await load()
+            else:
+                raw = await self._snapshots.get_or_load(user_id=user_id, kind="credit_cards", load=load)
+            return validate_json_list(CreditCardResponse, raw)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
@@ -28,6 +43,8 @@ class CreditCardService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def update_card(self, *, access_token: str, user_id: str, card_id: str, request: CreditCardUpdateRequest) -> CreditCardResponse:
         payload = request.model_dump(exclude_none=True)
@@ -37,6 +54,8 @@ class CreditCardService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
 
     async def delete_card(self, *, access_token: str, user_id: str, card_id: str) -> None:
         payload = {"deleted_at": datetime.now(UTC).isoformat()}
@@ -45,6 +64,14 @@ class CreditCardService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+    async def _assets_changed(self, user_id: str) -> None:
+        # Also on failure: a timed-out write may still have committed.
+        deadline.lift()
+        if self._snapshots is not None:
+            await self._snapshots.bump(user_id)
 
     @staticmethod
     def _raise_if_migration_missing(exc: AppException) -> None:
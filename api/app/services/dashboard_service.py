@@ -0,0 +1,144 @@
+import asyncio
+from datetime import date
+from typing import Any
+
+from app.clients.data import DataClient
+from app.core.exceptions import AppException
+from app.core.months import month_bounds, month_start
+from app.schemas.dashboard import (
+    CategoryTotal,
+    CurrencyBalance,
+    DashboardResponse,
+    KindTotal,
+    MonthSummary,
+)
+
+_SPENDING_KINDS = {"expense", "credit_charge"}
+_TOP_CATEGORIES = 5
+
+
+class DashboardService:
+    def __init__(self, rest_client: DataClient) -> None:
+        self._rest_client = rest_client
+
+    async def get_dashboard(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        month: date | None = None,
+    ) -> DashboardResponse:
+        month = month_start(month)
+        occurred_from, occurred_to = month_bounds(month)
+
+        try:
+            wallets, accounts, cards, summary_rows = await asyncio.gather(
+                self._rest_client.list_cash_wallets(access_token=access_token, user_id=user_id),
+                self._rest_client.list_bank_accounts(access_token=access_token, user_id=user_id),
+                self._rest_client.list_credit_cards(access_token=access_token, user_id=user_id),
+                self._rest_client.fetch_transaction_month_summary(
+                    access_token=access_token,
+                    occurred_from=occurred_from,
+                    occurred_to=occurred_to,
+                ),
+            )
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+
+        return DashboardResponse(
+            balances=_balances_by_currency(wallets, accounts, cards),
+            month_summary=_month_summary(month, summary_rows),
+        )
+
+    @staticmethod
+    def _raise_if_migration_missing(exc: AppException) -> None:
+        details = exc.details if isinstance(exc.details, dict) else {}
+        code = str(details.get("code", "")).upper()
+        message = str(details.get("message", "")).lower()
+        # Only a missing summary function; other undefined objects or a
+        # permission error on it are not about this migration.
+        if code in {"42P01", "42883", "PGRST202"} and "transaction_month_summary" in message:
+            raise AppException(
+                status_code=503,
+                code="MIGRATIONS_NOT_APPLIED",
+                message=(
+                    "Database migrations are not applied yet. "
+                    "Run `python scripts/apply_migrations.py` from the api folder."
+                ),
+            ) from exc
+
+
+def _balances_by_currency(
+    wallets: list[dict[str, Any]],
+    accounts: list[dict[str, Any]],
+    cards: list[dict[str, Any]],
+) -> list[CurrencyBalance]:
+    # Amounts in different currencies are never added together; the client
+    # converts with its own rates if it wants a single figure.
+    totals: dict[str, dict[str, float]] = {}
+
+    def bucket(currency: Any) -> dict[str, float]:
+        key = str(currency or "").upper()
+        return totals.setdefault(key, {"cash": 0.0, "bank": 0.0, "debts": 0.0})
+
+    for row in wallets:
+        bucket(row.get("currency"))["cash"] += float(row.get("balance") or 0)
+    for row in accounts:
+        bucket(row.get("currency"))["bank"] += float(row.get("balance") or 0)
+    for row in cards:
+        bucket(row.get("currency"))["debts"] += float(row.get("current_debt") or 0)
+
+    balances = []
+    for currency in sorted(totals):
+        values = totals[currency]
+        assets = values["cash"] + values["bank"]
+        balances.append(
+            CurrencyBalance(
+                currency=currency,
+                cash=round(values["cash"], 2),
+                bank=round(values["bank"], 2),
+                assets=round(assets, 2),
+                debts=round(values["debts"], 2),
+                net_worth=round(assets - values["debts"], 2),
+            )
+        )
+    return balances
+
+
+def _month_summary(month: date, rows: list[dict[str, Any]]) -> MonthSummary:
+    # Rows are already grouped by (kind, category_id, currency) in Postgres,
+    # so this loop is bounded by the number of categories, not transactions.
+    by_kind: dict[tuple[str, str], list[float]] = {}
+    spending: list[CategoryTotal] = []
+
+    for row in rows:
+        kind = str(row["kind"])
+        currency = str(row["currency"]).upper()
+        total = float(row.get("total") or 0)
+        count = int(row.get("tx_count") or 0)
+
+        kind_total = by_kind.setdefault((kind, currency), [0.0, 0])
+        kind_total[0] += total
+        kind_total[1] += count
+
+        if kind in _SPENDING_KINDS:
+            spending.append(
+                CategoryTotal(
+                    category_id=row.get("category_id"),
+                    kind=kind,
+                    currency=currency,
+                    total=round(total, 2),
+                    count=count,
+                )
+            )
+
+    spending.sort(key=lambda item: item.total, reverse=True)
+    return MonthSummary(
+        month=month,
+        by_kind=[
+            KindTotal(kind=kind, currency=currency, total=round(total, 2), count=int(count))
+            for (kind, currency), (total, count) in sorted(by_kind.items())
+        ],
+        top_expense_categories=spending[:_TOP_CATEGORIES],
+    )
@@ -1,10 +1,10 @@
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
 from app.core.exceptions import AppException
 from app.schemas.profile import ProfileResponse, ProfileUpdateRequest
 
 
 class ProfileService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(self, rest_client: DataClient) -> None:
         self._rest_client = rest_client
 
     async def get_profile(self, *, access_token: str, user_id: str) -> ProfileResponse:
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from app.clients.data import DataClient
+from app.core.exceptions import AppException
+from app.core.pagination import SyncWatermark, encode_watermark
+from app.schemas.bank_account import BankAccountResponse
+from app.schemas.cash_wallet import CashWalletResponse
+from app.schemas.category import CategoryResponse
+from app.schemas.credit_card import CreditCardResponse
+from app.schemas.sync import SyncResponse, SyncTombstone
+from app.schemas.transaction import TransactionResponse
+
+# updated_at is the start time of the writing transaction, so a write that
+# commits late can carry a timestamp older than rows already handed out. The
+# watermark never moves past this window behind the database clock; rows in
+# it are sent again on the next call, which clients apply as upserts.
+SYNC_SETTLE_SECONDS = 5
+
+_ENTITY_MODELS: dict[str, type[BaseModel]] = {
+    "cash_wallets": CashWalletResponse,
+    "bank_accounts": BankAccountResponse,
+    "credit_cards": CreditCardResponse,
+    "categories": CategoryResponse,
+    "transactions": TransactionResponse,
+}
+
+
+class _SyncChange(BaseModel):
+    entity: str
+    id: str
+    updated_at: datetime
+    deleted_at: datetime | None = None
+    data: dict[str, Any] | None = None
+
+
+class _SyncBatch(BaseModel):
+    server_time: datetime
+    changes: list[_SyncChange]
+
+
+class SyncService:
+    def __init__(self, rest_client: DataClient) -> None:
+        self._rest_client = rest_client
+
+    async def get_changes(
+        self,
+        *,
+        access_token: str,
+        since: SyncWatermark | None = None,
+        limit: int = 500,
+    ) -> SyncResponse:
+        try:
+            rows = await self._rest_client.fetch_sync_changes(
+                access_token=access_token,
+                since=since,
+                limit=limit,
+            )
+            batch = _SyncBatch.model_validate(rows[0])
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            raise
+        except (IndexError, ValidationError) as exc:
+            raise AppException(
+                status_code=500,
+                code="INVALID_SUPABASE_RESPONSE",
+                message="Supabase rest returned invalid payload.",
+            ) from exc
+
+        # The RPC reads one row past the limit to tell whether more remain.
+        has_more = len(batch.changes) > limit
+        changes = batch.changes[:limit]
+
+        grouped: dict[str, list[BaseModel]] = {entity: [] for entity in _ENTITY_MODELS}
+        deleted: list[SyncTombstone] = []
+        for change in changes:
+            if change.entity not in _ENTITY_MODELS:
+                continue
+            if change.deleted_at is not None or change.data is None:
+                deleted.append(
+                    SyncTombstone(
+                        entity=change.entity,
+                        id=change.id,
+                        deleted_at=change.deleted_at or change.updated_at,
+                    )
+                )
+            else:
+                grouped[change.entity].append(_ENTITY_MODELS[change.entity].model_validate(change.data))
+
+        return SyncResponse(
+            **grouped,
+            deleted=deleted,
+            watermark=encode_watermark(_next_watermark(since, changes, batch.server_time, has_more)),
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def _raise_if_migration_missing(exc: AppException) -> None:
+        details = exc.details if isinstance(exc.details, dict) else {}
+        code = str(details.get("code", "")).upper()
+        message = str(details.get("message", "")).lower()
+        if code in {"42883", "PGRST202"} or "sync_changes" in message:
+            raise AppException(
+                status_code=503,
+                code="MIGRATIONS_NOT_APPLIED",
+                message=(
+                    "Database migrations are not applied yet. "
+                    "Run `python scripts/apply_migrations.py` from the api folder."
+                ),
+            ) from exc
+
+
+def _next_watermark(
+    since: SyncWatermark | None,
+    changes: list[_SyncChange],
+    server_time: datetime,
+    has_more: bool,
+) -> SyncWatermark:
+    settled = SyncWatermark(updated_at=server_time - timedelta(seconds=SYNC_SETTLE_SECONDS))
+    if changes:
+        last = changes[-1]
+        watermark = SyncWatermark(updated_at=last.updated_at, entity=last.entity, id=last.id)
+        # A full page always advances to its last row, otherwise a burst of
+        # more than `limit` fresh rows would be served forever.
+        if not has_more and _key(watermark) > _key(settled):
+            watermark = settled
+    else:
+        watermark = settled
+
+    if since is not None and _key(watermark) < _key(since):
+        return since
+    return watermark
+
+
+def _key(watermark: SyncWatermark) -> tuple[datetime, str, str]:
+    return (watermark.updated_at, watermark.entity, watermark.id.lower())
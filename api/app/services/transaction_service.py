@@ -1,15 +1,42 @@
+import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from app.clients.supabase_rest import SupabaseRestClient
+from app.clients.data import DataClient
+from app.core import deadline
 from app.core.exceptions import AppException
+from app.core.idempotency import IdempotencyStore, request_fingerprint
+from app.core.months import month_start
+from app.core.pagination import TransactionCursor, decode_cursor
+from app.core.serialization import validate_json_list
+from app.core.snapshots import AssetSnapshotCache
+from app.schemas.common import ErrorResponse
 from app.schemas.transaction import (
+    TransactionBatchCreateRequest,
+    TransactionBatchCreateResponse,
+    TransactionBatchItemResult,
     TransactionCreateRequest,
     TransactionResponse,
     TransactionUpdateRequest,
 )
+from app.services.budget_service import SPENDING_KINDS, BudgetService
+
+logger = logging.getLogger("billetera.budgets")
 
 class TransactionService:
-    def __init__(self, rest_client: SupabaseRestClient) -> None:
+    def __init__(
+        self,
+        rest_client: DataClient,
+        *,
+        budget_service: BudgetService | None = None,
+        idempotency: IdempotencyStore | None = None,
+        snapshots: AssetSnapshotCache | None = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._budget_service = budget_service
+        self._idempotency = idempotency
+        # The effects trigger changes wallet, account and card balances on
+        # every transaction write.
+        self._snapshots = snapshots
 
     async def list_transactions(
         self,
@@ -25,9 +52,12 @@ class TransactionService:
         credit_card_id: str | None = None,
         occurred_from: datetime | None = None,
         occurred_to: datetime | None = None,
+        cursor: str | None = None,
     ) -> list[TransactionResponse]:
+        # A cursor takes precedence over offset; offset remains for old clients.
+        after = decode_cursor(cursor) if cursor else None
         try:
-            rows = await self._rest_client.list_transactions(
+            raw = await self._rest_client.list_transactions_json(
                 access_token=access_token,
                 user_id=user_id,
                 limit=limit,
@@ -39,27 +69,195 @@ class TransactionService:
                 credit_card_id=credit_card_id,
                 occurred_from=occurred_from,
                 occurred_to=occurred_to,
+                after=after,
             )
-            return [TransactionResponse.model_validate(row) for row in rows]
+            return validate_json_list(TransactionResponse, raw)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
 
-    async def create_transaction(self, *, access_token: str, user_id: str, request: TransactionCreateRequest) -> TransactionResponse:
-        payload = request.model_dump(exclude_none=True)
-        payload["user_id"] = user_id
-        occurred_at = payload.get("occurred_at")
-        if occurred_at is None:
-            payload["occurred_at"] = datetime.now(UTC).isoformat()
-        else:
-            payload["occurred_at"] = occurred_at.isoformat()
+    async def iter_transaction_pages(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        page_size: int,
+        kind: str | None = None,
+        category_id: str | None = None,
+        cash_wallet_id: str | None = None,
+        bank_account_id: str | None = None,
+        credit_card_id: str | None = None,
+        occurred_from: datetime | None = None,
+        occurred_to: datetime | None = None,
+    ) -> AsyncIterator[list[TransactionResponse]]:
+        # Walks the full history with keyset pages so only one page is held in
+        # memory at a time, whatever the size of the history.
+        after: TransactionCursor | None = None
+        while True:
+            try:
+                rows = await self._rest_client.list_transactions(
+                    access_token=access_token,
+                    user_id=user_id,
+                    limit=page_size,
+                    kind=kind,
+                    category_id=category_id,
+                    cash_wallet_id=cash_wallet_id,
+                    bank_account_id=bank_account_id,
+                    credit_card_id=credit_card_id,
+                    occurred_from=occurred_from,
+                    occurred_to=occurred_to,
+                    after=after,
+                )
+            except AppException as exc:
+                self._raise_if_migration_missing(exc)
+                raise
+
+            page = [TransactionResponse.model_validate(row) for row in rows]
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            after = TransactionCursor(occurred_at=page[-1].occurred_at, id=page[-1].id)
+
+    async def create_transaction(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        request: TransactionCreateRequest,
+        idempotency_key: str | None = None,
+    ) -> TransactionResponse:
+        if idempotency_key is None or self._idempotency is None:
+            return await self._create_transaction(access_token=access_token, user_id=user_id, request=request)
+
+        async def execute() -> dict:
+            transaction = await self._create_transaction(
+                access_token=access_token,
+                user_id=user_id,
+                request=request,
+            )
+            return transaction.model_dump(mode="json")
+
+        # exclude_unset: occurred_at defaults to "now", which would make every
+        # retry of the same request look different.
+        row = await self._idempotency.run(
+            access_token=access_token,
+            user_id=user_id,
+            scope="transactions.create",
+            key=idempotency_key,
+            fingerprint=request_fingerprint(request.model_dump(mode="json", exclude_unset=True)),
+            execute=execute,
+        )
+        return TransactionResponse.model_validate(row)
+
+    async def _create_transaction(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        request: TransactionCreateRequest,
+    ) -> TransactionResponse:
+        payload = self._build_create_payload(user_id=user_id, request=request)
 
         try:
             row = await self._rest_client.create_transaction(access_token=access_token, payload=payload)
-            return TransactionResponse.model_validate(row)
+            transaction = TransactionResponse.model_validate(row)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+        await self._check_budgets(access_token=access_token, user_id=user_id, transactions=[transaction])
+        return transaction
+
+    async def create_transactions(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        request: TransactionBatchCreateRequest,
+    ) -> TransactionBatchCreateResponse:
+        payloads = [
+            self._build_create_payload(user_id=user_id, request=item) for item in request.items
+        ]
+        try:
+            rows = await self._rest_client.create_transactions(
+                access_token=access_token,
+                payloads=payloads,
+            )
+        except AppException as exc:
+            self._raise_if_migration_missing(exc)
+            # The array insert is a single statement, so a rejected row rolls
+            # back the whole batch. That is exactly all-or-nothing; otherwise
+            # replay the items one by one to report which rows were rejected.
+            if request.all_or_nothing or exc.status_code >= 500:
+                raise
+            response = await self._create_individually(access_token=access_token, payloads=payloads)
+        else:
+            results = [
+                TransactionBatchItemResult(
+                    index=index,
+                    status="created",
+                    transaction=TransactionResponse.model_validate(row),
+                )
+                for index, row in enumerate(rows)
+            ]
+            response = TransactionBatchCreateResponse(created=len(results), failed=0, results=results)
+        finally:
+            await self._assets_changed(user_id)
+
+        await self._check_budgets(
+            access_token=access_token,
+            user_id=user_id,
+            transactions=[result.transaction for result in response.results if result.transaction],
+        )
+        return response
+
+    async def _create_individually(
+        self,
+        *,
+        access_token: str,
+        payloads: list[dict],
+    ) -> TransactionBatchCreateResponse:
+        # Sequential on purpose: balance and credit limit triggers depend on
+        # the order in which the offline queue was recorded.
+        results: list[TransactionBatchItemResult] = []
+        for index, payload in enumerate(payloads):
+            try:
+                row = await self._rest_client.create_transaction(
+                    access_token=access_token,
+                    payload=payload,
+                )
+            except AppException as exc:
+                if exc.status_code >= 500:
+                    # Earlier items are committed: report them instead of
+                    # failing the whole batch, which the offline queue would
+                    # resend. This item may or may not have been written.
+                    results.extend(_upstream_failed(index, len(payloads), exc))
+                    break
+                results.append(
+                    TransactionBatchItemResult(
+                        index=index,
+                        status="failed",
+                        error=ErrorResponse(code=exc.code, message=exc.message, details=exc.details),
+                    ),
+                )
+                continue
+            results.append(
+                TransactionBatchItemResult(
+                    index=index,
+                    status="created",
+                    transaction=TransactionResponse.model_validate(row),
+                ),
+            )
+
+        created = sum(1 for result in results if result.status == "created")
+        return TransactionBatchCreateResponse(
+            created=created,
+            failed=len(results) - created,
+            results=results,
+        )
 
     async def update_transaction(
         self,
@@ -87,10 +285,15 @@ class TransactionService:
                 transaction_id=transaction_id,
                 payload=payload,
             )
-            return TransactionResponse.model_validate(row)
+            transaction = TransactionResponse.model_validate(row)
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+        await self._check_budgets(access_token=access_token, user_id=user_id, transactions=[transaction])
+        return transaction
 
     async def delete_transaction(
         self,
@@ -110,6 +313,53 @@ class TransactionService:
         except AppException as exc:
             self._raise_if_migration_missing(exc)
             raise
+        finally:
+            await self._assets_changed(user_id)
+
+    async def _assets_changed(self, user_id: str) -> None:
+        # Also on failure: a timed-out write may still have committed.
+        deadline.lift()
+        if self._snapshots is not None:
+            await self._snapshots.bump(user_id)
+
+    async def _check_budgets(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        transactions: list[TransactionResponse],
+    ) -> None:
+        if self._budget_service is None:
+            return
+        # Only spending can cross a threshold, and a batch is evaluated once
+        # per month it touches rather than once per transaction.
+        months = {
+            month_start(transaction.occurred_at)
+            for transaction in transactions
+            if transaction.kind in SPENDING_KINDS and transaction.category_id
+        }
+        for month in sorted(months):
+            try:
+                await self._budget_service.evaluate_alerts(
+                    access_token=access_token,
+                    user_id=user_id,
+                    month=month,
+                )
+            except Exception:
+                # The transaction is already committed; a failed budget check
+                # must not turn the write into an error for the client.
+                logger.warning("budget_evaluation_failed month=%s", month.isoformat(), exc_info=True)
+
+    @staticmethod
+    def _build_create_payload(*, user_id: str, request: TransactionCreateRequest) -> dict:
+        payload = request.model_dump(exclude_none=True)
+        payload["user_id"] = user_id
+        occurred_at = payload.get("occurred_at")
+        if occurred_at is None:
+            payload["occurred_at"] = datetime.now(UTC).isoformat()
+        else:
+            payload["occurred_at"] = occurred_at.isoformat()
+        return payload
 
     @staticmethod
     def _raise_if_migration_missing(exc: AppException) -> None:
@@ -122,3 +372,33 @@ class TransactionService:
                 code="MIGRATIONS_NOT_APPLIED",
                 message="Database migrations for transactions are not applied yet.",
             ) from exc
+
+
+def _upstream_failed(
+    index: int,
+    count: int,
+    exc: AppException,
+) -> list[TransactionBatchItemResult]:
+    failed = [
+        TransactionBatchItemResult(
+            index=index,
+            status="failed",
+            error=ErrorResponse(
+                code="UPSTREAM_UNAVAILABLE",
+                message="Supabase failed while creating this item; it may have been saved.",
+                details={"code": exc.code, "message": exc.message},
+            ),
+        )
+    ]
+    failed.extend(
+        TransactionBatchItemResult(
+            index=remaining,
+            status="failed",
+            error=ErrorResponse(
+                code="UPSTREAM_UNAVAILABLE",
+                message="Not attempted after Supabase failed on an earlier item.",
+            ),
+        )
+        for remaining in range(index + 1, count)
+    )
+    return failed
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# French-method amortization schedule: a Python loop per installment versus
+# the closed-form NumPy version in app.services.amortization_service, for a
+# 30-year monthly mortgage (360) and a long daily-accrual loan (10,000).
+# Also times the first page (120 rows) that GET /amortization/schedule serves,
+# which does not depend on the length of the loan.
+#
+#   python scripts/bench_amortization.py --repeat 50
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("SUPABASE_URL", "https://bench.supabase.co")
+os.environ.setdefault("SUPABASE_ANON_KEY", "bench-anon-key")
+
+from app.schemas.amortization import AmortizationScheduleRequest  # noqa: E402
+from app.services.amortization_service import (  # noqa: E402
+    PERIODS_PER_YEAR,
+    build_plan,
+    schedule_arrays,
+)
+
+
+def loop_schedule(request: AmortizationScheduleRequest) -> list[tuple[int, float, float, float, float]]:
+    rate = request.annual_rate / 100 / PERIODS_PER_YEAR[request.periodicity]
+    periods = request.periods
+    payment = request.principal * rate / (1 - (1 + rate) ** -periods)
+    balance = request.principal
+    rows = []
+    for installment in range(1, periods + 1):
+        interest = balance * rate
+        principal = balance if installment == periods else payment - interest
+        balance -= principal
+        rows.append((installment, principal + interest, interest, principal, balance))
+    return rows
+
+
+def vectorized_schedule(request: AmortizationScheduleRequest) -> object:
+    plan = build_plan(request)
+    return schedule_arrays(plan, 0, plan.periods)
+
+
+def first_page(request: AmortizationScheduleRequest) -> object:
+    return schedule_arrays(build_plan(request), 0, 120)
+
+
+def best_ms(func: object, request: AmortizationScheduleRequest, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(request))  # type: ignore[operator]
+    return min(timer.repeat(repeat=repeat, number=1)) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark loop vs vectorized amortization.")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    cases = [
+        AmortizationScheduleRequest(principal=250_000, annual_rate=7.5, periods=360),
+        AmortizationScheduleRequest(
+            principal=50_000,
+            annual_rate=18,
+            periods=10_000,
+            periodicity="daily",
+        ),
+    ]
+
+    print(f"{'periods':>8} {'loop_ms':>10} {'numpy_ms':>10} {'speedup':>8} {'page_ms':>9}")
+    for request in cases:
+        loop_ms = best_ms(loop_schedule, request, args.repeat)
+        numpy_ms = best_ms(vectorized_schedule, request, args.repeat)
+        page_ms = best_ms(first_page, request, args.repeat)
+        print(
+            f"{request.periods:>8} {loop_ms:>10.3f} {numpy_ms:>10.3f} "
+            f"{loop_ms / numpy_ms:>7.1f}x {page_ms:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Latency of the same repository calls through PostgREST (DATA_BACKEND=rest)
+# and directly through psycopg (DATA_BACKEND=postgres). Needs a reachable
+# database and REST endpoint, e.g. `supabase start` locally, plus a valid user
+# access token:
+#
+#   BENCH_ACCESS_TOKEN=<jwt> python scripts/bench_data_backend.py --iterations 500
+#
+# SUPABASE_URL, SUPABASE_ANON_KEY and SUPABASE_DB_URL are read from api/.env.
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from dotenv import load_dotenv  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from app.clients.http import build_http_client  # noqa: E402
+from app.clients.postgres import PostgresRepository, build_postgres_pool  # noqa: E402
+from app.clients.supabase_rest import SupabaseRestClient  # noqa: E402
+from app.core.config import Settings  # noqa: E402
+
+
+async def measure(call: Callable[[], Awaitable[object]], iterations: int) -> list[float]:
+    for _ in range(min(20, iterations)):
+        await call()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<28} p50={statistics.median(ordered):7.3f}ms "
+        f"p95={p95:7.3f}ms mean={statistics.fmean(ordered):7.3f}ms"
+    )
+
+
+async def run(settings: Settings, access_token: str, iterations: int) -> None:
+    user_id = str(jwt.get_unverified_claims(access_token)["sub"])
+    http_client = build_http_client(
+        settings,
+        max_connections=settings.rest_max_connections,
+        max_keepalive_connections=settings.rest_max_keepalive_connections,
+    )
+    pool = build_postgres_pool(settings)
+    await pool.open(wait=True)
+    backends = {
+        "rest": SupabaseRestClient(settings, http_client=http_client),
+        "postgres": PostgresRepository(settings, pool=pool),
+    }
+
+    try:
+        for name, backend in backends.items():
+            summarize(
+                f"{name} list_transactions",
+                await measure(
+                    lambda backend=backend: backend.list_transactions(
+                        access_token=access_token,
+                        user_id=user_id,
+                        limit=50,
+                    ),
+                    iterations,
+                ),
+            )
+            summarize(
+                f"{name} list_cash_wallets",
+                await measure(
+                    lambda backend=backend: backend.list_cash_wallets(
+                        access_token=access_token,
+                        user_id=user_id,
+                    ),
+                    iterations,
+                ),
+            )
+    finally:
+        await http_client.aclose()
+        await pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PostgREST vs direct Postgres reads.")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument(
+        "--no-prepare",
+        action="store_true",
+        help="Disable server-side prepared statements (transaction pooler).",
+    )
+    args = parser.parse_args()
+
+    load_dotenv(ROOT_DIR / ".env")
+    access_token = os.getenv("BENCH_ACCESS_TOKEN", "").strip()
+    if not access_token:
+        print("ERROR: BENCH_ACCESS_TOKEN (a user access token) is required.")
+        return 1
+
+    settings = Settings(data_backend="postgres", db_prepare_statements=not args.no_prepare)
+    if not settings.supabase_db_url:
+        print("ERROR: SUPABASE_DB_URL is required in api/.env")
+        return 1
+
+    asyncio.run(run(settings, access_token, args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
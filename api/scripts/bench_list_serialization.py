@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# One page of GET /transactions (100 rows) from upstream bytes to the response
+# body: the old path (response.json() -> model_validate per row -> FastAPI's
+# response_model validation + jsonable_encoder -> JSONResponse) versus the
+# TypeAdapter path in app.core.serialization (validate_json -> dump_json).
+#
+#   python scripts/bench_list_serialization.py --rows 100 --repeat 200
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("SUPABASE_URL", "https://bench.supabase.co")
+os.environ.setdefault("SUPABASE_ANON_KEY", "bench-anon-key")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core.serialization import json_list_response, list_adapter, validate_json_list  # noqa: E402
+from app.schemas.transaction import TransactionResponse  # noqa: E402
+
+
+def upstream_body(rows: int) -> bytes:
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    return json.dumps(
+        [
+            {
+                "id": f"00000000-0000-4000-8000-{index:012d}",
+                "user_id": "00000000-0000-4000-8000-000000000000",
+                "kind": "expense",
+                "amount": 12.5 + index,
+                "currency": "USD",
+                "description": f"Compra {index}",
+                "occurred_at": (started + timedelta(minutes=index)).isoformat(),
+                "category_id": "00000000-0000-4000-8000-000000000001",
+                "cash_wallet_id": "00000000-0000-4000-8000-000000000002",
+                "bank_account_id": None,
+                "credit_card_id": None,
+                "target_cash_wallet_id": None,
+                "target_bank_account_id": None,
+                "created_at": started.isoformat(),
+                "updated_at": started.isoformat(),
+            }
+            for index in range(rows)
+        ]
+    ).encode()
+
+
+def dict_path(raw: bytes) -> bytes:
+    items = [TransactionResponse.model_validate(row) for row in json.loads(raw)]
+    # What FastAPI does with a response_model when the route returns models.
+    validated = list_adapter(TransactionResponse).validate_python(
+        [item.model_dump() for item in items]
+    )
+    return JSONResponse(content=jsonable_encoder(validated)).body
+
+
+def bytes_path(raw: bytes) -> bytes:
+    items = validate_json_list(TransactionResponse, raw)
+    return json_list_response(TransactionResponse, items).body
+
+
+def best_ms(func: object, raw: bytes, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(raw))  # type: ignore[operator]
+    return min(timer.repeat(repeat=repeat, number=1)) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization.")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    raw = upstream_body(args.rows)
+    if json.loads(dict_path(raw)) != json.loads(bytes_path(raw)):
+        print("ERROR: both paths must produce the same body.")
+        return 1
+
+    dict_ms = best_ms(dict_path, raw, args.repeat)
+    bytes_ms = best_ms(bytes_path, raw, args.repeat)
+    print(f"{'rows':>6} {'dict_ms':>10} {'bytes_ms':>10} {'speedup':>8}")
+    print(f"{args.rows:>6} {dict_ms:>10.3f} {bytes_ms:>10.3f} {dict_ms / bytes_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
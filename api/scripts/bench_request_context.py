@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Requests/sec for /health and /api/v1/transactions with the legacy
+# BaseHTTPMiddleware request context versus the raw ASGI implementation.
+# Runs in-process (httpx ASGITransport) against a stubbed transaction service,
+# so the numbers isolate middleware overhead from network I/O.
+#
+#   python scripts/bench_request_context.py --requests 3000
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("SUPABASE_URL", "https://bench.supabase.co")
+os.environ.setdefault("SUPABASE_ANON_KEY", "bench-anon-key")
+# Keep the access log calls but filter them out so stdout does not dominate.
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+from fastapi import Request  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from app.dependencies.auth import (  # noqa: E402
+    AuthContext,
+    get_auth_context,
+    get_transaction_service,
+)
+from app.main import create_app  # noqa: E402
+from app.middleware.request_context import RequestContextMiddleware  # noqa: E402
+from app.schemas.transaction import TransactionResponse  # noqa: E402
+
+logger = logging.getLogger("billetera.request")
+
+
+class LegacyRequestContextMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
+        started = time.perf_counter()
+
+        response = await call_next(request)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        response.headers["x-request-id"] = request_id
+        response.headers["x-response-time-ms"] = f"{elapsed_ms:.2f}"
+
+        logger.info(
+            "request_id=%s method=%s path=%s status=%s elapsed_ms=%.2f",
+            request_id,
+            request.method,
+            request.url.path,
+            response.status_code,
+            elapsed_ms,
+        )
+        return response
+
+
+class StubTransactionService:
+    def __init__(self, rows: int) -> None:
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        self._page = [
+            TransactionResponse(
+                id=f"tx-{index}",
+                kind="expense",
+                amount=10.0 + index,
+                currency="USD",
+                description="bench",
+                occurred_at=now,
+                cash_wallet_id="wallet-1",
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(rows)
+        ]
+
+    async def list_transactions(self, **_: object) -> list[TransactionResponse]:
+        return self._page
+
+
+def build_app(middleware_cls: type, rows: int):
+    app = create_app()
+    app.user_middleware = [
+        Middleware(middleware_cls) if item.cls is RequestContextMiddleware else item
+        for item in app.user_middleware
+    ]
+    service = StubTransactionService(rows)
+
+    async def override_auth_context() -> AuthContext:
+        return AuthContext(user_id="user-1", access_token="token", email="bench@example.com")
+
+    app.dependency_overrides[get_auth_context] = override_auth_context
+    app.dependency_overrides[get_transaction_service] = lambda: service
+    return app
+
+
+async def measure(app, path: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(path)
+
+        queue = iter(range(total))
+
+        async def worker() -> None:
+            for _ in queue:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - started)
+
+
+async def run(total: int, concurrency: int, rows: int) -> None:
+    paths = ["/health", "/api/v1/transactions"]
+    variants = [
+        ("BaseHTTPMiddleware", LegacyRequestContextMiddleware),
+        ("raw ASGI", RequestContextMiddleware),
+    ]
+    print(f"requests={total} concurrency={concurrency} page_rows={rows}")
+    for path in paths:
+        results: dict[str, float] = {}
+        for label, middleware_cls in variants:
+            results[label] = await measure(build_app(middleware_cls, rows), path, total, concurrency)
+            print(f"{path:<24} {label:<20} {results[label]:>9.0f} req/s")
+        gain = results["raw ASGI"] / results["BaseHTTPMiddleware"] - 1
+        print(f"{path:<24} {'change':<20} {gain:>+9.1%}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark BaseHTTPMiddleware vs raw ASGI request context.",
+    )
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency, args.rows))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Throughput of syncing an offline queue through POST /transactions (one
+# request per row) versus POST /transactions/batch (one array insert).
+# Supabase is simulated with an httpx MockTransport that charges a fixed
+# round-trip time per request plus a small per-row server cost, so the numbers
+# show how much of the sync time is spent on round trips.
+#
+#   python scripts/bench_transaction_batch.py --rows 200 --rtt-ms 40
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("SUPABASE_URL", "https://bench.supabase.co")
+os.environ.setdefault("SUPABASE_ANON_KEY", "bench-anon-key")
+
+import httpx  # noqa: E402
+
+from app.clients.supabase_rest import SupabaseRestClient  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+from app.schemas.transaction import (  # noqa: E402
+    TransactionBatchCreateRequest,
+    TransactionCreateRequest,
+)
+from app.services.transaction_service import TransactionService  # noqa: E402
+
+
+def build_transport(rtt_seconds: float, row_seconds: float) -> httpx.MockTransport:
+    counter = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal counter
+        body = json.loads(request.content)
+        rows = body if isinstance(body, list) else [body]
+        await asyncio.sleep(rtt_seconds + row_seconds * len(rows))
+
+        created = []
+        for row in rows:
+            counter += 1
+            created.append(
+                {
+                    "id": f"00000000-0000-4000-8000-{counter:012d}",
+                    "description": None,
+                    "created_at": row["occurred_at"],
+                    "updated_at": row["occurred_at"],
+                    **row,
+                },
+            )
+        return httpx.Response(201, json=created)
+
+    return httpx.MockTransport(handler)
+
+
+def build_items(rows: int) -> list[TransactionCreateRequest]:
+    return [
+        TransactionCreateRequest(
+            kind="expense",
+            amount=1 + index % 50,
+            cash_wallet_id="11111111-1111-4111-8111-111111111111",
+            category_id="22222222-2222-4222-8222-222222222222",
+        )
+        for index in range(rows)
+    ]
+
+
+async def run(rows: int, rtt_ms: float, row_ms: float) -> None:
+    transport = build_transport(rtt_ms / 1000, row_ms / 1000)
+    items = build_items(rows)
+
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        rest_client = SupabaseRestClient(get_settings(), http_client=http_client)
+        service = TransactionService(rest_client)
+
+        started = time.perf_counter()
+        for item in items:
+            await service.create_transaction(access_token="token", user_id="user-1", request=item)
+        one_by_one = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = await service.create_transactions(
+            access_token="token",
+            user_id="user-1",
+            request=TransactionBatchCreateRequest(items=items),
+        )
+        batch = time.perf_counter() - started
+        assert result.created == rows
+
+    print(f"rows={rows} rtt_ms={rtt_ms} row_ms={row_ms}")
+    print(f"{'one request per row':<22} {one_by_one * 1000:>9.1f} ms {rows / one_by_one:>9.0f} tx/s")
+    print(f"{'batch array insert':<22} {batch * 1000:>9.1f} ms {rows / batch:>9.0f} tx/s")
+    print(f"{'speedup':<22} {one_by_one / batch:>9.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark one-at-a-time vs batch transaction creation.",
+    )
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=40.0)
+    parser.add_argument("--row-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.rtt_ms, args.row_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import psycopg
+from dotenv import load_dotenv
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def rebuild(conn: psycopg.Connection, user_id: str | None) -> int:
+    with conn.cursor() as cur:
+        cur.execute(
+            "select public.rebuild_transaction_monthly_rollups(%s::uuid)",
+            (user_id,),
+        )
+        row = cur.fetchone()
+    conn.commit()
+    return 0 if row is None else int(row[0])
+
+
+def check(conn: psycopg.Connection, user_id: str | None) -> list[tuple]:
+    with conn.cursor() as cur:
+        cur.execute(
+            "select * from public.check_transaction_monthly_rollups(%s::uuid)",
+            (user_id,),
+        )
+        return list(cur.fetchall())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild or verify public.transaction_monthly_rollups.",
+    )
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--user-id", default=None, help="Limit to a single user (uuid).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    load_dotenv(ROOT_DIR / ".env")
+    db_url = os.getenv("SUPABASE_DB_URL", "").strip()
+    if not db_url:
+        print("ERROR: SUPABASE_DB_URL is required in api/.env")
+        return 1
+
+    scope = f"user={args.user_id}" if args.user_id else "all users"
+    try:
+        with psycopg.connect(db_url) as conn:
+            if args.command == "rebuild":
+                rows = rebuild(conn, args.user_id)
+                print(f"Rebuilt rollups for {scope}: rows={rows}")
+                return 0
+
+            mismatches = check(conn, args.user_id)
+    except psycopg.OperationalError as error:
+        print("ERROR: No se pudo conectar a SUPABASE_DB_URL.")
+        print(f"Detalle: {str(error).splitlines()[0]}")
+        return 1
+
+    if not mismatches:
+        print(f"Rollups consistent for {scope}.")
+        return 0
+
+    print(f"Found {len(mismatches)} inconsistent rollup rows for {scope}:")
+    for (
+        user_id,
+        month,
+        kind,
+        category_id,
+        currency,
+        expected_total,
+        actual_total,
+        expected_count,
+        actual_count,
+    ) in mismatches:
+        print(
+            f"- user={user_id} month={month:%Y-%m} kind={kind} category={category_id} "
+            f"currency={currency} total={actual_total} (expected {expected_total}) "
+            f"count={actual_count} (expected {expected_count})"
+        )
+    print("Run `python scripts/rollups.py rebuild` to repair.")
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+-- 0008_transactions_keyset_index.sql
+-- Keyset pagination for GET /transactions orders by (occurred_at desc, id desc).
+-- Adds the id tie-breaker on top of (user_id, occurred_at) so every page is a
+-- single index range scan, however deep the cursor is.
+
+create index if not exists idx_transactions_user_id_occurred_at_id
+  on public.transactions (user_id, occurred_at desc, id desc)
+  where deleted_at is null;
+
+-- idx_transactions_user_id_occurred_at stays: the index above is partial, so
+-- the planner only uses it for queries that filter deleted_at is null. Any
+-- read by (user_id, occurred_at) that also sees tombstones still needs the
+-- full index, and a second index on transactions is cheap next to that.
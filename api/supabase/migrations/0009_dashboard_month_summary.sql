@@ -0,0 +1,35 @@
+-- 0009_dashboard_month_summary.sql
+-- Month totals for GET /dashboard, aggregated in the database so the API only
+-- receives one row per (kind, category, currency) instead of every transaction.
+
+create or replace function public.transaction_month_summary(
+  p_from timestamptz,
+  p_to timestamptz
+)
+returns table (
+  kind text,
+  category_id uuid,
+  currency varchar(3),
+  total numeric,
+  tx_count bigint
+)
+language sql
+stable
+security invoker
+set search_path = public
+as $$
+  select t.kind,
+         t.category_id,
+         t.currency,
+         sum(t.amount) as total,
+         count(*) as tx_count
+    from public.transactions t
+   where t.user_id = (select auth.uid())
+     and t.deleted_at is null
+     and t.occurred_at >= p_from
+     and t.occurred_at < p_to
+   group by t.kind, t.category_id, t.currency;
+$$;
+
+revoke all on function public.transaction_month_summary(timestamptz, timestamptz) from public, anon;
+grant execute on function public.transaction_month_summary(timestamptz, timestamptz) to authenticated;
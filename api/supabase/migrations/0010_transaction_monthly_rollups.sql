@@ -0,0 +1,278 @@
+-- 0010_transaction_monthly_rollups.sql
+-- Pre-aggregated month totals per (user, month, kind, category, currency),
+-- maintained row by row from the transactions triggers. Readers (dashboard,
+-- budgets, insights) scan a few dozen rollup rows instead of transactions.
+
+create table if not exists public.transaction_monthly_rollups (
+  user_id uuid not null references auth.users(id) on delete cascade,
+  month date not null,
+  kind text not null,
+  category_id uuid,
+  currency varchar(3) not null,
+  total numeric(16,2) not null default 0,
+  tx_count bigint not null default 0,
+  updated_at timestamptz not null default timezone('utc', now())
+);
+
+create unique index if not exists uq_transaction_monthly_rollups_key
+  on public.transaction_monthly_rollups (user_id, month, kind, category_id, currency)
+  nulls not distinct;
+
+alter table public.transaction_monthly_rollups enable row level security;
+
+-- Read-only for clients; rows are written exclusively by the trigger below.
+drop policy if exists "transaction_monthly_rollups_select_own" on public.transaction_monthly_rollups;
+create policy "transaction_monthly_rollups_select_own"
+on public.transaction_monthly_rollups
+for select
+to authenticated
+using (user_id = (select auth.uid()));
+
+create or replace function public._tx_rollup_month(p_occurred_at timestamptz)
+returns date
+language sql
+immutable
+set search_path = public
+as $$
+  select date_trunc('month', p_occurred_at at time zone 'utc')::date;
+$$;
+
+create or replace function public._tx_apply_rollup(
+  p_tx public.transactions,
+  p_multiplier int
+)
+returns void
+language plpgsql
+set search_path = public
+as $$
+declare
+  v_month date := public._tx_rollup_month(p_tx.occurred_at);
+  v_currency varchar(3) := upper(p_tx.currency);
+begin
+  insert into public.transaction_monthly_rollups as r (
+    user_id, month, kind, category_id, currency, total, tx_count
+  )
+  values (
+    p_tx.user_id, v_month, p_tx.kind, p_tx.category_id, v_currency,
+    p_tx.amount * p_multiplier, p_multiplier
+  )
+  on conflict (user_id, month, kind, category_id, currency) do update
+    set total = r.total + excluded.total,
+        tx_count = r.tx_count + excluded.tx_count,
+        updated_at = timezone('utc', now());
+
+  if p_multiplier < 0 then
+    delete from public.transaction_monthly_rollups
+     where user_id = p_tx.user_id
+       and month = v_month
+       and kind = p_tx.kind
+       and category_id is not distinct from p_tx.category_id
+       and currency = v_currency
+       and tx_count = 0;
+  end if;
+end;
+$$;
+
+-- Separate trigger function so it can run as security definer (clients have
+-- no write policy on rollups) without widening the balance-effects trigger.
+-- It fires in the same statement and transaction as trg_transactions_apply_effects,
+-- with the same live/soft-deleted transitions.
+create or replace function public.trg_transactions_apply_rollups()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+  if tg_op = 'INSERT' then
+    if new.deleted_at is null then
+      perform public._tx_apply_rollup(new, 1);
+    end if;
+    return new;
+  end if;
+
+  if tg_op = 'UPDATE' then
+    if old.deleted_at is null and new.deleted_at is not null then
+      perform public._tx_apply_rollup(old, -1);
+      return new;
+    end if;
+
+    if old.deleted_at is not null and new.deleted_at is null then
+      perform public._tx_apply_rollup(new, 1);
+      return new;
+    end if;
+
+    if old.deleted_at is null and new.deleted_at is null then
+      if old.kind is distinct from new.kind
+         or old.amount is distinct from new.amount
+         or old.category_id is distinct from new.category_id
+         or upper(old.currency) is distinct from upper(new.currency)
+         or public._tx_rollup_month(old.occurred_at)
+            is distinct from public._tx_rollup_month(new.occurred_at) then
+        perform public._tx_apply_rollup(old, -1);
+        perform public._tx_apply_rollup(new, 1);
+      end if;
+    end if;
+
+    return new;
+  end if;
+
+  if tg_op = 'DELETE' then
+    if old.deleted_at is null then
+      perform public._tx_apply_rollup(old, -1);
+    end if;
+    return old;
+  end if;
+
+  return null;
+end;
+$$;
+
+revoke all on function public._tx_apply_rollup(public.transactions, int) from public, anon, authenticated;
+
+drop trigger if exists trg_transactions_apply_rollups on public.transactions;
+create trigger trg_transactions_apply_rollups
+after insert or update or delete on public.transactions
+for each row execute function public.trg_transactions_apply_rollups();
+
+-- Full recompute from transactions. The exclusive lock makes concurrent
+-- trigger upserts wait, so writes that commit during the rebuild are added
+-- on top of the rebuilt rows instead of being lost.
+create or replace function public.rebuild_transaction_monthly_rollups(
+  p_user_id uuid default null
+)
+returns bigint
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_rows bigint;
+begin
+  lock table public.transaction_monthly_rollups in exclusive mode;
+
+  delete from public.transaction_monthly_rollups
+   where p_user_id is null or user_id = p_user_id;
+
+  insert into public.transaction_monthly_rollups (
+    user_id, month, kind, category_id, currency, total, tx_count
+  )
+  select t.user_id,
+         public._tx_rollup_month(t.occurred_at),
+         t.kind,
+         t.category_id,
+         upper(t.currency),
+         sum(t.amount),
+         count(*)
+    from public.transactions t
+   where t.deleted_at is null
+     and (p_user_id is null or t.user_id = p_user_id)
+   group by 1, 2, 3, 4, 5;
+
+  get diagnostics v_rows = row_count;
+  return v_rows;
+end;
+$$;
+
+-- Rollup rows that disagree with a full scan of transactions (empty = consistent).
+create or replace function public.check_transaction_monthly_rollups(
+  p_user_id uuid default null
+)
+returns table (
+  user_id uuid,
+  month date,
+  kind text,
+  category_id uuid,
+  currency varchar(3),
+  expected_total numeric,
+  actual_total numeric,
+  expected_count bigint,
+  actual_count bigint
+)
+language sql
+stable
+security definer
+set search_path = public
+as $$
+  with expected as (
+    select t.user_id,
+           public._tx_rollup_month(t.occurred_at) as month,
+           t.kind,
+           t.category_id,
+           coalesce(t.category_id, '00000000-0000-0000-0000-000000000000'::uuid) as category_key,
+           upper(t.currency)::varchar(3) as currency,
+           sum(t.amount) as total,
+           count(*) as tx_count
+      from public.transactions t
+     where t.deleted_at is null
+       and (p_user_id is null or t.user_id = p_user_id)
+     group by 1, 2, 3, 4, 5, 6
+  ),
+  actual as (
+    select r.user_id,
+           r.month,
+           r.kind,
+           r.category_id,
+           coalesce(r.category_id, '00000000-0000-0000-0000-000000000000'::uuid) as category_key,
+           r.currency,
+           r.total,
+           r.tx_count
+      from public.transaction_monthly_rollups r
+     where p_user_id is null or r.user_id = p_user_id
+  )
+  select coalesce(e.user_id, a.user_id),
+         coalesce(e.month, a.month),
+         coalesce(e.kind, a.kind),
+         coalesce(e.category_id, a.category_id),
+         coalesce(e.currency, a.currency),
+         coalesce(e.total, 0),
+         coalesce(a.total, 0),
+         coalesce(e.tx_count, 0),
+         coalesce(a.tx_count, 0)
+    from expected e
+    full outer join actual a
+      on a.user_id = e.user_id
+     and a.month = e.month
+     and a.kind = e.kind
+     and a.category_key = e.category_key
+     and a.currency = e.currency
+   where coalesce(e.total, 0) <> coalesce(a.total, 0)
+      or coalesce(e.tx_count, 0) <> coalesce(a.tx_count, 0);
+$$;
+
+revoke all on function public.rebuild_transaction_monthly_rollups(uuid) from public, anon, authenticated;
+revoke all on function public.check_transaction_monthly_rollups(uuid) from public, anon, authenticated;
+
+-- Backfill existing history.
+select public.rebuild_transaction_monthly_rollups();
+
+-- The dashboard month summary now reads the rollups instead of scanning
+-- transactions. Rollups are month-granular, so the window is widened to
+-- whole UTC months.
+create or replace function public.transaction_month_summary(
+  p_from timestamptz,
+  p_to timestamptz
+)
+returns table (
+  kind text,
+  category_id uuid,
+  currency varchar(3),
+  total numeric,
+  tx_count bigint
+)
+language sql
+stable
+security invoker
+set search_path = public
+as $$
+  select r.kind,
+         r.category_id,
+         r.currency,
+         sum(r.total) as total,
+         sum(r.tx_count)::bigint as tx_count
+    from public.transaction_monthly_rollups r
+   where r.user_id = (select auth.uid())
+     and r.month >= public._tx_rollup_month(p_from)
+     and r.month < public._tx_rollup_month(p_to - interval '1 microsecond') + interval '1 month'
+   group by r.kind, r.category_id, r.currency;
+$$;
@@ -0,0 +1,79 @@
+-- 0011_budgets.sql
+-- Monthly budgets per expense category and their 80%/100% alerts (SRS M6).
+-- Spend is read from transaction_monthly_rollups (0010), never from transactions.
+
+create table if not exists public.budgets (
+  id uuid primary key default gen_random_uuid(),
+  user_id uuid not null references auth.users(id) on delete cascade,
+  category_id uuid not null references public.categories(id),
+  amount numeric(14,2) not null check (amount > 0),
+  currency varchar(3) not null default 'USD',
+  created_at timestamptz not null default timezone('utc', now()),
+  updated_at timestamptz not null default timezone('utc', now()),
+  deleted_at timestamptz null
+);
+
+create unique index if not exists uq_budgets_user_category_currency
+  on public.budgets (user_id, category_id, currency)
+  where deleted_at is null;
+
+drop trigger if exists trg_budgets_updated_at on public.budgets;
+create trigger trg_budgets_updated_at
+before update on public.budgets
+for each row execute function public.set_updated_at();
+
+-- One row per (budget, month, threshold): the unique key is the anti-spam
+-- guard, so re-evaluating after every write never fires the same alert twice.
+create table if not exists public.budget_alerts (
+  id uuid primary key default gen_random_uuid(),
+  user_id uuid not null references auth.users(id) on delete cascade,
+  budget_id uuid not null references public.budgets(id) on delete cascade,
+  month date not null,
+  threshold int not null check (threshold in (80, 100)),
+  spent numeric(16,2) not null,
+  amount numeric(14,2) not null,
+  created_at timestamptz not null default timezone('utc', now()),
+  unique (budget_id, month, threshold)
+);
+
+create index if not exists idx_budget_alerts_user_id_month
+  on public.budget_alerts (user_id, month);
+
+alter table public.budgets enable row level security;
+alter table public.budget_alerts enable row level security;
+
+drop policy if exists "budgets_select_own" on public.budgets;
+create policy "budgets_select_own"
+on public.budgets
+for select
+to authenticated
+using (user_id = (select auth.uid()) and deleted_at is null);
+
+drop policy if exists "budgets_insert_own" on public.budgets;
+create policy "budgets_insert_own"
+on public.budgets
+for insert
+to authenticated
+with check (user_id = (select auth.uid()));
+
+drop policy if exists "budgets_update_own" on public.budgets;
+create policy "budgets_update_own"
+on public.budgets
+for update
+to authenticated
+using (user_id = (select auth.uid()) and deleted_at is null)
+with check (user_id = (select auth.uid()));
+
+drop policy if exists "budget_alerts_select_own" on public.budget_alerts;
+create policy "budget_alerts_select_own"
+on public.budget_alerts
+for select
+to authenticated
+using (user_id = (select auth.uid()));
+
+drop policy if exists "budget_alerts_insert_own" on public.budget_alerts;
+create policy "budget_alerts_insert_own"
+on public.budget_alerts
+for insert
+to authenticated
+with check (user_id = (select auth.uid()));
@@ -0,0 +1,134 @@
+-- 0012_delta_sync.sql
+-- GET /sync returns the rows of a user that changed after a watermark,
+-- including soft-deleted ones as tombstones. set_updated_at() already bumps
+-- updated_at on every update (soft deletes and trigger-driven balance changes
+-- included), so (user_id, updated_at, id) is enough to find them; the indexes
+-- are not partial because tombstones must stay visible.
+
+create index if not exists idx_cash_wallets_user_id_updated_at
+  on public.cash_wallets (user_id, updated_at, id);
+create index if not exists idx_bank_accounts_user_id_updated_at
+  on public.bank_accounts (user_id, updated_at, id);
+create index if not exists idx_credit_cards_user_id_updated_at
+  on public.credit_cards (user_id, updated_at, id);
+create index if not exists idx_categories_user_id_updated_at
+  on public.categories (user_id, updated_at, id);
+create index if not exists idx_transactions_user_id_updated_at
+  on public.transactions (user_id, updated_at, id);
+
+-- Changes are ordered by (updated_at, entity, id) and the watermark is the
+-- last key the client has seen. Each table contributes at most p_limit + 1
+-- rows through a range scan of its index, so an up-to-date client costs five
+-- index probes. Security definer because the select policies hide
+-- soft-deleted rows; every branch filters on auth.uid() explicitly.
+create or replace function public.sync_changes(
+  p_since timestamptz default null,
+  p_since_entity text default '',
+  p_since_id uuid default '00000000-0000-0000-0000-000000000000',
+  p_limit integer default 500
+)
+returns table (
+  server_time timestamptz,
+  changes jsonb
+)
+language plpgsql
+stable
+security definer
+set search_path = public
+as $$
+declare
+  v_user_id uuid := auth.uid();
+  v_limit integer := least(greatest(coalesce(p_limit, 500), 1), 1000) + 1;
+  v_changes jsonb;
+begin
+  if v_user_id is null then
+    raise exception 'sync_changes requires an authenticated user'
+      using errcode = '42501';
+  end if;
+
+  with candidates as (
+    (select 'bank_accounts'::text collate "C" as entity, t.id, t.updated_at, t.deleted_at,
+            to_jsonb(t) - 'user_id' - 'deleted_at' as data
+       from public.bank_accounts t
+      where t.user_id = v_user_id
+        and (p_since is null
+             or (t.updated_at >= p_since
+                 and (t.updated_at, 'bank_accounts' collate "C", t.id)
+                   > (p_since, p_since_entity collate "C", p_since_id)))
+      order by t.updated_at, t.id
+      limit v_limit)
+    union all
+    (select 'cash_wallets' collate "C", t.id, t.updated_at, t.deleted_at,
+            to_jsonb(t) - 'user_id' - 'deleted_at'
+       from public.cash_wallets t
+      where t.user_id = v_user_id
+        and (p_since is null
+             or (t.updated_at >= p_since
+                 and (t.updated_at, 'cash_wallets' collate "C", t.id)
+                   > (p_since, p_since_entity collate "C", p_since_id)))
+      order by t.updated_at, t.id
+      limit v_limit)
+    union all
+    (select 'categories' collate "C", t.id, t.updated_at, t.deleted_at,
+            to_jsonb(t) - 'user_id' - 'deleted_at'
+       from public.categories t
+      where t.user_id = v_user_id
+        and (p_since is null
+             or (t.updated_at >= p_since
+                 and (t.updated_at, 'categories' collate "C", t.id)
+                   > (p_since, p_since_entity collate "C", p_since_id)))
+      order by t.updated_at, t.id
+      limit v_limit)
+    union all
+    (select 'credit_cards' collate "C", t.id, t.updated_at, t.deleted_at,
+            to_jsonb(t) - 'user_id' - 'deleted_at'
+       from public.credit_cards t
+      where t.user_id = v_user_id
+        and (p_since is null
+             or (t.updated_at >= p_since
+                 and (t.updated_at, 'credit_cards' collate "C", t.id)
+                   > (p_since, p_since_entity collate "C", p_since_id)))
+      order by t.updated_at, t.id
+      limit v_limit)
+    union all
+    (select 'transactions' collate "C", t.id, t.updated_at, t.deleted_at,
+            to_jsonb(t) - 'user_id' - 'deleted_at'
+       from public.transactions t
+      where t.user_id = v_user_id
+        and (p_since is null
+             or (t.updated_at >= p_since
+                 and (t.updated_at, 'transactions' collate "C", t.id)
+                   > (p_since, p_since_entity collate "C", p_since_id)))
+      order by t.updated_at, t.id
+      limit v_limit)
+  ),
+  page as (
+    select *
+      from candidates
+     order by updated_at, entity, id
+     limit v_limit
+  )
+  select coalesce(
+           jsonb_agg(
+             jsonb_build_object(
+               'entity', page.entity,
+               'id', page.id,
+               'updated_at', page.updated_at,
+               'deleted_at', page.deleted_at,
+               'data', case when page.deleted_at is null then page.data end
+             )
+             order by page.updated_at, page.entity, page.id
+           ),
+           '[]'::jsonb
+         )
+    into v_changes
+    from page;
+
+  -- server_time lets the API hold the watermark back from rows written by
+  -- transactions that may still be in flight.
+  return query select now(), v_changes;
+end;
+$$;
+
+revoke all on function public.sync_changes(timestamptz, text, uuid, integer) from public, anon;
+grant execute on function public.sync_changes(timestamptz, text, uuid, integer) to authenticated;
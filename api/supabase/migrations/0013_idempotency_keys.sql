@@ -0,0 +1,71 @@
+-- 0013_idempotency_keys.sql
+-- Durable Idempotency-Key records for create endpoints, used when
+-- IDEMPOTENCY_DURABLE=true so that a retry reaching another API worker is
+-- still answered with the first response instead of a second insert.
+-- A row without response is a reservation held by the request in flight.
+
+create table if not exists public.idempotency_keys (
+  user_id uuid not null references auth.users(id) on delete cascade,
+  scope text not null,
+  key text not null check (char_length(key) between 1 and 255),
+  request_hash text not null,
+  response jsonb null,
+  created_at timestamptz not null default timezone('utc', now()),
+  primary key (user_id, scope, key)
+);
+
+-- Expired keys are removed by purge_idempotency_keys(); the API also ignores
+-- rows older than IDEMPOTENCY_TTL_SECONDS.
+create index if not exists idx_idempotency_keys_created_at
+  on public.idempotency_keys (created_at);
+
+alter table public.idempotency_keys enable row level security;
+
+drop policy if exists "idempotency_keys_select_own" on public.idempotency_keys;
+create policy "idempotency_keys_select_own"
+on public.idempotency_keys
+for select
+to authenticated
+using (user_id = (select auth.uid()));
+
+drop policy if exists "idempotency_keys_insert_own" on public.idempotency_keys;
+create policy "idempotency_keys_insert_own"
+on public.idempotency_keys
+for insert
+to authenticated
+with check (user_id = (select auth.uid()));
+
+drop policy if exists "idempotency_keys_update_own" on public.idempotency_keys;
+create policy "idempotency_keys_update_own"
+on public.idempotency_keys
+for update
+to authenticated
+using (user_id = (select auth.uid()))
+with check (user_id = (select auth.uid()));
+
+drop policy if exists "idempotency_keys_delete_own" on public.idempotency_keys;
+create policy "idempotency_keys_delete_own"
+on public.idempotency_keys
+for delete
+to authenticated
+using (user_id = (select auth.uid()));
+
+create or replace function public.purge_idempotency_keys(
+  p_older_than interval default interval '1 day'
+)
+returns bigint
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_rows bigint;
+begin
+  delete from public.idempotency_keys
+   where created_at < timezone('utc', now()) - p_older_than;
+  get diagnostics v_rows = row_count;
+  return v_rows;
+end;
+$$;
+
+revoke all on function public.purge_idempotency_keys(interval) from public, anon, authenticated;
@@ -0,0 +1,178 @@
+import math
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.core.exceptions import AppException
+from app.schemas.amortization import AmortizationScheduleRequest, ExtraPayment
+from app.services.amortization_service import (
+    AmortizationService,
+    build_plan,
+    schedule_arrays,
+    total_interest,
+)
+
+
+def _loop_schedule(request: AmortizationScheduleRequest) -> list[tuple[float, float, float, float]]:
+    # Straightforward per-installment reference the vectorized version must match.
+    rate = request.annual_rate / 100 / 12
+    periods = request.periods
+    extras: dict[int, float] = {}
+    for extra in request.extra_payments:
+        extras[extra.installment] = extras.get(extra.installment, 0.0) + extra.amount
+
+    def level(balance: float, term: int) -> float:
+        if request.method == "french":
+            return balance / term if rate == 0 else balance * rate / (1 - (1 + rate) ** -term)
+        return balance / term
+
+    balance = request.principal
+    amount = level(balance, periods)
+    rows = []
+    installment = 0
+    while balance > 0.005:
+        installment += 1
+        interest = balance * rate
+        if request.method == "french":
+            principal = min(amount - interest, balance)
+        elif request.method == "german":
+            principal = min(amount, balance)
+        else:
+            principal = 0.0
+        if installment == periods:
+            principal = balance
+        balance -= principal
+        extra = min(extras.get(installment, 0.0), balance) if installment < periods else 0.0
+        balance -= extra
+        rows.append((interest, principal, extra, balance))
+        if extra and (request.method == "american" or request.extra_payment_strategy == "reduce_payment"):
+            amount = level(balance, periods - installment) if balance > 0.005 else amount
+    return rows
+
+
+CASES = [
+    {"method": "french"},
+    {"method": "german"},
+    {"method": "american"},
+    {"method": "french", "annual_rate": 0},
+    {
+        "method": "french",
+        "extra_payments": [ExtraPayment(installment=12, amount=20_000), ExtraPayment(installment=60, amount=5_000)],
+    },
+    {
+        "method": "french",
+        "extra_payment_strategy": "reduce_payment",
+        "extra_payments": [ExtraPayment(installment=12, amount=20_000), ExtraPayment(installment=60, amount=5_000)],
+    },
+    {
+        "method": "german",
+        "extra_payments": [ExtraPayment(installment=24, amount=15_000)],
+    },
+    {
+        "method": "german",
+        "extra_payment_strategy": "reduce_payment",
+        "extra_payments": [ExtraPayment(installment=24, amount=15_000)],
+    },
+    {
+        "method": "american",
+        "extra_payments": [ExtraPayment(installment=10, amount=30_000)],
+    },
+]
+
+
+@pytest.mark.parametrize("overrides", CASES)
+def test_vectorized_schedule_matches_loop(overrides: dict) -> None:
+    request = AmortizationScheduleRequest(
+        **{"principal": 100_000, "annual_rate": 9.5, "periods": 120, **overrides}
+    )
+    expected = np.array(_loop_schedule(request))
+
+    plan = build_plan(request)
+    arrays = schedule_arrays(plan, 0, plan.periods)
+
+    assert plan.periods == len(expected)
+    np.testing.assert_allclose(arrays.interest, expected[:, 0], atol=1e-6)
+    np.testing.assert_allclose(arrays.principal, expected[:, 1], atol=1e-6)
+    np.testing.assert_allclose(arrays.extra_payment, expected[:, 2], atol=1e-6)
+    np.testing.assert_allclose(arrays.balance, expected[:, 3], atol=1e-6)
+    assert total_interest(plan) == pytest.approx(expected[:, 0].sum(), abs=1e-6)
+
+
+def test_extra_payment_leaves_earlier_installments_untouched() -> None:
+    base = AmortizationScheduleRequest(principal=250_000, annual_rate=7, periods=360)
+    with_extra = base.model_copy(update={"extra_payments": [ExtraPayment(installment=100, amount=50_000)]})
+
+    before = schedule_arrays(build_plan(base), 0, 100)
+    after = schedule_arrays(build_plan(with_extra), 0, 100)
+
+    np.testing.assert_array_equal(before.payment, after.payment)
+    assert build_plan(with_extra).periods < 360
+
+
+def test_payoff_by_extra_payment_ends_schedule() -> None:
+    request = AmortizationScheduleRequest(
+        principal=10_000,
+        annual_rate=12,
+        periods=24,
+        extra_payments=[ExtraPayment(installment=6, amount=1_000_000)],
+    )
+
+    plan = build_plan(request)
+    arrays = schedule_arrays(plan, 0, plan.periods)
+
+    assert plan.periods == 6
+    assert arrays.balance[-1] == 0
+    assert arrays.extra_payment[-1] == pytest.approx(arrays.balance[-2] - arrays.principal[-1])
+
+
+def test_schedule_page_only_returns_requested_rows() -> None:
+    service = AmortizationService()
+    request = AmortizationScheduleRequest(
+        principal=200_000,
+        annual_rate=6,
+        periods=360,
+        start_date=date(2026, 1, 31),
+    )
+
+    page = service.schedule_page(request=request, offset=0, limit=2)
+    last = service.schedule_page(request=request, offset=350, limit=50)
+
+    assert [row.installment for row in page.rows] == [1, 2]
+    assert [row.due_date for row in page.rows] == [date(2026, 2, 28), date(2026, 3, 31)]
+    assert page.payment == 1199.1
+    assert page.next_offset == 2
+    assert len(last.rows) == 10
+    assert last.next_offset is None
+    assert last.rows[-1].balance == 0
+    assert page.total_paid == pytest.approx(200_000 + page.total_interest)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"annual_rate": 1000, "periodicity": "daily", "periods": 50_000},
+        {"annual_rate": 240, "periods": 50_000},
+        {"annual_rate": 240, "periods": 50_000, "extra_payments": [ExtraPayment(installment=10, amount=1_000)]},
+    ],
+)
+def test_long_high_rate_loans_stay_finite(overrides: dict) -> None:
+    request = AmortizationScheduleRequest(principal=100_000, **overrides)
+
+    service = AmortizationService()
+    periods = service.schedule_page(request=request, limit=1).periods
+    page = service.schedule_page(request=request, offset=max(0, periods - 20), limit=20)
+
+    assert math.isfinite(page.total_interest)
+    assert all(math.isfinite(row.balance) and math.isfinite(row.payment) for row in page.rows)
+    assert page.rows[-1].balance == 0
+
+
+def test_amounts_too_large_to_compute_are_rejected() -> None:
+    request = AmortizationScheduleRequest(principal=1e306, annual_rate=1000, periods=50_000)
+
+    with pytest.raises(AppException) as exc_info:
+        AmortizationService().schedule_page(request=request)
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.code == "AMORTIZATION_OUT_OF_RANGE"
@@ -0,0 +1,204 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend
+from app.core.config import Settings
+from app.dependencies.container import build_container
+from app.core.snapshots import AssetSnapshotCache
+from app.schemas.transaction import TransactionCreateRequest
+from app.services.cash_wallet_service import CashWalletService
+from app.services.transaction_service import TransactionService
+
+WALLET_ID = "11111111-1111-4111-8111-111111111111"
+
+
+class AssetRestClient:
+    # Wallet balance moves with every transaction, like the effects trigger.
+    def __init__(self) -> None:
+        self.balance = 100.0
+        self.list_calls = 0
+        self.list_delay = 0.0
+
+    async def list_cash_wallets_json(self, *, access_token: str, user_id: str) -> bytes:
+        self.list_calls += 1
+        balance = self.balance
+        await asyncio.sleep(self.list_delay)
+        return json.dumps(
+            [
+                {
+                    "id": WALLET_ID,
+                    "name": "Efectivo",
+                    "balance": balance,
+                    "currency": "USD",
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "updated_at": "2026-01-01T00:00:00Z",
+                }
+            ]
+        ).encode()
+
+    async def create_transaction(self, *, access_token: str, payload: dict) -> dict:
+        self.balance += payload["amount"]
+        return {
+            **{key: value for key, value in payload.items() if key != "user_id"},
+            "id": "tx-1",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+        }
+
+
+def _services(client: AssetRestClient) -> tuple[CashWalletService, TransactionService]:
+    snapshots = AssetSnapshotCache(MemoryCacheBackend(max_entries=100, ttl_seconds=300))
+    return (
+        CashWalletService(client, snapshots=snapshots),
+        TransactionService(client, snapshots=snapshots),
+    )
+
+
+async def _income(service: TransactionService, user_id: str = "user-a") -> None:
+    await service.create_transaction(
+        access_token="token",
+        user_id=user_id,
+        request=TransactionCreateRequest(kind="income", amount=50, cash_wallet_id=WALLET_ID),
+    )
+
+
+@pytest.mark.asyncio
+async def test_wallet_list_is_served_from_snapshot_until_a_write() -> None:
+    client = AssetRestClient()
+    wallets, transactions = _services(client)
+
+    first = await wallets.list_wallets(access_token="token", user_id="user-a")
+    second = await wallets.list_wallets(access_token="token", user_id="user-a")
+    await _income(transactions)
+    after_write = await wallets.list_wallets(access_token="token", user_id="user-a")
+
+    assert first == second
+    assert first[0].balance == 100.0
+    assert after_write[0].balance == 150.0
+    assert client.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_write_only_invalidates_that_user() -> None:
+    client = AssetRestClient()
+    wallets, transactions = _services(client)
+
+    await wallets.list_wallets(access_token="token", user_id="user-a")
+    await wallets.list_wallets(access_token="token", user_id="user-b")
+    await _income(transactions, user_id="user-b")
+    await wallets.list_wallets(access_token="token", user_id="user-a")
+
+    assert client.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_never_serves_stale_balance_afterwards() -> None:
+    client = AssetRestClient()
+    client.list_delay = 0.02
+    wallets, transactions = _services(client)
+
+    # The slow read sees the old balance and finishes after the write.
+    slow_read = asyncio.create_task(wallets.list_wallets(access_token="token", user_id="user-a"))
+    await asyncio.sleep(0.005)
+    await _income(transactions)
+    stale = await slow_read
+
+    client.list_delay = 0.0
+    fresh = await wallets.list_wallets(access_token="token", user_id="user-a")
+
+    assert stale[0].balance == 100.0
+    assert fresh[0].balance == 150.0
+
+
+class FlakyVersionBackend(MemoryCacheBackend):
+    # Reads work, but moving or dropping a version fails (Redis hiccup).
+    def __init__(self) -> None:
+        super().__init__(max_entries=100, ttl_seconds=300)
+        self.broken = False
+
+    async def set(self, key: str, value: bytes, *, strict: bool = False) -> None:
+        if strict and self.broken:
+            raise ConnectionError("redis down")
+        await super().set(key, value, strict=strict)
+
+    async def delete(self, key: str, *, strict: bool = False) -> None:
+        if strict and self.broken:
+            raise ConnectionError("redis down")
+        await super().delete(key, strict=strict)
+
+
+@pytest.mark.asyncio
+async def test_failed_bump_stops_serving_snapshots_for_that_user() -> None:
+    client = AssetRestClient()
+    backend = FlakyVersionBackend()
+    snapshots = AssetSnapshotCache(backend)
+    wallets = CashWalletService(client, snapshots=snapshots)
+    transactions = TransactionService(client, snapshots=snapshots)
+
+    await wallets.list_wallets(access_token="token", user_id="user-a")
+    backend.broken = True
+    await _income(transactions)
+    after_write = await wallets.list_wallets(access_token="token", user_id="user-a")
+
+    assert after_write[0].balance == 150.0
+    assert client.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_bypass_keeps_every_user_up_to_the_cache_size() -> None:
+    backend = FlakyVersionBackend()
+    snapshots = AssetSnapshotCache(backend, max_entries=3)
+    loads: list[str] = []
+
+    async def load(user_id: str) -> bytes:
+        loads.append(user_id)
+        return b"[]"
+
+    users = ["user-a", "user-b", "user-c"]
+    for user_id in users:
+        await snapshots.get_or_load(user_id=user_id, kind="wallets", load=lambda: load(user_id))
+    backend.broken = True
+    for user_id in users:
+        await snapshots.bump(user_id)
+    for user_id in users:
+        await snapshots.get_or_load(user_id=user_id, kind="wallets", load=lambda: load(user_id))
+
+    # The stale entries are still cached, yet every user reloads.
+    assert loads == users + users
+
+
+@pytest.mark.asyncio
+async def test_container_sizes_bypass_like_the_asset_cache() -> None:
+    container = build_container(
+        Settings(
+            supabase_url="https://project.supabase.co",
+            supabase_anon_key="anon-key",
+            cache_backend="memory",
+            asset_cache_single_worker=True,
+            asset_cache_max_entries=40_000,
+        )
+    )
+    try:
+        assert container.asset_snapshots is not None
+        assert container.asset_snapshots._bypass._max_entries == 40_000
+    finally:
+        await container.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("single_worker", "enabled"), [(False, False), (True, True)])
+async def test_memory_snapshots_need_single_worker_opt_in(single_worker: bool, enabled: bool) -> None:
+    container = build_container(
+        Settings(
+            supabase_url="https://project.supabase.co",
+            supabase_anon_key="anon-key",
+            cache_backend="memory",
+            asset_cache_single_worker=single_worker,
+        )
+    )
+    try:
+        assert (container.asset_snapshots is not None) is enabled
+    finally:
+        await container.aclose()
@@ -0,0 +1,152 @@
+import pytest
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+
+from app.clients.supabase_rest import SupabaseRestClient
+from app.core.config import Settings, get_settings
+from app.core.exceptions import AppException
+from app.dependencies.auth import (
+    build_auth_context_from_claims,
+    get_auth_context,
+    get_container,
+    get_rest_client,
+    get_transaction_service,
+)
+from app.dependencies.container import AppContainer
+from app.main import create_app
+from app.schemas.auth import MeResponse
+from app.services.transaction_service import TransactionService
+
+
+def _settings(**overrides: object) -> Settings:
+    return Settings(
+        supabase_url="https://project.supabase.co",
+        supabase_anon_key="anon-key",
+        **overrides,
+    )
+
+
+def _claims() -> dict:
+    return {
+        "sub": "user-1",
+        "email": "user@example.com",
+        "amr": [
+            {"method": "password", "timestamp": 1767225600},
+            {"method": "otp", "timestamp": 1767229200},
+        ],
+    }
+
+
+class _StubVerifier:
+    async def verify_access_token(self, token: str) -> dict:
+        return _claims()
+
+
+class _StubAuthService:
+    def __init__(self) -> None:
+        self.me_calls = 0
+
+    async def me(self, *, access_token: str) -> MeResponse:
+        self.me_calls += 1
+        return MeResponse(id="user-1", email="user@example.com")
+
+
+def _credentials() -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials="token-abc")
+
+
+@pytest.mark.asyncio
+async def test_local_mode_builds_context_without_user_lookup() -> None:
+    auth_service = _StubAuthService()
+
+    context = await get_auth_context(
+        credentials=_credentials(),
+        settings=_settings(auth_verification_mode="local"),
+        auth_service=auth_service,  # type: ignore[arg-type]
+        verifier=_StubVerifier(),  # type: ignore[arg-type]
+    )
+
+    assert auth_service.me_calls == 0
+    assert context.user_id == "user-1"
+    assert context.email == "user@example.com"
+    assert context.access_token == "token-abc"
+    assert context.last_sign_in_at == "2026-01-01T01:00:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_remote_mode_confirms_user_with_auth_service() -> None:
+    auth_service = _StubAuthService()
+
+    context = await get_auth_context(
+        credentials=_credentials(),
+        settings=_settings(),
+        auth_service=auth_service,  # type: ignore[arg-type]
+        verifier=_StubVerifier(),  # type: ignore[arg-type]
+    )
+
+    assert auth_service.me_calls == 1
+    assert context.user_id == "user-1"
+
+
+def test_claims_without_email_are_rejected() -> None:
+    with pytest.raises(AppException) as exc:
+        build_auth_context_from_claims("token", {"sub": "user-1"})
+
+    assert exc.value.code == "INVALID_TOKEN_CLAIMS"
+
+
+def test_dependencies_resolve_to_application_singletons() -> None:
+    app = create_app()
+    resolved: list[object] = []
+
+    @app.get("/probe")
+    def probe(
+        container: AppContainer = Depends(get_container),
+        rest_client: SupabaseRestClient = Depends(get_rest_client),
+        transaction_service: TransactionService = Depends(get_transaction_service),
+    ) -> dict[str, bool]:
+        resolved.append(transaction_service)
+        return {
+            "rest_client": rest_client is container.rest_client,
+            "transaction_service": transaction_service is container.transaction_service,
+        }
+
+    with TestClient(app) as client:
+        first = client.get("/probe").json()
+        client.get("/probe")
+
+    assert first == {"rest_client": True, "transaction_service": True}
+    assert resolved[0] is resolved[1]
+
+
+@pytest.fixture
+def metrics_settings(monkeypatch: pytest.MonkeyPatch):
+    def configure(**env: str) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+
+    yield configure
+    get_settings.cache_clear()
+
+
+def test_metrics_are_disabled_by_default(metrics_settings) -> None:
+    metrics_settings()
+
+    with TestClient(create_app()) as client:
+        assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_require_token_when_configured(metrics_settings) -> None:
+    metrics_settings(METRICS_ENABLED="true", METRICS_TOKEN="s3cret")
+
+    with TestClient(create_app()) as client:
+        missing = client.get("/metrics")
+        wrong = client.get("/metrics", headers={"X-Metrics-Token": "nope"})
+        allowed = client.get("/metrics", headers={"X-Metrics-Token": "s3cret"})
+
+    assert missing.status_code == wrong.status_code == 401
+    assert missing.json()["code"] == "METRICS_UNAUTHORIZED"
+    assert allowed.status_code == 200
+    assert "jwt_verifier" in allowed.json()
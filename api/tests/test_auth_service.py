@@ -1,5 +1,6 @@
 import pytest
 
+from app.core.cache import TTLCache
 from app.core.exceptions import AppException
 from app.services.auth_service import AuthService, build_session_response
 
@@ -73,11 +74,13 @@ class _FakeAuthClient:
         sign_up_payload: dict | None = None,
         sign_in_payload: dict | None = None,
         admin_error: AppException | None = None,
+        user_payload: dict | None = None,
     ) -> None:
         self.has_service_role = has_service_role
         self.sign_up_payload = sign_up_payload or {}
         self.sign_in_payload = sign_in_payload or {}
         self.admin_error = admin_error
+        self.user_payload = user_payload or {}
         self.calls: list[str] = []
 
     async def admin_create_user(self, *, email: str, password: str, email_confirm: bool) -> dict:
@@ -106,7 +109,7 @@ class _FakeAuthClient:
 
     async def get_user(self, *, access_token: str) -> dict:
         self.calls.append("get_user")
-        return {}
+        return self.user_payload
 
 
 @pytest.mark.asyncio
@@ -168,3 +171,40 @@ async def test_sign_up_maps_existing_email_to_conflict() -> None:
     assert exc.value.status_code == 409
     assert exc.value.code == "EMAIL_ALREADY_REGISTERED"
     assert client.calls == ["admin_create_user"]
+
+
+@pytest.mark.asyncio
+async def test_me_serves_repeated_tokens_from_user_cache() -> None:
+    client = _FakeAuthClient(
+        has_service_role=False,
+        user_payload={"id": "user-id", "email": "user@example.com"},
+    )
+    service = AuthService(  # type: ignore[arg-type]
+        client,
+        user_cache=TTLCache(max_entries=10, ttl_seconds=30),
+    )
+
+    first = await service.me(access_token="token-1")
+    second = await service.me(access_token="token-1")
+    await service.me(access_token="token-2")
+
+    assert first == second
+    assert client.calls == ["get_user", "get_user"]
+
+
+@pytest.mark.asyncio
+async def test_sign_out_evicts_cached_user() -> None:
+    client = _FakeAuthClient(
+        has_service_role=False,
+        user_payload={"id": "user-id", "email": "user@example.com"},
+    )
+    service = AuthService(  # type: ignore[arg-type]
+        client,
+        user_cache=TTLCache(max_entries=10, ttl_seconds=30),
+    )
+
+    await service.me(access_token="token-1")
+    await service.sign_out(access_token="token-1")
+    await service.me(access_token="token-1")
+
+    assert client.calls == ["get_user", "sign_out", "get_user"]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from app.core.exceptions import AppException
@@ -6,6 +8,10 @@ from app.services.bank_account_service import BankAccountService
 
 
 class DummyRestClient:
+    async def list_bank_accounts_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_bank_accounts(**kwargs)).encode()
+
     async def list_bank_accounts(self, *, access_token: str, user_id: str) -> list[dict]:
         return [
             {
@@ -50,6 +56,10 @@ class DummyRestClient:
 
 
 class MissingTableRestClient:
+    async def list_bank_accounts_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_bank_accounts(**kwargs)).encode()
+
     async def list_bank_accounts(self, *, access_token: str, user_id: str) -> list[dict]:
         raise AppException(
             status_code=400,
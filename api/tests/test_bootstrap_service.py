@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions import AppException
+from app.services.bootstrap_service import BootstrapService
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+
+
+class _ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def enter(self) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+class _Stub:
+    def __init__(self, probe: _ConcurrencyProbe, result: object, error: AppException | None = None) -> None:
+        self._probe = probe
+        self._result = result
+        self._error = error
+
+    async def __call__(self, *, access_token: str, user_id: str) -> object:
+        await self._probe.enter()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class _Service:
+    def __init__(self, **methods: _Stub) -> None:
+        for name, method in methods.items():
+            setattr(self, name, method)
+
+
+def _build(probe: _ConcurrencyProbe, profile_error: AppException | None = None) -> BootstrapService:
+    profile = {
+        "id": "user-1",
+        "base_currency": "USD",
+        "ai_enabled": False,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+    wallet = {
+        "id": "wallet-1",
+        "name": "Cash",
+        "balance": 10.0,
+        "currency": "USD",
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+    return BootstrapService(
+        profile_service=_Service(get_profile=_Stub(probe, profile, profile_error)),  # type: ignore[arg-type]
+        cash_wallet_service=_Service(list_wallets=_Stub(probe, [wallet])),  # type: ignore[arg-type]
+        bank_account_service=_Service(list_accounts=_Stub(probe, [])),  # type: ignore[arg-type]
+        credit_card_service=_Service(list_cards=_Stub(probe, [])),  # type: ignore[arg-type]
+        category_service=_Service(list_categories=_Stub(probe, [])),  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_loads_all_collections_concurrently() -> None:
+    probe = _ConcurrencyProbe()
+
+    payload = await _build(probe).load(access_token="token", user_id="user-1")
+
+    assert probe.max_active == 5
+    assert payload.profile.id == "user-1"
+    assert payload.cash_wallets[0].name == "Cash"
+    assert payload.categories == []
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_propagates_service_errors() -> None:
+    error = AppException(status_code=404, code="PROFILE_NOT_FOUND", message="Profile not found.")
+
+    with pytest.raises(AppException) as exc:
+        await _build(_ConcurrencyProbe(), profile_error=error).load(
+            access_token="token",
+            user_id="user-1",
+        )
+
+    assert exc.value.code == "PROFILE_NOT_FOUND"
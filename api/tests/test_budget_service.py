@@ -0,0 +1,213 @@
+from datetime import UTC, date, datetime
+
+import pytest
+
+from app.core.exceptions import AppException
+from app.schemas.transaction import TransactionCreateRequest
+from app.services.budget_service import BudgetService
+from app.services.transaction_service import TransactionService
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+
+
+class BudgetRestClient:
+    def __init__(self, spend: list[dict] | None = None) -> None:
+        self.spend = spend or []
+        self.alerts: dict[tuple[str, str, int], dict] = {}
+        self.spend_months: list[date] = []
+        self.insert_calls = 0
+
+    async def list_budgets(self, *, access_token: str, user_id: str) -> list[dict]:
+        return [
+            {
+                "id": "budget-food",
+                "category_id": "cat-food",
+                "amount": 200,
+                "currency": "USD",
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+            },
+            {
+                "id": "budget-fun",
+                "category_id": "cat-fun",
+                "amount": 100,
+                "currency": "USD",
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+            },
+        ]
+
+    async def list_monthly_spend(self, *, access_token: str, user_id: str, month: date) -> list[dict]:
+        self.spend_months.append(month)
+        return self.spend
+
+    async def create_budget_alerts(self, *, access_token: str, payloads: list[dict]) -> list[dict]:
+        # Mimics ON CONFLICT DO NOTHING: only new rows are returned.
+        self.insert_calls += 1
+        created = []
+        for payload in payloads:
+            key = (payload["budget_id"], payload["month"], payload["threshold"])
+            if key in self.alerts:
+                continue
+            row = {**payload, "id": f"alert-{len(self.alerts)}", "created_at": TIMESTAMP}
+            self.alerts[key] = row
+            created.append(row)
+        return created
+
+
+@pytest.mark.asyncio
+async def test_budget_status_reads_spend_from_rollups() -> None:
+    rest_client = BudgetRestClient(
+        spend=[
+            {"category_id": "cat-food", "currency": "USD", "total": 120},
+            {"category_id": "cat-food", "currency": "usd", "total": 50},
+            {"category_id": "cat-food", "currency": "COP", "total": 9000},
+            {"category_id": None, "currency": "USD", "total": 10},
+        ]
+    )
+    service = BudgetService(rest_client)  # type: ignore[arg-type]
+
+    result = await service.list_budget_status(
+        access_token="token",
+        user_id="user-1",
+        month=date(2026, 2, 1),
+    )
+
+    food, fun = result
+    assert food.spent == 170
+    assert food.remaining == 30
+    assert food.percent_used == 85
+    assert fun.spent == 0
+    assert rest_client.spend_months == [date(2026, 2, 1)]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_alerts_fires_each_threshold_once() -> None:
+    rest_client = BudgetRestClient(
+        spend=[
+            {"category_id": "cat-food", "currency": "USD", "total": 170},
+            {"category_id": "cat-fun", "currency": "USD", "total": 100},
+        ]
+    )
+    service = BudgetService(rest_client)  # type: ignore[arg-type]
+
+    first = await service.evaluate_alerts(access_token="token", user_id="user-1", month=date(2026, 2, 1))
+    second = await service.evaluate_alerts(access_token="token", user_id="user-1", month=date(2026, 2, 1))
+
+    assert sorted((alert.budget_id, alert.threshold) for alert in first) == [
+        ("budget-food", 80),
+        ("budget-fun", 80),
+        ("budget-fun", 100),
+    ]
+    assert second == []
+    assert len(rest_client.alerts) == 3
+
+
+@pytest.mark.asyncio
+async def test_evaluate_alerts_skips_insert_below_thresholds() -> None:
+    rest_client = BudgetRestClient(spend=[{"category_id": "cat-food", "currency": "USD", "total": 20}])
+    service = BudgetService(rest_client)  # type: ignore[arg-type]
+
+    assert await service.evaluate_alerts(access_token="token", user_id="user-1") == []
+    assert rest_client.insert_calls == 0
+
+
+class TransactionRestClient:
+    async def create_transaction(self, *, access_token: str, payload: dict) -> dict:
+        return {
+            "id": "tx-1",
+            "kind": payload["kind"],
+            "amount": payload["amount"],
+            "currency": "USD",
+            "occurred_at": "2026-03-15T10:00:00Z",
+            "category_id": payload.get("category_id"),
+            "cash_wallet_id": payload.get("cash_wallet_id"),
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+        }
+
+
+class RecordingBudgetService:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.months: list[date] = []
+        self.error = error
+
+    async def evaluate_alerts(self, *, access_token: str, user_id: str, month: date) -> list:
+        self.months.append(month)
+        if self.error is not None:
+            raise self.error
+        return []
+
+
+def _request(kind: str, category_id: str) -> TransactionCreateRequest:
+    return TransactionCreateRequest(
+        kind=kind,
+        amount=25,
+        currency="USD",
+        occurred_at=datetime(2026, 3, 15, 10, tzinfo=UTC),
+        category_id=category_id,
+        cash_wallet_id="11111111-1111-4111-8111-111111111111",
+    )
+
+
+@pytest.mark.asyncio
+async def test_transaction_write_evaluates_budgets_for_spending() -> None:
+    budgets = RecordingBudgetService()
+    service = TransactionService(TransactionRestClient(), budget_service=budgets)  # type: ignore[arg-type]
+
+    await service.create_transaction(
+        access_token="token",
+        user_id="user-1",
+        request=_request("expense", "22222222-2222-4222-8222-222222222222"),
+    )
+    await service.create_transaction(
+        access_token="token",
+        user_id="user-1",
+        request=_request("income", "33333333-3333-4333-8333-333333333333"),
+    )
+
+    assert budgets.months == [date(2026, 3, 1)]
+
+
+@pytest.mark.asyncio
+async def test_budget_failure_does_not_fail_transaction_write() -> None:
+    budgets = RecordingBudgetService(
+        error=AppException(status_code=502, code="SUPABASE_REST_ERROR", message="boom")
+    )
+    service = TransactionService(TransactionRestClient(), budget_service=budgets)  # type: ignore[arg-type]
+
+    result = await service.create_transaction(
+        access_token="token",
+        user_id="user-1",
+        request=_request("expense", "22222222-2222-4222-8222-222222222222"),
+    )
+
+    assert result.id == "tx-1"
+    assert budgets.months == [date(2026, 3, 1)]
+
+
+@pytest.mark.parametrize(
+    ("message", "migrations_missing"),
+    [
+        ('relation "public.budgets" does not exist', True),
+        ('relation "public.transaction_monthly_rollups" does not exist', True),
+        ('relation "public.categories" does not exist', False),
+    ],
+)
+def test_only_missing_budget_tables_mean_migrations_not_applied(
+    message: str,
+    migrations_missing: bool,
+) -> None:
+    exc = AppException(
+        status_code=404,
+        code="42P01",
+        message=message,
+        details={"code": "42P01", "message": message},
+    )
+
+    if migrations_missing:
+        with pytest.raises(AppException) as exc_info:
+            BudgetService._raise_if_migration_missing(exc)
+        assert exc_info.value.code == "MIGRATIONS_NOT_APPLIED"
+    else:
+        BudgetService._raise_if_migration_missing(exc)
@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.clients.supabase_auth import SupabaseAuthClient
+from app.clients.supabase_rest import SupabaseRestClient
+from app.core.bulkhead import Bulkhead
+from app.core.config import Settings
+from app.core.exceptions import AppException, register_exception_handlers
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(
+        supabase_url="https://project.supabase.co",
+        supabase_anon_key="anon-key",
+        **overrides,
+    )
+
+
+async def _hold(bulkhead: Bulkhead, release: asyncio.Event, order: list[str], name: str) -> None:
+    async with bulkhead.slot():
+        order.append(name)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_queues_then_rejects_when_queue_is_full() -> None:
+    bulkhead = Bulkhead("rest.reads", limit=1, queue_limit=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    first = asyncio.create_task(_hold(bulkhead, release, order, "first"))
+    second = asyncio.create_task(_hold(bulkhead, release, order, "second"))
+    await asyncio.sleep(0)
+    assert bulkhead.stats()["active"] == 1
+    assert bulkhead.stats()["queued"] == 1
+
+    with pytest.raises(AppException) as exc_info:
+        async with bulkhead.slot():
+            pass
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == "UPSTREAM_BUSY"
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    stats = bulkhead.stats()
+    assert order == ["first", "second"]
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    assert stats["peak_queued"] == 1
+    assert stats["admitted"] == 2
+    assert stats["rejected"] == 1
+    assert stats["wait_ms_max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    bulkhead = Bulkhead("auth.auth", limit=1, queue_limit=5)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    holder = asyncio.create_task(_hold(bulkhead, release, order, "holder"))
+    waiter = asyncio.create_task(_hold(bulkhead, release, order, "cancelled"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bulkhead.stats()["queued"] == 0
+    release.set()
+    await holder
+    async with bulkhead.slot():
+        assert bulkhead.stats()["active"] == 1
+    assert order == ["holder"]
+    assert bulkhead.stats()["active"] == 0
+
+
+def test_busy_error_is_returned_with_retry_after() -> None:
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/busy")
+    async def busy() -> None:
+        raise AppException(
+            status_code=503,
+            code="UPSTREAM_BUSY",
+            message="The server is busy, retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    with TestClient(app) as client:
+        response = client.get("/busy")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["code"] == "UPSTREAM_BUSY"
+
+
+@pytest.mark.asyncio
+async def test_clients_route_calls_through_their_operation_class() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/auth"):
+            return httpx.Response(200, json={"id": "user-1"})
+        if request.method == "GET":
+            return httpx.Response(200, json=[])
+        return httpx.Response(201, json=[{"id": "wallet-1"}])
+
+    settings = _settings(bulkhead_rest_write_limit=0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        rest = SupabaseRestClient(settings, http_client=http_client)
+        auth = SupabaseAuthClient(settings, http_client=http_client)
+        await rest.list_cash_wallets(access_token="token", user_id="user-1")
+        await rest.create_cash_wallet(access_token="token", payload={"name": "Cash"})
+        await auth.get_user(access_token="token")
+
+    rest_bulkheads = rest.stats()["upstream"]["bulkheads"]
+    assert set(rest_bulkheads) == {"reads"}
+    assert rest_bulkheads["reads"]["admitted"] == 1
+    assert rest_bulkheads["reads"]["limit"] == 60
+    assert auth.stats()["upstream"]["bulkheads"]["auth"]["admitted"] == 1
@@ -0,0 +1,100 @@
+import pytest
+
+from app.core.cache import RedisCacheBackend, TTLCache, hash_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = _Clock()
+    cache: TTLCache[str] = TTLCache(max_entries=10, ttl_seconds=30, clock=clock)
+
+    cache.set("a", "value")
+    assert cache.get("a") == "value"
+
+    clock.now += 31
+    assert cache.get("a") is None
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1}
+
+
+def test_ttl_cache_honours_earlier_explicit_expiry() -> None:
+    clock = _Clock()
+    cache: TTLCache[str] = TTLCache(max_entries=10, ttl_seconds=300, clock=clock)
+
+    cache.set("a", "value", expires_at=clock.now + 5)
+    clock.now += 6
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl_seconds=30)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_hash_key_does_not_keep_raw_value() -> None:
+    key = hash_key("secret-token")
+    assert "secret-token" not in key
+    assert key == hash_key("secret-token")
+
+
+class _FakeRedis:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.values: dict[str, bytes] = {}
+        self.expiries: dict[str, int] = {}
+        self.fail = fail
+
+    async def get(self, key: str) -> bytes | None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, *, ex: int) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.values[key] = value
+        self.expiries[key] = ex
+
+    async def delete(self, key: str) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.values.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_namespaces_keys_and_sets_ttl() -> None:
+    client = _FakeRedis()
+    backend = RedisCacheBackend(client, namespace="categories", ttl_seconds=300)
+
+    await backend.set("user-1", b"[]")
+    assert await backend.get("user-1") == b"[]"
+    await backend.delete("user-1")
+    assert await backend.get("user-1") is None
+
+    assert client.expiries == {"billetera:categories:user-1": 300}
+    assert backend.stats() == {"hits": 1, "misses": 1, "errors": 0}
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_outage_degrades_to_misses() -> None:
+    backend = RedisCacheBackend(_FakeRedis(fail=True), namespace="categories", ttl_seconds=300)
+
+    await backend.set("user-1", b"[]")
+    assert await backend.get("user-1") is None
+    await backend.delete("user-1")
+
+    assert backend.stats() == {"hits": 0, "misses": 1, "errors": 3}
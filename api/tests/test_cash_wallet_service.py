@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from app.core.exceptions import AppException
@@ -6,6 +8,10 @@ from app.services.cash_wallet_service import CashWalletService
 
 
 class DummyRestClient:
+    async def list_cash_wallets_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_cash_wallets(**kwargs)).encode()
+
     async def list_cash_wallets(self, *, access_token: str, user_id: str) -> list[dict]:
         return [
             {
@@ -47,6 +53,10 @@ class DummyRestClient:
 
 
 class MissingTableRestClient:
+    async def list_cash_wallets_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_cash_wallets(**kwargs)).encode()
+
     async def list_cash_wallets(self, *, access_token: str, user_id: str) -> list[dict]:
         raise AppException(
             status_code=400,
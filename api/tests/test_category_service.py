@@ -1,11 +1,18 @@
+import json
+
 import pytest
 
+from app.core.cache import MemoryCacheBackend
 from app.core.exceptions import AppException
 from app.schemas.category import CategoryCreateRequest
 from app.services.category_service import CategoryService
 
 
 class DummyRestClient:
+    async def list_categories_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_categories(**kwargs)).encode()
+
     def __init__(self) -> None:
         self.last_payload: dict | None = None
 
@@ -58,6 +65,10 @@ class DummyRestClient:
 
 
 class MissingTableRestClient:
+    async def list_categories_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_categories(**kwargs)).encode()
+
     async def list_categories(self, *, access_token: str, user_id: str) -> list[dict]:
         raise AppException(
             status_code=400,
@@ -121,3 +132,71 @@ async def test_list_categories_raises_migrations_not_applied() -> None:
         await service.list_categories(access_token="token", user_id="user-id")
 
     assert exc.value.code == "MIGRATIONS_NOT_APPLIED"
+
+
+class CountingRestClient(DummyRestClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_calls = 0
+
+    async def list_categories(self, *, access_token: str, user_id: str) -> list[dict]:
+        self.list_calls += 1
+        return await super().list_categories(access_token=access_token, user_id=user_id)
+
+
+@pytest.mark.asyncio
+async def test_list_categories_is_served_from_cache_per_user() -> None:
+    client = CountingRestClient()
+    service = CategoryService(client, cache=MemoryCacheBackend(max_entries=10, ttl_seconds=60))
+
+    first = await service.list_categories(access_token="token", user_id="user-a")
+    second = await service.list_categories(access_token="token", user_id="user-a")
+    await service.list_categories(access_token="token", user_id="user-b")
+
+    assert first == second
+    assert client.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_category_writes_invalidate_cached_list() -> None:
+    client = CountingRestClient()
+    service = CategoryService(client, cache=MemoryCacheBackend(max_entries=10, ttl_seconds=60))
+
+    await service.list_categories(access_token="token", user_id="user-a")
+    await service.create_category(
+        access_token="token",
+        user_id="user-a",
+        request=CategoryCreateRequest(name="Pets", kind="expense"),
+    )
+    await service.list_categories(access_token="token", user_id="user-a")
+    await service.delete_category(
+        access_token="token",
+        user_id="user-a",
+        category_id="22222222-2222-4222-8222-222222222222",
+    )
+    await service.list_categories(access_token="token", user_id="user-a")
+
+    assert client.list_calls == 3
+
+
+class TimingOutRestClient(CountingRestClient):
+    # The insert commits, but the response never arrives.
+    async def create_category(self, *, access_token: str, payload: dict) -> dict:
+        raise AppException(status_code=504, code="UPSTREAM_TIMEOUT", message="Timed out.")
+
+
+@pytest.mark.asyncio
+async def test_failed_category_write_still_invalidates_cached_list() -> None:
+    client = TimingOutRestClient()
+    service = CategoryService(client, cache=MemoryCacheBackend(max_entries=10, ttl_seconds=60))
+
+    await service.list_categories(access_token="token", user_id="user-a")
+    with pytest.raises(AppException):
+        await service.create_category(
+            access_token="token",
+            user_id="user-a",
+            request=CategoryCreateRequest(name="Pets", kind="expense"),
+        )
+    await service.list_categories(access_token="token", user_id="user-a")
+
+    assert client.list_calls == 2
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import UTC, date, datetime
+
+import pytest
+
+from app.core.exceptions import AppException
+from app.services.dashboard_service import DashboardService
+
+
+class DashboardRestClient:
+    def __init__(self, summary_error: AppException | None = None) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.summary_window: tuple[datetime, datetime] | None = None
+        self.summary_error = summary_error
+
+    async def _enter(self) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+    async def list_cash_wallets(self, *, access_token: str, user_id: str) -> list[dict]:
+        await self._enter()
+        return [
+            {"currency": "USD", "balance": 100.5},
+            {"currency": "cop", "balance": 50000},
+        ]
+
+    async def list_bank_accounts(self, *, access_token: str, user_id: str) -> list[dict]:
+        await self._enter()
+        return [{"currency": "USD", "balance": 899.5}]
+
+    async def list_credit_cards(self, *, access_token: str, user_id: str) -> list[dict]:
+        await self._enter()
+        return [{"currency": "USD", "current_debt": 250}]
+
+    async def fetch_transaction_month_summary(
+        self,
+        *,
+        access_token: str,
+        occurred_from: datetime,
+        occurred_to: datetime,
+    ) -> list[dict]:
+        await self._enter()
+        self.summary_window = (occurred_from, occurred_to)
+        if self.summary_error is not None:
+            raise self.summary_error
+        return [
+            {"kind": "income", "category_id": "cat-salary", "currency": "USD", "total": 3000, "tx_count": 1},
+            {"kind": "expense", "category_id": "cat-food", "currency": "USD", "total": 120.25, "tx_count": 6},
+            {"kind": "expense", "category_id": "cat-rent", "currency": "USD", "total": 900, "tx_count": 1},
+            {"kind": "credit_charge", "category_id": "cat-food", "currency": "USD", "total": 40, "tx_count": 2},
+            {"kind": "transfer", "category_id": "cat-transfer", "currency": "USD", "total": 10, "tx_count": 1},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_aggregates_balances_per_currency() -> None:
+    rest_client = DashboardRestClient()
+    service = DashboardService(rest_client)  # type: ignore[arg-type]
+
+    result = await service.get_dashboard(
+        access_token="token",
+        user_id="user-1",
+        month=date(2026, 3, 1),
+    )
+
+    assert rest_client.max_active == 4
+    balances = {item.currency: item for item in result.balances}
+    assert balances["USD"].assets == 1000
+    assert balances["USD"].debts == 250
+    assert balances["USD"].net_worth == 750
+    assert balances["COP"].cash == 50000
+    assert balances["COP"].net_worth == 50000
+
+
+@pytest.mark.asyncio
+async def test_dashboard_month_summary_uses_grouped_rows() -> None:
+    rest_client = DashboardRestClient()
+    service = DashboardService(rest_client)  # type: ignore[arg-type]
+
+    result = await service.get_dashboard(
+        access_token="token",
+        user_id="user-1",
+        month=date(2025, 12, 1),
+    )
+
+    assert rest_client.summary_window == (
+        datetime(2025, 12, 1, tzinfo=UTC),
+        datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    summary = result.month_summary
+    assert summary.month == date(2025, 12, 1)
+    by_kind = {item.kind: item for item in summary.by_kind}
+    assert by_kind["expense"].total == 1020.25
+    assert by_kind["expense"].count == 7
+    assert by_kind["income"].total == 3000
+    assert [item.category_id for item in summary.top_expense_categories] == [
+        "cat-rent",
+        "cat-food",
+        "cat-food",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_maps_missing_rpc_to_migrations_error() -> None:
+    rest_client = DashboardRestClient(
+        summary_error=AppException(
+            status_code=404,
+            code="SUPABASE_REST_ERROR",
+            message="Supabase REST request failed.",
+            details={
+                "code": "PGRST202",
+                "message": "Could not find the function public.transaction_month_summary(p_from, p_to)",
+            },
+        )
+    )
+    service = DashboardService(rest_client)  # type: ignore[arg-type]
+
+    with pytest.raises(AppException) as exc_info:
+        await service.get_dashboard(access_token="token", user_id="user-1")
+
+    assert exc_info.value.code == "MIGRATIONS_NOT_APPLIED"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("code", "message"),
+    [
+        ("42501", "permission denied for function transaction_month_summary"),
+        ("42P01", 'relation "public.credit_cards" does not exist'),
+        ("42883", "function public.missing_helper() does not exist"),
+    ],
+)
+async def test_dashboard_keeps_other_errors_unchanged(code: str, message: str) -> None:
+    error = AppException(
+        status_code=400,
+        code="SUPABASE_REST_ERROR",
+        message="Supabase REST request failed.",
+        details={"code": code, "message": message},
+    )
+    service = DashboardService(DashboardRestClient(summary_error=error))  # type: ignore[arg-type]
+
+    with pytest.raises(AppException) as exc_info:
+        await service.get_dashboard(access_token="token", user_id="user-1")
+
+    assert exc_info.value is error
@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import deadline
+from app.core.exceptions import AppException, register_exception_handlers
+from app.core.resilience import CircuitBreaker, RetryPolicy, Upstream
+from app.middleware.deadline import RequestDeadlineMiddleware
+
+
+def _app(seconds: float) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestDeadlineMiddleware, seconds=seconds)
+    register_exception_handlers(app)
+
+    @app.get("/slow")
+    async def slow() -> dict[str, str]:
+        await asyncio.sleep(5)
+        return {"status": "done"}
+
+    @app.post("/write")
+    async def write() -> dict[str, str]:
+        await asyncio.sleep(0.01)
+        # The write returned; post-commit work may outlive the budget.
+        deadline.lift()
+        await asyncio.sleep(0.2)
+        return {"status": "created"}
+
+    @app.get("/budget")
+    async def budget() -> dict[str, float | None]:
+        return {"remaining": deadline.remaining()}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for index in range(3):
+                await asyncio.sleep(0.05)
+                yield f"{index}:{deadline.remaining()}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_budget_is_capped_by_request_deadline() -> None:
+    assert deadline.budget(20.0) == 20.0
+
+    _, token = deadline.start(0.5)
+    try:
+        assert 0 < deadline.budget(20.0) <= 0.5
+        assert deadline.budget(0.1) == 0.1
+    finally:
+        deadline.reset(token)
+
+    _, token = deadline.start(-1)
+    try:
+        with pytest.raises(AppException) as exc_info:
+            deadline.budget(20.0)
+    finally:
+        deadline.reset(token)
+    assert exc_info.value.status_code == 504
+    assert exc_info.value.code == "DEADLINE_EXCEEDED"
+
+
+def test_slow_request_is_cancelled_with_504() -> None:
+    with TestClient(_app(0.1)) as client:
+        response = client.get("/slow")
+
+    assert response.status_code == 504
+    assert response.json()["code"] == "DEADLINE_EXCEEDED"
+
+
+def test_post_commit_work_is_not_cut_short() -> None:
+    with TestClient(_app(0.1)) as client:
+        response = client.post("/write")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "created"}
+
+
+def test_client_header_can_only_shorten_the_deadline() -> None:
+    with TestClient(_app(10)) as client:
+        shorter = client.get("/budget", headers={"X-Request-Timeout": "2"}).json()["remaining"]
+        longer = client.get("/budget", headers={"X-Request-Timeout": "60"}).json()["remaining"]
+        invalid = client.get("/budget", headers={"X-Request-Timeout": "soon"}).json()["remaining"]
+
+    assert 0 < shorter <= 2
+    assert 2 < longer <= 10
+    assert 2 < invalid <= 10
+
+
+def test_streamed_response_outlives_the_deadline() -> None:
+    with TestClient(_app(0.02)) as client:
+        response = client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.text == "0:None\n1:None\n2:None\n"
+
+
+@pytest.mark.asyncio
+async def test_upstream_call_gets_remaining_budget() -> None:
+    timeouts: list[float] = []
+
+    async def call(timeout: float) -> httpx.Response:
+        timeouts.append(timeout)
+        return httpx.Response(200)
+
+    upstream = Upstream(
+        "rest",
+        retry=RetryPolicy(),
+        breaker=CircuitBreaker("rest"),
+        timeout_seconds=20.0,
+    )
+    await upstream.send(call, idempotent=True)
+    _, token = deadline.start(0.5)
+    try:
+        await upstream.send(call, idempotent=True)
+    finally:
+        deadline.reset(token)
+
+    assert timeouts[0] == 20.0
+    assert 0 < timeouts[1] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_deadline_timeout_does_not_trip_breaker() -> None:
+    async def call(timeout: float) -> httpx.Response:
+        await asyncio.sleep(timeout)
+        raise httpx.ReadTimeout("timed out")
+
+    upstream = Upstream(
+        "rest",
+        retry=RetryPolicy(),
+        breaker=CircuitBreaker("rest", failure_threshold=1),
+        timeout_seconds=20.0,
+    )
+    _, token = deadline.start(0.02)
+    try:
+        with pytest.raises(AppException) as exc_info:
+            await upstream.send(call, idempotent=True)
+    finally:
+        deadline.reset(token)
+
+    assert exc_info.value.code == "DEADLINE_EXCEEDED"
+    assert upstream.stats()["state"] == "closed"
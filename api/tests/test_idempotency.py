@@ -0,0 +1,304 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.cache import TTLCache
+from app.core.exceptions import AppException
+from app.core.idempotency import IdempotencyStore, _raise_if_migration_missing, request_fingerprint
+from app.schemas.transaction import TransactionCreateRequest
+from app.services.transaction_service import TransactionService
+
+WALLET_ID = "11111111-1111-4111-8111-111111111111"
+
+
+def _store(rest_client: object = None, *, durable: bool = False) -> IdempotencyStore:
+    return IdempotencyStore(
+        cache=TTLCache(max_entries=100, ttl_seconds=3600),
+        ttl_seconds=3600,
+        rest_client=rest_client,
+        durable=durable,
+        lock_seconds=30,
+    )
+
+
+class _Counter:
+    def __init__(self, *, delay: float = 0.0, error: AppException | None = None) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"id": f"tx-{self.calls}"}
+
+
+async def _run(store: IdempotencyStore, execute: _Counter, *, key: str = "k1", fingerprint: str = "f1") -> dict:
+    return await store.run(
+        access_token="token",
+        user_id="user-1",
+        scope="transactions.create",
+        key=key,
+        fingerprint=fingerprint,
+        execute=execute,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_first_response_without_executing_again() -> None:
+    store = _store()
+    execute = _Counter()
+
+    first = await _run(store, execute)
+    second = await _run(store, execute)
+
+    assert first == second == {"id": "tx-1"}
+    assert execute.calls == 1
+    assert store.stats()["replays"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_wait_for_the_first_request() -> None:
+    store = _store()
+    execute = _Counter(delay=0.02)
+
+    results = await asyncio.gather(*(_run(store, execute) for _ in range(5)))
+
+    assert execute.calls == 1
+    assert all(result == {"id": "tx-1"} for result in results)
+    assert store.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reused_key_with_different_request_is_rejected() -> None:
+    store = _store()
+    await _run(store, _Counter())
+
+    with pytest.raises(AppException) as exc_info:
+        await _run(store, _Counter(), fingerprint="other")
+
+    assert exc_info.value.status_code == 422
+    assert exc_info.value.code == "IDEMPOTENCY_KEY_REUSED"
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_stored() -> None:
+    store = _store()
+    failing = _Counter(error=AppException(status_code=400, code="P0001", message="Insufficient funds."))
+
+    with pytest.raises(AppException):
+        await _run(store, failing)
+    result = await _run(store, _Counter())
+
+    assert result == {"id": "tx-1"}
+
+
+class DurableRestClient:
+    # Shared table between two stores, standing in for two API workers.
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str, str], dict] = {}
+
+    async def reserve_idempotency_key(self, *, access_token: str, payload: dict) -> bool:
+        row_key = (payload["user_id"], payload["scope"], payload["key"])
+        if row_key in self.rows:
+            return False
+        self.rows[row_key] = {
+            "request_hash": payload["request_hash"],
+            "response": None,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        return True
+
+    async def fetch_idempotency_key(self, *, access_token: str, user_id: str, scope: str, key: str) -> dict | None:
+        return self.rows.get((user_id, scope, key))
+
+    async def complete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        response: dict,
+    ) -> None:
+        self.rows[(user_id, scope, key)]["response"] = response
+
+    async def delete_idempotency_key(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        scope: str,
+        key: str,
+        pending_only: bool = False,
+        created_before: datetime | None = None,
+    ) -> None:
+        row = self.rows.get((user_id, scope, key))
+        if row is None or (pending_only and row["response"] is not None):
+            return
+        if created_before is not None and datetime.fromisoformat(row["created_at"]) >= created_before:
+            return
+        del self.rows[(user_id, scope, key)]
+
+
+@pytest.mark.asyncio
+async def test_durable_record_replays_on_another_worker() -> None:
+    table = DurableRestClient()
+    execute = _Counter()
+
+    first = await _run(_store(table, durable=True), execute)
+    second = await _run(_store(table, durable=True), execute)
+
+    assert first == second
+    assert execute.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_durable_reservation_blocks_other_worker_while_in_flight() -> None:
+    table = DurableRestClient()
+    slow = _Counter(delay=0.05)
+
+    first = asyncio.create_task(_run(_store(table, durable=True), slow))
+    await asyncio.sleep(0.01)
+    with pytest.raises(AppException) as exc_info:
+        await _run(_store(table, durable=True), _Counter())
+    await first
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.code == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+@pytest.mark.asyncio
+async def test_durable_reservation_is_released_on_failure_and_taken_over_when_stale() -> None:
+    table = DurableRestClient()
+    failing = _Counter(error=AppException(status_code=400, code="P0001", message="Insufficient funds."))
+    with pytest.raises(AppException):
+        await _run(_store(table, durable=True), failing)
+    assert table.rows == {}
+
+    # A worker that died mid-request leaves a reservation behind.
+    table.rows[("user-1", "transactions.create", "k1")] = {
+        "request_hash": "f1",
+        "response": None,
+        "created_at": (datetime.now(UTC) - timedelta(minutes=5)).isoformat(),
+    }
+    result = await _run(_store(table, durable=True), _Counter())
+
+    assert result == {"id": "tx-1"}
+    assert table.rows[("user-1", "transactions.create", "k1")]["response"] == result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("durable", [False, True])
+async def test_write_that_timed_out_after_committing_is_not_repeated(durable: bool) -> None:
+    table = DurableRestClient()
+    store = _store(table, durable=durable)
+    committed: list[str] = []
+
+    async def commit_then_time_out() -> dict:
+        committed.append("tx-1")
+        raise AppException(status_code=504, code="UPSTREAM_TIMEOUT", message="Timed out.")
+
+    with pytest.raises(AppException):
+        await _run(store, commit_then_time_out)
+    with pytest.raises(AppException) as exc_info:
+        await _run(store, _Counter())
+
+    assert exc_info.value.status_code == 409
+    assert committed == ["tx-1"]
+    if durable:
+        row = table.rows[("user-1", "transactions.create", "k1")]
+        assert row["response"] is None
+        with pytest.raises(AppException) as exc_info:
+            await _run(_store(table, durable=True), _Counter())
+        assert exc_info.value.code == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_write_keeps_the_key_pending() -> None:
+    store = _store()
+    task = asyncio.create_task(_run(store, _Counter(delay=1)))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(AppException) as exc_info:
+        await _run(store, _Counter())
+    assert exc_info.value.code == "IDEMPOTENCY_KEY_IN_PROGRESS"
+
+
+class CountingRestClient:
+    def __init__(self) -> None:
+        self.inserts = 0
+
+    async def create_transaction(self, *, access_token: str, payload: dict) -> dict:
+        self.inserts += 1
+        return {
+            **{key: value for key, value in payload.items() if key != "user_id"},
+            "id": f"tx-{self.inserts}",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+        }
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_with_idempotency_key_inserts_once() -> None:
+    client = CountingRestClient()
+    service = TransactionService(client, idempotency=_store())
+
+    async def create() -> str:
+        # A fresh request object per attempt: occurred_at defaults to "now".
+        request = TransactionCreateRequest(kind="income", amount=10, cash_wallet_id=WALLET_ID)
+        transaction = await service.create_transaction(
+            access_token="token",
+            user_id="user-1",
+            request=request,
+            idempotency_key="retry-me",
+        )
+        return transaction.id
+
+    first = await create()
+    await asyncio.sleep(0.001)
+    second = await create()
+
+    assert first == second == "tx-1"
+    assert client.inserts == 1
+
+
+def test_request_fingerprint_ignores_key_order() -> None:
+    assert request_fingerprint({"a": 1, "b": 2}) == request_fingerprint({"b": 2, "a": 1})
+    assert request_fingerprint({"a": 1}) != request_fingerprint({"a": 2})
+
+
+@pytest.mark.parametrize(
+    ("code", "message", "migrations_missing"),
+    [
+        ("42P01", 'relation "public.idempotency_keys" does not exist', True),
+        ("PGRST205", "Could not find the table 'public.idempotency_keys'", True),
+        ("42P01", 'relation "public.transactions" does not exist', False),
+        ("42501", 'new row violates row-level security policy for table "idempotency_keys"', False),
+        ("23505", 'duplicate key value violates unique constraint "idempotency_keys_pkey"', False),
+    ],
+)
+def test_only_missing_idempotency_table_means_migrations_not_applied(
+    code: str,
+    message: str,
+    migrations_missing: bool,
+) -> None:
+    exc = AppException(
+        status_code=400,
+        code="SUPABASE_REST_ERROR",
+        message="Supabase REST request failed.",
+        details={"code": code, "message": message},
+    )
+
+    if migrations_missing:
+        with pytest.raises(AppException) as exc_info:
+            _raise_if_migration_missing(exc)
+        assert exc_info.value.code == "MIGRATIONS_NOT_APPLIED"
+    else:
+        _raise_if_migration_missing(exc)
@@ -0,0 +1,124 @@
+import json
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from uuid import UUID
+
+import psycopg
+import pytest
+from jose import jwt
+
+from app.clients.postgres import PostgresRepository, _app_exception, _json_value
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+
+TOKEN = jwt.encode({"sub": "user-1", "role": "authenticated"}, "secret", algorithm="HS256")
+
+
+class FakeCursor:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[object, object]] = []
+        self.description = [object()]
+
+    async def execute(self, query: object, params: object) -> None:
+        self.executed.append((query, params))
+
+    async def fetchall(self) -> list[dict]:
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor) -> None:
+        self._cursor = cursor
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    @asynccontextmanager
+    async def cursor(self, row_factory: object):
+        yield self._cursor
+
+
+class FakePool:
+    def __init__(self, cursor: FakeCursor) -> None:
+        self.conn = FakeConnection(cursor)
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+def _query_text(query: object) -> str:
+    return query if isinstance(query, str) else query.as_string(None)
+
+
+@pytest.mark.asyncio
+async def test_each_call_sets_role_and_claims_in_its_transaction() -> None:
+    cursor = FakeCursor([{"id": "wallet-1"}])
+    pool = FakePool(cursor)
+    repository = PostgresRepository(get_settings(), pool=pool)  # type: ignore[arg-type]
+
+    rows = await repository.list_cash_wallets(access_token=TOKEN, user_id="user-1")
+
+    assert rows == [{"id": "wallet-1"}]
+    assert pool.conn.transactions == 1
+    set_config, select = cursor.executed
+    assert "set_config('role'" in _query_text(set_config[0])
+    role, claims = set_config[1]
+    assert role == "authenticated"
+    assert json.loads(claims)["sub"] == "user-1"
+    assert "from public.cash_wallets" in _query_text(select[0])
+    assert select[1] == ("user-1",)
+
+
+@pytest.mark.asyncio
+async def test_batch_insert_is_one_statement_with_defaults_for_missing_columns() -> None:
+    cursor = FakeCursor([{"id": "tx-1"}, {"id": "tx-2"}])
+    repository = PostgresRepository(get_settings(), pool=FakePool(cursor))  # type: ignore[arg-type]
+
+    await repository.create_transactions(
+        access_token=TOKEN,
+        payloads=[
+            {"kind": "expense", "amount": 10, "description": "coffee"},
+            {"kind": "income", "amount": 20},
+        ],
+    )
+
+    query, params = cursor.executed[-1]
+    text = _query_text(query)
+    assert text.startswith('insert into "public"."transactions" ("amount", "description", "kind")')
+    assert "values (%s, %s, %s), (%s, DEFAULT, %s)" in text
+    assert params == [10, "coffee", "expense", 20, "income"]
+
+
+@pytest.mark.asyncio
+async def test_update_not_found_matches_rest_client_error() -> None:
+    repository = PostgresRepository(get_settings(), pool=FakePool(FakeCursor([])))  # type: ignore[arg-type]
+
+    with pytest.raises(AppException) as exc_info:
+        await repository.update_transaction(
+            access_token=TOKEN,
+            user_id="user-1",
+            transaction_id="tx-1",
+            payload={"description": "x"},
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.code == "TRANSACTION_NOT_FOUND"
+
+
+def test_database_errors_map_to_postgrest_statuses() -> None:
+    missing = _app_exception(psycopg.errors.UndefinedTable("relation does not exist"))
+    duplicate = _app_exception(psycopg.errors.UniqueViolation("duplicate key"))
+
+    assert missing.status_code == 404
+    assert missing.details["code"] == "42P01"
+    assert duplicate.status_code == 409
+
+
+def test_values_are_json_compatible() -> None:
+    assert _json_value(UUID("11111111-1111-4111-8111-111111111111")) == "11111111-1111-4111-8111-111111111111"
+    assert _json_value(Decimal("12.50")) == 12.5
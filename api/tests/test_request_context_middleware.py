@@ -0,0 +1,54 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.request_context import RequestContextMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/ping")
+    def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a\n", b"b\n", b"c\n"]), media_type="text/plain")
+
+    return app
+
+
+def test_response_carries_request_id_and_timing() -> None:
+    with TestClient(_build_app()) as client:
+        response = client.get("/ping", headers={"x-request-id": "req-42"})
+
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "req-42"
+    assert float(response.headers["x-response-time-ms"]) >= 0
+
+
+def test_missing_request_id_is_generated() -> None:
+    with TestClient(_build_app()) as client:
+        response = client.get("/ping")
+
+    assert len(response.headers["x-request-id"]) == 36
+
+
+def test_streaming_responses_pass_through(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger="billetera.request")
+
+    with TestClient(_build_app()) as client:
+        response = client.get("/stream", headers={"x-request-id": "req-stream"})
+
+    assert response.text == "a\nb\nc\n"
+    assert response.headers["x-request-id"] == "req-stream"
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(
+        "request_id=req-stream method=GET path=/stream status=200" in message
+        for message in messages
+    )
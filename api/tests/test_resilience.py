@@ -0,0 +1,185 @@
+import httpx
+import pytest
+
+from app.clients.supabase_auth import SupabaseAuthClient
+from app.clients.supabase_rest import SupabaseRestClient
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.core.resilience import CircuitBreaker, RetryPolicy, Upstream
+
+
+def _settings() -> Settings:
+    return Settings(
+        supabase_url="https://project.supabase.co",
+        supabase_anon_key="anon-key",
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _no_sleep(_: float) -> None:
+    return None
+
+
+def _upstream(name: str, *, attempts: int = 3, threshold: int = 5, clock=None) -> Upstream:
+    return Upstream(
+        name,
+        retry=RetryPolicy(attempts=attempts, base_delay_seconds=0.01, max_delay_seconds=0.05),
+        breaker=CircuitBreaker(
+            name,
+            failure_threshold=threshold,
+            reset_seconds=30,
+            **({"clock": clock} if clock else {}),
+        ),
+        sleep=_no_sleep,
+    )
+
+
+def _profile_row() -> dict:
+    return {
+        "id": "user-1",
+        "base_currency": "USD",
+        "ai_enabled": False,
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def test_retry_delay_is_jittered_and_capped() -> None:
+    policy = RetryPolicy(attempts=5, base_delay_seconds=0.1, max_delay_seconds=0.3)
+
+    for retry in range(6):
+        assert 0 <= policy.delay(retry) <= min(0.3, 0.1 * 2**retry)
+
+
+def test_breaker_opens_then_lets_one_probe_through() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("rest", failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    with pytest.raises(AppException) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == "UPSTREAM_CIRCUIT_OPEN"
+    assert exc_info.value.details == {"upstream": "rest", "retry_after_seconds": 30}
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(AppException):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.stats() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "opened": 1,
+        "rejected": 2,
+    }
+
+
+def test_failed_probe_reopens_breaker() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("auth", failure_threshold=3, reset_seconds=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.opened == 2
+
+
+@pytest.mark.asyncio
+async def test_rest_get_is_retried_on_gateway_errors() -> None:
+    statuses = [503, 502, 200]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(status, json=[_profile_row()] if status == 200 else {})
+
+    upstream = _upstream("rest")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client, upstream=upstream)
+        profile = await client.fetch_profile(access_token="token", user_id="user-1")
+
+    assert profile["id"] == "user-1"
+    assert client.stats()["upstream"]["retries"] == 2
+    assert client.stats()["upstream"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_rest_get_retries_connect_errors_then_maps_to_503() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client, upstream=_upstream("rest"))
+        with pytest.raises(AppException) as exc_info:
+            await client.fetch_profile(access_token="token", user_id="user-1")
+
+    assert calls == 3
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == "UPSTREAM_UNAVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_rest_writes_are_not_retried() -> None:
+    calls = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client, upstream=_upstream("rest"))
+        with pytest.raises(AppException) as exc_info:
+            await client.create_cash_wallet(access_token="token", payload={"name": "Cash"})
+
+    assert calls == 1
+    assert exc_info.value.status_code == 503
+    assert client.stats()["upstream"]["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_without_calling_auth() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    upstream = _upstream("auth", attempts=1, threshold=2)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseAuthClient(_settings(), http_client=http_client, upstream=upstream)
+        for _ in range(2):
+            with pytest.raises(AppException) as exc_info:
+                await client.sign_in(email="user@example.com", password="secret")
+            assert exc_info.value.status_code == 504
+            assert exc_info.value.code == "UPSTREAM_TIMEOUT"
+
+        with pytest.raises(AppException) as exc_info:
+            await client.get_user(access_token="token")
+
+    assert calls == 2
+    assert exc_info.value.code == "UPSTREAM_CIRCUIT_OPEN"
+    assert client.stats()["upstream"]["state"] == "open"
+    assert client.stats()["upstream"]["rejected"] == 1
@@ -0,0 +1,157 @@
+import asyncio
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.core.security import SupabaseJwtVerifier
+
+ISSUER = "https://project.supabase.co/auth/v1"
+
+
+def _settings(**overrides: object) -> Settings:
+    return Settings(
+        supabase_url="https://project.supabase.co",
+        supabase_anon_key="anon-key",
+        **overrides,
+    )
+
+
+def _private_pem() -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _public_jwk(private_pem: bytes, kid: str) -> dict:
+    public = jwk.construct(private_pem, "RS256").public_key().to_dict()
+    public["kid"] = kid
+    return public
+
+
+def _token(private_pem: bytes, kid: str, **claims: object) -> str:
+    payload = {
+        "sub": "user-1",
+        "email": "user@example.com",
+        "iss": ISSUER,
+        "aud": "authenticated",
+        "exp": int(time.time()) + 600,
+    }
+    payload.update(claims)
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+class _FakeAuthClient:
+    def __init__(self, keys: list[dict]) -> None:
+        self.keys = keys
+        self.jwks_calls = 0
+
+    async def get_jwks(self) -> dict:
+        self.jwks_calls += 1
+        return {"keys": self.keys}
+
+
+@pytest.fixture(scope="module")
+def private_pem() -> bytes:
+    return _private_pem()
+
+
+@pytest.mark.asyncio
+async def test_repeat_tokens_are_served_from_verified_cache(private_pem: bytes) -> None:
+    verifier = SupabaseJwtVerifier(
+        settings=_settings(),
+        auth_client=_FakeAuthClient([_public_jwk(private_pem, "kid-1")]),  # type: ignore[arg-type]
+    )
+    token = _token(private_pem, "kid-1")
+
+    first = await verifier.verify_access_token(token)
+    second = await verifier.verify_access_token(token)
+
+    assert first["sub"] == second["sub"] == "user-1"
+    assert verifier.stats()["verified_token_cache"] == {"size": 1, "hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_verified_cache_entry_expires_with_token(private_pem: bytes) -> None:
+    verifier = SupabaseJwtVerifier(
+        settings=_settings(),
+        auth_client=_FakeAuthClient([_public_jwk(private_pem, "kid-1")]),  # type: ignore[arg-type]
+    )
+    exp = int(time.time()) + 120
+    token = _token(private_pem, "kid-1", exp=exp)
+
+    await verifier.verify_access_token(token)
+
+    (expires_at, _), = verifier._verified_tokens._entries.values()
+    assert expires_at == exp
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_not_cached(private_pem: bytes) -> None:
+    verifier = SupabaseJwtVerifier(
+        settings=_settings(),
+        auth_client=_FakeAuthClient([_public_jwk(private_pem, "kid-1")]),  # type: ignore[arg-type]
+    )
+    token = _token(private_pem, "kid-1", iss="https://evil.example.com/auth/v1")
+
+    for _ in range(2):
+        with pytest.raises(AppException) as exc:
+            await verifier.verify_access_token(token)
+        assert exc.value.code == "INVALID_ISSUER"
+
+    assert verifier.stats()["verified_token_cache"]["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_key_rotation_clears_verified_cache(private_pem: bytes) -> None:
+    auth_client = _FakeAuthClient([_public_jwk(private_pem, "kid-1")])
+    verifier = SupabaseJwtVerifier(settings=_settings(), auth_client=auth_client)  # type: ignore[arg-type]
+    await verifier.verify_access_token(_token(private_pem, "kid-1"))
+
+    rotated_pem = _private_pem()
+    auth_client.keys = [_public_jwk(rotated_pem, "kid-2")]
+    await verifier.verify_access_token(_token(rotated_pem, "kid-2"))
+
+    assert auth_client.jwks_calls == 2
+    assert verifier.stats()["verified_token_cache"]["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refreshes_are_rate_limited(private_pem: bytes) -> None:
+    auth_client = _FakeAuthClient([_public_jwk(private_pem, "kid-1")])
+    verifier = SupabaseJwtVerifier(settings=_settings(), auth_client=auth_client)  # type: ignore[arg-type]
+    bogus_pem = _private_pem()
+
+    for index in range(5):
+        with pytest.raises(AppException) as exc:
+            await verifier.verify_access_token(_token(bogus_pem, f"bogus-{index}"))
+        assert exc.value.code == "UNKNOWN_KEY_ID"
+
+    # Initial load plus a single forced refresh; the rest are throttled.
+    assert auth_client.jwks_calls == 2
+    assert verifier.stats()["jwks_forced_refreshes_throttled"] == 4
+
+
+@pytest.mark.asyncio
+async def test_expiring_jwks_refreshes_in_background(private_pem: bytes) -> None:
+    auth_client = _FakeAuthClient([_public_jwk(private_pem, "kid-1")])
+    verifier = SupabaseJwtVerifier(
+        settings=_settings(jwks_cache_ttl_seconds=30, jwks_refresh_ahead_seconds=60),
+        auth_client=auth_client,  # type: ignore[arg-type]
+    )
+    token = _token(private_pem, "kid-1")
+
+    await verifier.verify_access_token(token)
+    claims = await verifier.verify_access_token(token)
+    assert claims["sub"] == "user-1"
+
+    await asyncio.sleep(0)
+    await verifier.aclose()
+    assert auth_client.jwks_calls == 2
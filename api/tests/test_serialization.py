@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from app.core.exceptions import AppException
+from app.core.serialization import json_list_response, list_adapter, validate_json_list
+from app.schemas.category import CategoryResponse
+
+ROWS = [
+    {
+        "id": "cat-1",
+        "name": "Comida",
+        "kind": "expense",
+        "color": None,
+        "icon": "restaurant",
+        "is_system": True,
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "user_id": "ignored",
+    }
+]
+
+
+def test_validate_json_list_matches_model_validate() -> None:
+    items = validate_json_list(CategoryResponse, json.dumps(ROWS).encode())
+
+    assert items == [CategoryResponse.model_validate(row) for row in ROWS]
+    assert list_adapter(CategoryResponse) is list_adapter(CategoryResponse)
+
+
+def test_validate_json_list_maps_bad_payload_to_app_exception() -> None:
+    with pytest.raises(AppException) as exc_info:
+        validate_json_list(CategoryResponse, b'{"message": "not a list"}')
+
+    assert exc_info.value.code == "INVALID_SUPABASE_RESPONSE"
+
+
+def test_json_list_response_serializes_like_response_model() -> None:
+    items = validate_json_list(CategoryResponse, json.dumps(ROWS).encode())
+
+    response = json_list_response(CategoryResponse, items, headers={"X-Next-Cursor": "abc"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert json.loads(response.body) == [item.model_dump(mode="json") for item in items]
@@ -0,0 +1,257 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.clients.supabase_auth import SupabaseAuthClient
+from app.clients.supabase_rest import SupabaseRestClient
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.core.pagination import TransactionCursor
+from app.main import create_app
+
+
+def _settings() -> Settings:
+    return Settings(
+        supabase_url="https://project.supabase.co",
+        supabase_anon_key="anon-key",
+    )
+
+
+def _profile_row() -> dict:
+    return {
+        "id": "user-1",
+        "base_currency": "USD",
+        "ai_enabled": False,
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+@pytest.mark.asyncio
+async def test_rest_client_reuses_injected_http_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[_profile_row()])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        await client.fetch_profile(access_token="token-1", user_id="user-1")
+        await client.fetch_profile(access_token="token-2", user_id="user-1")
+        assert not http_client.is_closed
+
+    assert len(requests) == 2
+    assert requests[0].headers["Authorization"] == "Bearer token-1"
+    assert requests[1].headers["Authorization"] == "Bearer token-2"
+    assert requests[0].headers["apikey"] == "anon-key"
+
+
+@pytest.mark.asyncio
+async def test_auth_client_reuses_injected_http_client() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("jwks.json"):
+            return httpx.Response(200, json={"keys": []})
+        return httpx.Response(200, json={"id": "user-1", "email": "user@example.com"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseAuthClient(_settings(), http_client=http_client)
+        await client.get_user(access_token="token")
+        await client.get_jwks()
+        assert not http_client.is_closed
+
+    assert paths == ["/auth/v1/user", "/auth/v1/.well-known/jwks.json"]
+
+
+@pytest.mark.asyncio
+async def test_rest_client_maps_empty_profile_to_not_found() -> None:
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, json=[]))
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        with pytest.raises(AppException) as exc:
+            await client.fetch_profile(access_token="token", user_id="user-1")
+
+    assert exc.value.code == "PROFILE_NOT_FOUND"
+
+
+def test_lifespan_owns_separate_rest_and_auth_pools() -> None:
+    app = create_app()
+
+    with TestClient(app):
+        container = app.state.container
+        rest_http_client = container.rest_client._http
+        auth_http_client = container.auth_client._http
+        assert isinstance(container.rest_client, SupabaseRestClient)
+        assert isinstance(container.auth_client, SupabaseAuthClient)
+        assert rest_http_client is not auth_http_client
+        assert not rest_http_client.is_closed
+        assert not auth_http_client.is_closed
+
+    assert rest_http_client.is_closed
+    assert auth_http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_with_cursor_uses_keyset_filter() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        await client.list_transactions(
+            access_token="token",
+            user_id="user-1",
+            limit=20,
+            offset=40,
+            after=TransactionCursor(
+                occurred_at=datetime(2026, 1, 1, 12, 0, tzinfo=UTC),
+                id="tx-9",
+            ),
+        )
+
+    params = requests[0].url.params
+    assert params["order"] == "occurred_at.desc,id.desc"
+    assert params["or"] == (
+        '(occurred_at.lt."2026-01-01T12:00:00+00:00",'
+        'and(occurred_at.eq."2026-01-01T12:00:00+00:00",id.lt."tx-9"))'
+    )
+    assert "offset" not in params
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_posts_one_array_insert() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        rows = json.loads(request.content)
+        return httpx.Response(201, json=[{"id": f"tx-{i}", **row} for i, row in enumerate(rows)])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        rows = await client.create_transactions(
+            access_token="token",
+            payloads=[
+                {"kind": "income", "amount": 1, "cash_wallet_id": "w-1"},
+                {"kind": "expense", "amount": 2, "credit_card_id": "c-1", "description": "x"},
+            ],
+        )
+
+    assert len(requests) == 1
+    assert requests[0].url.params["columns"] == (
+        "amount,cash_wallet_id,credit_card_id,description,kind"
+    )
+    assert "missing=default" in requests[0].headers["Prefer"]
+    assert [row["id"] for row in rows] == ["tx-0", "tx-1"]
+
+
+@pytest.mark.asyncio
+async def test_list_json_returns_raw_body_and_raises_on_error() -> None:
+    body = b'[{"id":"wallet-1"}]'
+    statuses = iter([200, 404])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == 200:
+            return httpx.Response(200, content=body)
+        return httpx.Response(status, json={"code": "42P01", "message": "relation missing"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        assert await client.list_cash_wallets_json(access_token="token", user_id="user-1") is not None
+        with pytest.raises(AppException) as exc_info:
+            await client.list_cash_wallets_json(access_token="token", user_id="user-1")
+
+    assert exc_info.value.details == {"code": "42P01", "message": "relation missing"}
+
+
+def _slow_categories_transport(calls: list[str]) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["Authorization"])
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=[{"id": "cat-1"}])
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request() -> None:
+    calls: list[str] = []
+    async with httpx.AsyncClient(transport=_slow_categories_transport(calls)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        results = await asyncio.gather(
+            client.list_categories(access_token="token-a", user_id="user-1"),
+            client.list_categories(access_token="token-a", user_id="user-1"),
+            client.list_categories_json(access_token="token-a", user_id="user-1"),
+            client.list_categories(access_token="token-b", user_id="user-1"),
+        )
+
+    assert calls == ["Bearer token-a", "Bearer token-b"]
+    assert results[0] == results[1] == [{"id": "cat-1"}]
+    assert results[0] is not results[1]
+    assert client.stats()["gets"] == {
+        "list_categories": {"requests": 2, "coalesced": 1},
+        "list_categories_json": {"requests": 0, "coalesced": 1},
+    }
+    assert client.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_get() -> None:
+    calls: list[str] = []
+    async with httpx.AsyncClient(transport=_slow_categories_transport(calls)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        leader = asyncio.create_task(client.list_categories(access_token="token-a", user_id="user-1"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.list_categories(access_token="token-a", user_id="user-1"))
+        await asyncio.sleep(0.005)
+        leader.cancel()
+
+        assert await follower == [{"id": "cat-1"}]
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_after_write_does_not_join_older_get() -> None:
+    balances = iter(["100", "150"])
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "PATCH":
+            return httpx.Response(200, json=[{"id": "wallet-1", "balance": "150"}])
+        balance = next(balances)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=[{"id": "wallet-1", "balance": balance}])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = SupabaseRestClient(_settings(), http_client=http_client)
+        stale = asyncio.create_task(client.list_cash_wallets(access_token="token", user_id="user-1"))
+        await asyncio.sleep(0)
+        await client.update_cash_wallet(
+            access_token="token",
+            user_id="user-1",
+            wallet_id="wallet-1",
+            payload={"balance": "150"},
+        )
+        fresh = await client.list_cash_wallets(access_token="token", user_id="user-1")
+
+        assert (await stale)[0]["balance"] == "100"
+
+    assert fresh[0]["balance"] == "150"
+    assert sorted(calls) == ["GET", "GET", "PATCH"]
+    assert client.stats()["in_flight"] == 0
+    assert client._token_writes == {}
@@ -0,0 +1,137 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.core.exceptions import AppException
+from app.core.pagination import SyncWatermark, decode_watermark, encode_watermark
+from app.services.sync_service import SYNC_SETTLE_SECONDS, SyncService
+
+SERVER_TIME = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+WALLET_ID = "a1a1a1a1-0000-4111-8111-000000000001"
+TX_ID = "b2b2b2b2-0000-4111-8111-000000000002"
+
+
+def _wallet_change(updated_at: datetime) -> dict:
+    return {
+        "entity": "cash_wallets",
+        "id": WALLET_ID,
+        "updated_at": updated_at.isoformat(),
+        "deleted_at": None,
+        "data": {
+            "id": WALLET_ID,
+            "name": "Efectivo",
+            "balance": 120.5,
+            "currency": "USD",
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": updated_at.isoformat(),
+        },
+    }
+
+
+def _tx_tombstone(updated_at: datetime) -> dict:
+    return {
+        "entity": "transactions",
+        "id": TX_ID,
+        "updated_at": updated_at.isoformat(),
+        "deleted_at": updated_at.isoformat(),
+        "data": None,
+    }
+
+
+class SyncRestClient:
+    def __init__(self, changes: list[dict], error: AppException | None = None) -> None:
+        self.changes = changes
+        self.error = error
+        self.calls: list[tuple[SyncWatermark | None, int]] = []
+
+    async def fetch_sync_changes(
+        self,
+        *,
+        access_token: str,
+        since: SyncWatermark | None,
+        limit: int,
+    ) -> list[dict]:
+        self.calls.append((since, limit))
+        if self.error is not None:
+            raise self.error
+        return [{"server_time": SERVER_TIME.isoformat(), "changes": self.changes}]
+
+
+@pytest.mark.asyncio
+async def test_sync_groups_rows_and_tombstones_by_entity() -> None:
+    old = SERVER_TIME - timedelta(minutes=10)
+    service = SyncService(SyncRestClient([_wallet_change(old), _tx_tombstone(old + timedelta(seconds=1))]))
+
+    result = await service.get_changes(access_token="token", limit=10)
+
+    assert [wallet.id for wallet in result.cash_wallets] == [WALLET_ID]
+    assert result.transactions == []
+    assert [(item.entity, item.id) for item in result.deleted] == [("transactions", TX_ID)]
+    assert result.has_more is False
+    watermark = decode_watermark(result.watermark)
+    assert watermark == SyncWatermark(updated_at=old + timedelta(seconds=1), entity="transactions", id=TX_ID)
+
+
+@pytest.mark.asyncio
+async def test_sync_holds_watermark_behind_settle_window() -> None:
+    since = SyncWatermark(updated_at=SERVER_TIME - timedelta(minutes=1))
+    rest_client = SyncRestClient([_wallet_change(SERVER_TIME - timedelta(seconds=1))])
+    service = SyncService(rest_client)
+
+    result = await service.get_changes(access_token="token", since=since, limit=10)
+
+    assert rest_client.calls == [(since, 10)]
+    assert len(result.cash_wallets) == 1
+    assert decode_watermark(result.watermark) == SyncWatermark(
+        updated_at=SERVER_TIME - timedelta(seconds=SYNC_SETTLE_SECONDS),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_without_changes_never_moves_watermark_back() -> None:
+    since = SyncWatermark(updated_at=SERVER_TIME, entity="transactions", id=TX_ID)
+    service = SyncService(SyncRestClient([]))
+
+    result = await service.get_changes(access_token="token", since=since, limit=10)
+
+    assert result.cash_wallets == [] and result.deleted == []
+    assert result.watermark == encode_watermark(since)
+
+
+@pytest.mark.asyncio
+async def test_sync_full_page_advances_to_last_row() -> None:
+    fresh = SERVER_TIME - timedelta(seconds=1)
+    service = SyncService(SyncRestClient([_wallet_change(fresh), _tx_tombstone(fresh)]))
+
+    result = await service.get_changes(access_token="token", limit=1)
+
+    assert result.has_more is True
+    assert len(result.cash_wallets) == 1 and result.deleted == []
+    assert decode_watermark(result.watermark) == SyncWatermark(
+        updated_at=fresh,
+        entity="cash_wallets",
+        id=WALLET_ID,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_maps_missing_rpc_to_migration_error() -> None:
+    error = AppException(
+        status_code=404,
+        code="SUPABASE_REST_ERROR",
+        message="Could not find the function public.sync_changes",
+        details={"code": "PGRST202", "message": "Could not find the function public.sync_changes"},
+    )
+    service = SyncService(SyncRestClient([], error=error))
+
+    with pytest.raises(AppException) as exc_info:
+        await service.get_changes(access_token="token")
+
+    assert exc_info.value.code == "MIGRATIONS_NOT_APPLIED"
+
+
+def test_decode_watermark_rejects_garbage() -> None:
+    with pytest.raises(AppException) as exc_info:
+        decode_watermark("not-a-watermark")
+
+    assert exc_info.value.code == "INVALID_WATERMARK"
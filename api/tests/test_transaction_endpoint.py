@@ -1,12 +1,19 @@
+import csv
+import io
+import json
 from datetime import UTC, datetime
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.core.exceptions import AppException
+from app.core.pagination import decode_cursor
 from app.dependencies.auth import AuthContext, get_auth_context, get_transaction_service
 from app.main import create_app
 from app.schemas.transaction import (
+    TransactionBatchCreateRequest,
+    TransactionBatchCreateResponse,
+    TransactionBatchItemResult,
     TransactionCreateRequest,
     TransactionResponse,
     TransactionUpdateRequest,
@@ -42,6 +49,7 @@ def _build_transaction_response(
 class StubTransactionService:
     def __init__(self) -> None:
         self.list_calls: list[dict[str, object]] = []
+        self.list_rows: list[TransactionResponse] | None = None
         self.update_calls: list[dict[str, object]] = []
         self.delete_calls: list[dict[str, object]] = []
 
@@ -59,6 +67,7 @@ class StubTransactionService:
         credit_card_id: str | None = None,
         occurred_from: datetime | None = None,
         occurred_to: datetime | None = None,
+        cursor: str | None = None,
     ) -> list[TransactionResponse]:
         self.list_calls.append(
             {
@@ -73,10 +82,17 @@ class StubTransactionService:
                 "credit_card_id": credit_card_id,
                 "occurred_from": occurred_from,
                 "occurred_to": occurred_to,
+                "cursor": cursor,
             },
         )
+        if self.list_rows is not None:
+            return self.list_rows
         return [_build_transaction_response(tx_id="tx-list", kind=kind or "income")]
 
+    async def iter_transaction_pages(self, *, page_size: int, **_: object):
+        yield [_build_transaction_response(tx_id="tx-1"), _build_transaction_response(tx_id="tx-2")]
+        yield [_build_transaction_response(tx_id="tx-3", kind="expense", amount=7.5)]
+
     async def create_transaction(
         self,
         *,
@@ -91,6 +107,23 @@ class StubTransactionService:
             currency=request.currency,
         )
 
+    async def create_transactions(
+        self,
+        *,
+        access_token: str,
+        user_id: str,
+        request: TransactionBatchCreateRequest,
+    ) -> TransactionBatchCreateResponse:
+        results = [
+            TransactionBatchItemResult(
+                index=index,
+                status="created",
+                transaction=_build_transaction_response(tx_id=f"tx-batch-{index}"),
+            )
+            for index, _ in enumerate(request.items)
+        ]
+        return TransactionBatchCreateResponse(created=len(results), failed=0, results=results)
+
     async def update_transaction(
         self,
         *,
@@ -200,6 +233,106 @@ def test_list_transactions_accepts_filters(api_client: tuple[TestClient, StubTra
     assert call["occurred_to"] == datetime(2026, 1, 31, 23, 59, 59, tzinfo=UTC)
 
 
+def test_list_transactions_returns_next_cursor_for_full_page(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, service = api_client
+    service.list_rows = [
+        _build_transaction_response(tx_id="tx-a"),
+        _build_transaction_response(tx_id="tx-b"),
+    ]
+
+    response = client.get("/api/v1/transactions", params={"limit": 2})
+
+    assert response.status_code == 200
+    cursor = decode_cursor(response.headers["X-Next-Cursor"])
+    assert cursor.id == "tx-b"
+    assert cursor.occurred_at == datetime(2026, 1, 1, tzinfo=UTC)
+
+    next_page = client.get(
+        "/api/v1/transactions",
+        params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert next_page.status_code == 200
+    assert service.list_calls[-1]["cursor"] == response.headers["X-Next-Cursor"]
+
+
+def test_list_transactions_omits_cursor_for_last_page(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, _ = api_client
+
+    response = client.get("/api/v1/transactions", params={"limit": 10})
+
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_export_transactions_streams_ndjson(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, _ = api_client
+
+    response = client.get("/api/v1/transactions/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["tx-1", "tx-2", "tx-3"]
+
+
+def test_export_transactions_streams_csv_with_header(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, _ = api_client
+
+    response = client.get("/api/v1/transactions/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == ["tx-1", "tx-2", "tx-3"]
+    assert rows[2]["kind"] == "expense"
+    assert rows[2]["amount"] == "7.5"
+    assert rows[2]["bank_account_id"] == ""
+
+
+def test_create_transactions_batch_returns_per_item_results(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, _ = api_client
+    item = {
+        "kind": "income",
+        "amount": 10,
+        "cash_wallet_id": "11111111-1111-4111-8111-111111111111",
+    }
+
+    response = client.post("/api/v1/transactions/batch", json={"items": [item, item]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert [result["transaction"]["id"] for result in body["results"]] == [
+        "tx-batch-0",
+        "tx-batch-1",
+    ]
+
+
+def test_create_transactions_batch_validates_every_item(
+    api_client: tuple[TestClient, StubTransactionService],
+) -> None:
+    client, _ = api_client
+
+    response = client.post(
+        "/api/v1/transactions/batch",
+        json={"items": [{"kind": "income", "amount": 10}]},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["code"] == "VALIDATION_ERROR"
+
+
 def test_patch_transaction_forwards_request(api_client: tuple[TestClient, StubTransactionService]) -> None:
     client, service = api_client
 
@@ -1,15 +1,28 @@
-from datetime import datetime
+import json
+from datetime import UTC, datetime
 
 import pytest
 
+from app.core import deadline
 from app.core.exceptions import AppException
-from app.schemas.transaction import TransactionCreateRequest, TransactionUpdateRequest
+from app.core.pagination import TransactionCursor, encode_cursor
+from app.schemas.transaction import (
+    TransactionBatchCreateRequest,
+    TransactionCreateRequest,
+    TransactionUpdateRequest,
+)
 from app.services.transaction_service import TransactionService
 
 
 class DummyRestClient:
+    async def list_transactions_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_transactions(**kwargs)).encode()
+
     def __init__(self) -> None:
         self.last_payload: dict | None = None
+        self.last_after: TransactionCursor | None = None
+        self.last_offset: int | None = None
 
     async def list_transactions(
         self,
@@ -25,7 +38,10 @@ class DummyRestClient:
         credit_card_id: str | None = None,
         occurred_from: datetime | None = None,
         occurred_to: datetime | None = None,
+        after: TransactionCursor | None = None,
     ) -> list[dict]:
+        self.last_after = after
+        self.last_offset = offset
         return [
             {
                 "id": "tx-1",
@@ -92,6 +108,10 @@ class DummyRestClient:
 
 
 class MissingTableRestClient:
+    async def list_transactions_json(self, **kwargs: object) -> bytes:
+        # Services read list pages through the raw-bytes fast path.
+        return json.dumps(await self.list_transactions(**kwargs)).encode()
+
     async def list_transactions(self, **_: object) -> list[dict]:
         raise AppException(
             status_code=400,
@@ -174,3 +194,227 @@ async def test_list_transactions_raises_migrations_not_applied() -> None:
             offset=0,
         )
     assert exc.value.code == "MIGRATIONS_NOT_APPLIED"
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_decodes_cursor_for_keyset_page() -> None:
+    client = DummyRestClient()
+    service = TransactionService(client)
+    cursor = TransactionCursor(
+        occurred_at=datetime(2026, 1, 15, 10, 30, 0, 123456, tzinfo=UTC),
+        id="33333333-3333-4333-8333-333333333333",
+    )
+
+    await service.list_transactions(
+        access_token="token",
+        user_id="user-id",
+        limit=50,
+        cursor=encode_cursor(cursor),
+    )
+
+    assert client.last_after == cursor
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_rejects_tampered_cursor() -> None:
+    service = TransactionService(DummyRestClient())
+    with pytest.raises(AppException) as exc:
+        await service.list_transactions(
+            access_token="token",
+            user_id="user-id",
+            cursor="not-a-cursor",
+        )
+    assert exc.value.code == "INVALID_CURSOR"
+
+
+class PagedRestClient:
+    def __init__(self, total: int) -> None:
+        self.rows = [
+            {
+                "id": f"tx-{index:03d}",
+                "kind": "expense",
+                "amount": 10.0,
+                "currency": "USD",
+                "description": None,
+                "occurred_at": f"2026-01-01T00:00:{59 - index:02d}Z",
+                "cash_wallet_id": "wallet-1",
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:00Z",
+            }
+            for index in range(total)
+        ]
+        self.calls: list[TransactionCursor | None] = []
+
+    async def list_transactions(
+        self,
+        *,
+        limit: int,
+        after: TransactionCursor | None = None,
+        **_: object,
+    ) -> list[dict]:
+        self.calls.append(after)
+        start = 0
+        if after is not None:
+            start = next(i for i, row in enumerate(self.rows) if row["id"] == after.id) + 1
+        return self.rows[start : start + limit]
+
+
+@pytest.mark.asyncio
+async def test_iter_transaction_pages_walks_history_with_keyset() -> None:
+    client = PagedRestClient(total=5)
+    service = TransactionService(client)
+
+    pages = [
+        [tx.id for tx in page]
+        async for page in service.iter_transaction_pages(
+            access_token="token",
+            user_id="user-id",
+            page_size=2,
+        )
+    ]
+
+    assert pages == [["tx-000", "tx-001"], ["tx-002", "tx-003"], ["tx-004"]]
+    assert client.calls[0] is None
+    assert [cursor.id for cursor in client.calls[1:]] == ["tx-001", "tx-003"]
+
+
+class BatchRestClient(DummyRestClient):
+    def __init__(self, *, rejected_amounts: set[float] | None = None) -> None:
+        super().__init__()
+        self.rejected_amounts = rejected_amounts or set()
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def _reject(self, payload: dict) -> None:
+        if payload["amount"] in self.rejected_amounts:
+            raise AppException(
+                status_code=400,
+                code="SUPABASE_REST_ERROR",
+                message="INVALID_CASH_WALLET",
+            )
+
+    async def create_transactions(self, *, access_token: str, payloads: list[dict]) -> list[dict]:
+        self.batch_calls += 1
+        rows = []
+        for payload in payloads:
+            self._reject(payload)
+            rows.append(await super().create_transaction(access_token=access_token, payload=payload))
+        return rows
+
+    async def create_transaction(self, *, access_token: str, payload: dict) -> dict:
+        self.single_calls += 1
+        self._reject(payload)
+        return await super().create_transaction(access_token=access_token, payload=payload)
+
+
+def _batch_request(amounts: list[float], *, all_or_nothing: bool = False) -> TransactionBatchCreateRequest:
+    return TransactionBatchCreateRequest(
+        all_or_nothing=all_or_nothing,
+        items=[
+            TransactionCreateRequest(
+                kind="income",
+                amount=amount,
+                cash_wallet_id="11111111-1111-4111-8111-111111111111",
+            )
+            for amount in amounts
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_uses_single_array_insert() -> None:
+    client = BatchRestClient()
+    service = TransactionService(client)
+
+    result = await service.create_transactions(
+        access_token="token",
+        user_id="user-id",
+        request=_batch_request([10.0, 20.0, 30.0]),
+    )
+
+    assert client.batch_calls == 1
+    assert client.single_calls == 0
+    assert result.created == 3
+    assert [item.transaction.amount for item in result.results] == [10.0, 20.0, 30.0]
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_reports_per_item_failures() -> None:
+    client = BatchRestClient(rejected_amounts={20.0})
+    service = TransactionService(client)
+
+    result = await service.create_transactions(
+        access_token="token",
+        user_id="user-id",
+        request=_batch_request([10.0, 20.0, 30.0]),
+    )
+
+    assert result.created == 2
+    assert result.failed == 1
+    assert [item.status for item in result.results] == ["created", "failed", "created"]
+    assert result.results[1].error is not None
+    assert result.results[1].error.message == "INVALID_CASH_WALLET"
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_all_or_nothing_raises() -> None:
+    client = BatchRestClient(rejected_amounts={20.0})
+    service = TransactionService(client)
+
+    with pytest.raises(AppException):
+        await service.create_transactions(
+            access_token="token",
+            user_id="user-id",
+            request=_batch_request([10.0, 20.0], all_or_nothing=True),
+        )
+    assert client.single_calls == 0
+
+
+class FlakyBatchRestClient(BatchRestClient):
+    # Supabase goes away on the third single insert of the replay.
+    async def create_transaction(self, *, access_token: str, payload: dict) -> dict:
+        if self.single_calls == 2:
+            self.single_calls += 1
+            raise AppException(status_code=503, code="UPSTREAM_UNAVAILABLE", message="Unreachable.")
+        return await super().create_transaction(access_token=access_token, payload=payload)
+
+
+@pytest.mark.asyncio
+async def test_create_transactions_returns_partial_result_when_replay_hits_5xx() -> None:
+    client = FlakyBatchRestClient(rejected_amounts={20.0})
+    service = TransactionService(client)
+
+    result = await service.create_transactions(
+        access_token="token",
+        user_id="user-id",
+        request=_batch_request([10.0, 20.0, 30.0, 40.0]),
+    )
+
+    assert client.single_calls == 3
+    assert result.created == 1
+    assert result.failed == 3
+    assert [item.status for item in result.results] == ["created", "failed", "failed", "failed"]
+    assert [item.index for item in result.results] == [0, 1, 2, 3]
+    assert result.results[2].error.code == "UPSTREAM_UNAVAILABLE"
+    assert result.results[2].error.details == {"code": "UPSTREAM_UNAVAILABLE", "message": "Unreachable."}
+    assert result.results[3].error.code == "UPSTREAM_UNAVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_lifts_request_deadline_after_write() -> None:
+    service = TransactionService(DummyRestClient())
+    current, token = deadline.start(30)
+    try:
+        await service.create_transaction(
+            access_token="token",
+            user_id="user-id",
+            request=TransactionCreateRequest(
+                kind="income",
+                amount=10,
+                cash_wallet_id="11111111-1111-4111-8111-111111111111",
+            ),
+        )
+    finally:
+        deadline.reset(token)
+
+    assert current.remaining() is None